@@ -1,19 +1,43 @@
+import hashlib
 import json
 import os
 import sys
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import replace
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
+from core.account_executor import AccountExecutor
+from core.account_override_index import AccountOverrideIndex
+from core.account_source import AccountFileSource
 from core.balance_manager import BalanceManager
+from core.checkin_ledger import CheckinLedger
 from core.checkin_service import CheckinService
 from core.github_reporter import GitHubReporter
-from core.models import AccountResult, NotificationData, NotificationStats
+from core.models import (
+	AccountConfig,
+	AccountJob,
+	AccountOutcome,
+	AccountResult,
+	BalanceHashState,
+	NotificationData,
+	NotificationStats,
+	ShardFragment,
+	ShardSpec,
+)
 from core.privacy_handler import PrivacyHandler
-from notif import NotificationKit, NotifyTrigger, NotifyTriggerManager
+from core.run_journal import RunJournal
+from core.run_scheduler import RunScheduler
+from core.shard_store import ShardStore
+from notif import NotifyRuleMatcher, NotifyTrigger, NotifyTriggerManager
 from tools.logger import logger
 
+if TYPE_CHECKING:
+	from notif import NotificationKit
+
 
 class Application:
 	"""应用编排层，负责协调所有服务"""
@@ -24,15 +48,66 @@ class Application:
 	# 默认时间戳格式
 	DEFAULT_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-	def __init__(self):
-		"""初始化应用及所有服务"""
+	# 账号配置为空的标记（数组中的 null 也是一个账号条目，不能用 None 判断）
+	_NO_ACCOUNT = object()
+
+	def __init__(
+		self,
+		shard: ShardSpec | None = None,
+		shard_dir: Path | None = None,
+		workers: int = 1,
+		resume: bool = False,
+	):
+		"""
+		初始化应用及所有服务
+
+		Args:
+		    shard: 分片配置，None 表示处理全部账号
+		    shard_dir: 分片结果目录，默认为当前目录下的 shards
+		    workers: 工作进程数量，1 表示在当前进程中顺序执行
+		    resume: 是否从运行日志恢复上一次中断的运行
+		"""
+		self.shard = shard
+		self.workers = workers
+		self.resume = resume
+		self.shard_store = ShardStore(shard_dir or Path(CheckinService.Config.File.SHARD_DIR_NAME))
+
 		# 初始化各个功能模块
-		self.checkin_service = CheckinService()
+		# 隐私处理器只创建一次，签到服务、报告与账号加载共用同一个实例
 		self.privacy_handler = PrivacyHandler(PrivacyHandler.should_show_sensitive_info())
+		self.checkin_service = CheckinService(self.privacy_handler)
+		self.account_executor = AccountExecutor(self.checkin_service)
 		self.balance_manager = BalanceManager(Path(CheckinService.Config.File.BALANCE_HASH_NAME))
+		self.checkin_ledger = CheckinLedger(
+			ledger_file=Path(CheckinService.Config.File.CHECKIN_LEDGER_NAME),
+			reset_timezone=self._load_timezone(
+				env_key=CheckinService.Config.Env.CHECKIN_RESET_TZ,
+				default=self.DEFAULT_TIMEZONE,
+			),
+		)
+		# 分片运行时每个分片使用独立的运行日志
+		journal_file = Path(CheckinService.Config.File.RUN_JOURNAL_NAME)
+		if shard:
+			journal_file = journal_file.with_stem(f'{journal_file.stem}-{shard.label}')
+		self.run_journal = RunJournal(journal_file)
 		self.notify_trigger_manager = NotifyTriggerManager()
-		self.notification_kit = NotificationKit()
-		self.github_reporter = GitHubReporter(self.privacy_handler)
+		self._notification_kit: 'NotificationKit | None' = None
+		self.github_reporter = GitHubReporter(
+			privacy_handler=self.privacy_handler,
+			full_summary_file=Path(CheckinService.Config.File.SUMMARY_FULL_NAME),
+		)
+
+	@property
+	def notification_kit(self) -> 'NotificationKit':
+		"""通知编排器（首次发送通知时才创建，未发送通知时无需加载模板引擎与各平台发送器）"""
+		if self._notification_kit is None:
+			from notif import NotificationKit
+
+			self._notification_kit = NotificationKit(
+				retry_policy=self.checkin_service.notification_retry_policy,
+				rate_limiter=self.checkin_service.rate_limiter,
+			)
+		return self._notification_kit
 
 	async def run(self):
 		"""执行签到流程"""
@@ -55,123 +130,361 @@ class Application:
 
 		logger.info(f'找到 {len(accounts)} 个账号配置')
 
-		# 加载余额 hash 字典
-		last_balance_hash_dict = self.balance_manager.load_balance_hash()
+		# 加载上次保存的余额 hash 状态
+		last_balance_state = self.balance_manager.load_balance_hash()
+
+		# 读取运行配置
+		skip_checked_in = os.getenv(CheckinService.Config.Env.SKIP_CHECKED_IN, '').lower() == 'true'
+		refresh_skipped_balance = os.getenv(CheckinService.Config.Env.SKIPPED_BALANCE_REFRESH, '').lower() != 'false'
+		run_deadline = self._load_run_deadline()
+
+		# 加载签到台账（跳过今日已签到账号和调度排序都依赖台账中的历史记录）
+		# 通知规则使用连续失败次数时同样需要台账
+		use_ledger = skip_checked_in or run_deadline is not None or self.notify_trigger_manager.needs_failure_history
+		if use_ledger:
+			self.checkin_ledger.load()
+
+		# 确定账号处理顺序，并开始计算全局时间预算
+		account_keys = [self.balance_manager.generate_account_key(account.api_user) for account in accounts]
+		scheduler = RunScheduler(deadline=run_deadline, ledger=self.checkin_ledger)
+		scheduler.start()
+		processing_order = scheduler.order(account_keys) if run_deadline is not None else list(range(len(accounts)))
+
+		# 分片运行时只处理属于当前分片的账号，账号索引仍使用完整配置中的索引
+		if self.shard:
+			processing_order = [i for i in processing_order if self.shard.owns(accounts[i].api_user)]
+			logger.info(
+				f'当前为第 {self.shard.index}/{self.shard.count} 个分片，负责其中 {len(processing_order)} 个账号',
+				tag='分片',
+			)
 
 		# 为每个账号执行签到
 		success_count = 0
-		total_count = len(accounts)
-		account_results: list[AccountResult] = []  # 所有账号的结果
+		total_count = len(processing_order)
+		results_by_index: dict[int, AccountResult] = {}  # 所有账号的结果（按原始索引）
 		current_balance_hash_dict = {}  # 当前余额 hash 字典
-		current_balances = {}  # 当前余额数据（仅内存中使用，用于显示）
-		has_any_balance_changed = False  # 是否有任意账号余额变化
-		has_any_failed = False  # 是否有任意账号失败
+		carried_account_keys: list[str] = []  # 沿用上次余额 hash 的账号
+
+		# 构建账号任务（是否今日已签到由主进程根据台账判断）
+		jobs = [
+			AccountJob(
+				index=i,
+				account=accounts[i],
+				already_checked_in=skip_checked_in and self.checkin_ledger.is_checked_in_today(account_keys[i]),
+				refresh_balance=refresh_skipped_balance,
+			)
+			for i in processing_order
+		]
+
+		# 恢复模式下跳过同一自然日内已完成的账号，直接使用运行日志中的结果；否则从空日志开始
+		journal_window = self.checkin_ledger.current_day()
+		replayed_outcomes: list[AccountOutcome] = []
+		if self.resume:
+			journaled = self.run_journal.load(journal_window)
+			for job in jobs:
+				outcome = journaled.get(account_keys[job.index])
+				if outcome is not None:
+					replayed_outcomes.append(replace(outcome, index=job.index))
+			replayed_indexes = {outcome.index for outcome in replayed_outcomes}
+			jobs = [job for job in jobs if job.index not in replayed_indexes]
+			logger.info(f'从运行日志恢复 {len(replayed_outcomes)} 个已完成的账号', tag='恢复')
+		else:
+			self.run_journal.clear()
 
-		for i, account in enumerate(accounts):
-			api_user = account.get('api_user', '')
-			try:
-				success, user_info = await self.checkin_service.check_in_account(account, i)
-				# 日志使用脱敏名称，通知使用完整名称
-				safe_account_name = self.privacy_handler.get_safe_account_name(account, i)
-				full_account_name = self.privacy_handler.get_full_account_name(account, i)
+		# 配置了多个工作进程时交给进程池执行，否则在当前进程中逐个执行
+		if self.workers > 1 and len(jobs) > 1:
+			from core.worker_pool import WorkerPool
 
-				# 初始化结果变量
-				quota = None
-				used = None
-				balance_changed = None
-				error = None
+			executed = WorkerPool(self.workers).run(jobs, deadline=scheduler.remaining())
+		else:
+			executed = self._execute_sequentially(jobs, scheduler)
+
+		rule_matcher = self.notify_trigger_manager.create_rule_matcher()
+		async for outcome, is_replayed in self._chain_outcomes(replayed_outcomes, executed):
+			i = outcome.index
+			account_key = account_keys[i]
+
+			# 签到成功的账号立即写入运行日志，运行中途被终止时可以恢复
+			if outcome.status == 'success' and not is_replayed:
+				self.run_journal.append(journal_window, account_key, outcome)
 
+			# 日志使用脱敏名称，通知使用完整名称（均在加载账号时计算）
+			safe_account_name = accounts[i].safe_name
+			full_account_name = accounts[i].full_name
+
+			if outcome.status == 'skipped':
+				result = AccountResult(name=full_account_name, status='skipped', error=outcome.error)
+				results_by_index[i] = result
+				rule_matcher.observe(result, self.checkin_ledger.get_consecutive_failures(account_key))
+				continue
+
+			success = outcome.status == 'success'
+			if use_ledger and outcome.record_ledger:
 				if success:
-					success_count += 1
+					self.checkin_ledger.record_success(account_key)
 				else:
-					# 记录有失败账号
-					has_any_failed = True
-					logger.notify('失败，将发送通知', safe_account_name)
-
-				# 收集余额数据和处理结果
-				if user_info and user_info.get('success'):
-					current_quota = user_info['quota']
-					current_used = user_info['used_quota']
-
-					# 生成账号标识和余额 hash
-					account_key = self.balance_manager.generate_account_key(api_user)
-					current_balance_hash = self.balance_manager.generate_balance_hash(
-						quota=current_quota,
-						used=current_used,
-					)
-					current_balance_hash_dict[account_key] = current_balance_hash
-
-					# 保存余额数据（仅内存中，用于显示）
-					current_balances[account_key] = {
-						'quota': current_quota,
-						'used': current_used,
-					}
-
-					# 判断余额是否变化
-					if last_balance_hash_dict and account_key in last_balance_hash_dict:
-						# 有历史数据，对比 hash
-						last_hash = last_balance_hash_dict[account_key]
-						if current_balance_hash != last_hash:
-							# 余额发生变化
-							balance_changed = True
-							has_any_balance_changed = True
-							logger.notify('余额发生变化，将发送通知', safe_account_name)
-						else:
-							# 余额未变化
-							balance_changed = False
-					else:
-						# 首次运行，无历史数据
-						balance_changed = False
-
-					# 设置余额信息
-					quota = current_quota
-					used = current_used
-
-				elif user_info:
-					# 获取余额失败，无法判断变化
-					balance_changed = None
-					error = user_info.get('error', '未知错误')
-
-				# 一次性创建账号结果（通知使用完整名称）
-				account_result = AccountResult(
-					name=full_account_name,
-					status='success' if success else 'failed',
-					quota=quota,
-					used=used,
-					balance_changed=balance_changed,
-					error=error,
+					self.checkin_ledger.record_failure(account_key)
+
+			user_info = outcome.user_info
+			if outcome.already_checked_in and not (user_info and user_info.get('success')):
+				# 余额刷新失败不影响签到状态，沿用上次的余额 hash
+				user_info = None
+				carried_account_keys.append(account_key)
+
+			# 初始化结果变量
+			quota = None
+			used = None
+			balance_changed = None
+			error = outcome.error
+
+			if success:
+				success_count += 1
+			elif outcome.error is None:
+				# 执行异常已在执行时记录日志
+				logger.notify('失败，将发送通知', safe_account_name)
+
+			# 收集余额数据和处理结果
+			if user_info and user_info.get('success'):
+				current_quota = user_info['quota']
+				current_used = user_info['used_quota']
+
+				# 生成余额 hash
+				current_balance_hash = self.balance_manager.generate_balance_hash(
+					quota=current_quota,
+					used=current_used,
 				)
+				current_balance_hash_dict[account_key] = current_balance_hash
 
-				# 所有账号都添加到结果列表
-				account_results.append(account_result)
+				# 判断余额是否变化（状态文件中只保存摘要，通过二分查找对比）
+				last_changed = (
+					last_balance_state.is_changed(account_key, current_balance_hash) if last_balance_state else None
+				)
+				if last_changed:
+					# 余额发生变化
+					balance_changed = True
+					logger.notify('余额发生变化，将发送通知', safe_account_name)
+				else:
+					# 余额未变化，或首次运行无历史数据
+					balance_changed = False
 
-			except Exception as e:
-				# 日志使用脱敏名称，通知使用完整名称
-				safe_account_name = self.privacy_handler.get_safe_account_name(account, i)
-				full_account_name = self.privacy_handler.get_full_account_name(account, i)
-				logger.error(
-					message=f'处理异常：{e}',
-					account_name=safe_account_name,
-					exc_info=True,
+				# 设置余额信息
+				quota = current_quota
+				used = current_used
+
+			elif user_info:
+				# 获取余额失败，无法判断变化
+				balance_changed = None
+				error = user_info.get('error', '未知错误')
+
+			# 一次性创建账号结果（通知使用完整名称）
+			result = AccountResult(
+				name=full_account_name,
+				status='success' if success else 'failed',
+				quota=quota,
+				used=used,
+				balance_changed=balance_changed,
+				error=error,
+				already_checked_in=outcome.already_checked_in,
+				retry_count=outcome.retry_count,
+			)
+			results_by_index[i] = result
+
+			# 通知规则在处理每个账号时评估，结束后不需要再次遍历结果
+			rule_matcher.observe(result, self.checkin_ledger.get_consecutive_failures(account_key))
+
+		# 结果按账号配置顺序排列，与处理顺序无关
+		account_results = [results_by_index[i] for i in sorted(results_by_index)]
+		is_first_run = last_balance_state is None
+
+		# 分片运行时只写入分片结果，由 merge 子命令统一保存余额状态、发送通知并生成 Summary
+		if self.shard:
+			self.shard_store.write(
+				ShardFragment(
+					shard=self.shard,
+					total_accounts=len(accounts),
+					is_first_run=is_first_run,
+					results=results_by_index,
+					balance_state=self.balance_manager.build_balance_state(
+						balance_hash_dict=current_balance_hash_dict,
+						previous_state=last_balance_state,
+						carry_over_keys=carried_account_keys,
+					),
+					ledger_entries=(
+						self.checkin_ledger.export([account_keys[i] for i in processing_order]) if use_ledger else {}
+					),
 				)
-				has_any_failed = True  # 异常也算失败
-
-				# 创建失败的账号结果（通知使用完整名称）
-				account_result = AccountResult(
-					name=full_account_name,
-					status='failed',
-					balance_changed=None,
-					error=f'异常: {str(e)[:50]}...',
+			)
+			logger.info(
+				message=f'分片结果：成功 {success_count}/{total_count}，失败 {total_count - success_count}/{total_count}',
+				tag='结果',
+			)
+			self.run_journal.clear()
+			sys.exit(0 if success_count > 0 or total_count == 0 else 1)
+
+		# 保存当前余额 hash 字典
+		if current_balance_hash_dict or carried_account_keys:
+			self.balance_manager.save_balance_hash(
+				balance_hash_dict=current_balance_hash_dict,
+				previous_state=last_balance_state,
+				carry_over_keys=carried_account_keys,
+			)
+
+		# 保存签到台账
+		if use_ledger:
+			self.checkin_ledger.save()
+
+		# 状态已全部保存，运行日志不再需要
+		self.run_journal.clear()
+
+		await self._report(
+			accounts=accounts,
+			account_results=account_results,
+			is_first_run=is_first_run,
+			rule_matcher=rule_matcher,
+		)
+
+	async def _execute_sequentially(
+		self,
+		jobs: list[AccountJob],
+		scheduler: RunScheduler,
+	) -> AsyncIterator[AccountOutcome]:
+		"""
+		在当前进程中按顺序逐个执行账号任务
+
+		Args:
+		    jobs: 按处理顺序排列的账号任务
+		    scheduler: 运行调度器（用于分配每个账号的时间预算）
+
+		Yields:
+		    AccountOutcome: 账号执行结果
+		"""
+		for position, job in enumerate(jobs):
+			budget = scheduler.next_budget(pending_count=len(jobs) - position)
+			yield await self.account_executor.execute(job, budget)
+
+	@staticmethod
+	async def _chain_outcomes(
+		replayed: list[AccountOutcome],
+		executed: AsyncIterator[AccountOutcome],
+	) -> AsyncIterator[tuple[AccountOutcome, bool]]:
+		"""
+		先返回从运行日志恢复的结果，再返回本次执行的结果
+
+		Args:
+		    replayed: 从运行日志恢复的结果
+		    executed: 本次执行的结果
+
+		Yields:
+		    tuple[AccountOutcome, bool]: (执行结果, 是否为恢复的结果)
+		"""
+		for outcome in replayed:
+			yield outcome, True
+		async for outcome in executed:
+			yield outcome, False
+
+	async def merge(self):
+		"""合并各分片的结果，统一保存余额状态与签到台账，并发送一次通知、生成一份 Step Summary"""
+		logger.info(
+			message=f'开始合并 {self.shard_store.shard_dir} 中的分片结果',
+			tag='分片',
+			show_timestamp=True,
+		)
+
+		# 账号名称不保存在分片结果中，需要根据账号配置重新生成
+		accounts = self._load_accounts()
+		if not accounts:
+			sys.exit(0)
+
+		fragments = self.shard_store.load()
+		if not fragments:
+			logger.error('未找到任何分片结果', tag='分片')
+			sys.exit(1)
+
+		shard_count = fragments[0].shard.count
+		for fragment in fragments:
+			if fragment.shard.count != shard_count or fragment.total_accounts != len(accounts):
+				logger.warning(
+					f'分片 {fragment.shard.index}/{fragment.shard.count} 的账号配置与当前不一致，结果可能不完整',
+					tag='分片',
 				)
-				account_results.append(account_result)
+
+		# 合并账号结果与余额状态
+		last_balance_state = self.balance_manager.load_balance_hash()
+		results_by_index: dict[int, AccountResult] = {}
+		balance_records: dict[bytes, bytes] = {}
+		ledger_entries: dict[str, dict] = {}
+		for fragment in fragments:
+			results_by_index.update(fragment.results)
+			if fragment.balance_state is not None:
+				balance_records.update(fragment.balance_state.records())
+			ledger_entries.update(fragment.ledger_entries)
+
+		# 分片运行时启用了签到台账才需要合并（先合并台账，通知规则需要其中的连续失败次数）
+		if ledger_entries:
+			self.checkin_ledger.load()
+			self.checkin_ledger.update_entries(ledger_entries)
+			self.checkin_ledger.save()
+
+		account_results: list[AccountResult] = []
+		rule_matcher = self.notify_trigger_manager.create_rule_matcher()
+		for i, account in enumerate(accounts):
+			account_key = self.balance_manager.generate_account_key(account.api_user)
+			result = results_by_index.get(i)
+			if result is None:
+				# 分片结果缺失（如分片任务被取消），沿用上次的余额记录
+				result = AccountResult(name='', status='failed', error='分片结果缺失，未获取到签到结果')
+				last_digest = last_balance_state.get(account_key) if last_balance_state else None
+				if last_digest is not None:
+					balance_records.setdefault(BalanceHashState.digest(account_key), last_digest)
+
+			result = replace(result, name=account.full_name)
+			account_results.append(result)
+			rule_matcher.observe(result, self.checkin_ledger.get_consecutive_failures(account_key))
+
+		missing_count = sum(1 for i in range(len(accounts)) if i not in results_by_index)
+		logger.info(
+			f'已合并 {len(fragments)}/{shard_count} 个分片的结果，{missing_count} 个账号缺少结果',
+			tag='分片',
+		)
+
+		self.balance_manager.save_balance_state(BalanceHashState.from_records(balance_records))
+
+		await self._report(
+			accounts=accounts,
+			account_results=account_results,
+			is_first_run=any(fragment.is_first_run for fragment in fragments),
+			rule_matcher=rule_matcher,
+		)
+
+	async def _report(
+		self,
+		accounts: list[AccountConfig],
+		account_results: list[AccountResult],
+		is_first_run: bool,
+		rule_matcher: NotifyRuleMatcher,
+	):
+		"""
+		发送通知、生成 Step Summary 并设置退出码
+
+		Args:
+		    accounts: 账号配置列表（与 account_results 一一对应）
+		    account_results: 账号结果列表（使用完整名称）
+		    is_first_run: 是否没有余额历史
+		    rule_matcher: 已评估全部账号的通知规则匹配器
+		"""
+		success_count = sum(1 for result in account_results if result.status == 'success')
+		total_count = len(account_results)
+		skipped_count = sum(1 for result in account_results if result.status == 'skipped')
+		has_any_failed = success_count < total_count
+		has_any_balance_changed = any(result.balance_changed is True for result in account_results)
 
 		# 判断是否需要发送通知
-		is_first_run = last_balance_hash_dict is None
 		need_notify = self.notify_trigger_manager.should_notify(
 			has_success=success_count > 0,
 			has_failed=has_any_failed,
 			has_balance_changed=has_any_balance_changed,
 			is_first_run=is_first_run,
+			rule_matcher=rule_matcher,
 		)
 
 		# 记录通知决策的原因
@@ -184,6 +497,7 @@ class Application:
 					has_failed=has_any_failed,
 					has_balance_changed=has_any_balance_changed,
 					is_first_run=is_first_run,
+					rule_matcher=rule_matcher,
 				)
 
 				if reasons:
@@ -196,19 +510,9 @@ class Application:
 			else:
 				logger.info('未满足通知触发条件，跳过通知')
 
-		# 保存当前余额 hash 字典
-		if current_balance_hash_dict:
-			self.balance_manager.save_balance_hash(current_balance_hash_dict)
-
 		if need_notify and account_results:
-			# 获取时区配置（处理空字符串的情况）
-			timezone_name = os.getenv('TZ') or self.DEFAULT_TIMEZONE
-			try:
-				timezone = ZoneInfo(timezone_name)
-			except Exception:
-				# 如果时区无效，使用默认时区
-				logger.warning(f'时区 {timezone_name} 无效，使用默认时区 {self.DEFAULT_TIMEZONE}')
-				timezone = ZoneInfo(self.DEFAULT_TIMEZONE)
+			# 获取时区配置
+			timezone = self._load_timezone(env_key='TZ', default=self.DEFAULT_TIMEZONE)
 
 			# 获取时间戳格式配置（处理空字符串的情况）
 			timestamp_format = os.getenv('TIMESTAMP_FORMAT') or self.DEFAULT_TIMESTAMP_FORMAT
@@ -223,6 +527,7 @@ class Application:
 				success_count=success_count,
 				failed_count=total_count - success_count,
 				total_count=total_count,
+				skipped_count=skipped_count,
 			)
 
 			notification_data = NotificationData(
@@ -244,134 +549,156 @@ class Application:
 			tag='结果',
 		)
 
-		# 生成 GitHub Actions Step Summary
-		# 为 summary 创建使用脱敏名称的结果列表
-		summary_results: list[AccountResult] = []
-		for i, result in enumerate(account_results):
-			safe_name = self.privacy_handler.get_safe_account_name(accounts[i], i)
-			summary_results.append(
-				AccountResult(
-					name=safe_name,
-					status=result.status,
-					quota=result.quota,
-					used=result.used,
-					error=result.error,
-				)
-			)
-
+		# 生成 GitHub Actions Step Summary（使用脱敏名称）
 		self.github_reporter.generate_summary(
 			success_count=success_count,
 			total_count=total_count,
-			account_results=summary_results,
+			account_results=account_results,
+			account_names=[account.safe_name for account in accounts],
 		)
 
 		# 设置退出码
 		sys.exit(0 if success_count > 0 else 1)
 
-	def _load_accounts(self) -> list[dict[str, Any]]:
+	@staticmethod
+	def _load_run_deadline() -> float | None:
+		"""
+		从环境变量加载全局时间预算
+
+		Returns:
+		    float | None: 时间预算（秒），未配置或配置无效时返回 None
+		"""
+		deadline_value = os.getenv(CheckinService.Config.Env.RUN_DEADLINE, '').strip()
+		if not deadline_value:
+			return None
+
+		try:
+			deadline = float(deadline_value)
+		except ValueError:
+			logger.warning(f'{CheckinService.Config.Env.RUN_DEADLINE} 配置无效：{deadline_value}，将不限制运行时间')
+			return None
+
+		if deadline <= 0:
+			logger.warning(f'{CheckinService.Config.Env.RUN_DEADLINE} 必须大于 0，将不限制运行时间')
+			return None
+
+		return deadline
+
+	@staticmethod
+	def _load_timezone(env_key: str, default: str) -> ZoneInfo:
+		"""
+		从环境变量加载时区配置（处理空字符串和无效时区的情况）
+
+		Args:
+		    env_key: 环境变量名
+		    default: 默认时区
+
+		Returns:
+		    ZoneInfo: 时区对象
+		"""
+		timezone_name = os.getenv(env_key) or default
+		try:
+			return ZoneInfo(timezone_name)
+		except Exception:
+			# 如果时区无效，使用默认时区
+			logger.warning(f'时区 {timezone_name} 无效，使用默认时区 {default}')
+			return ZoneInfo(default)
+
+	def _load_accounts(self) -> list[AccountConfig]:
 		"""
-		从环境变量加载多账号配置
+		加载多账号配置
 
-		支持两种配置方式：
+		支持三种配置方式：
 		1. ANYROUTER_ACCOUNTS: JSON 数组格式，包含多个账号
-		2. ANYROUTER_ACCOUNT_*: 多个环境变量，每个包含单个账号的 JSON 对象
+		2. ANYROUTER_ACCOUNTS_FILE: JSON Lines 格式的账号文件（可使用 gzip 压缩），每行一个账号
+		3. ANYROUTER_ACCOUNT_*: 多个环境变量，每个包含单个账号的 JSON 对象
 
-		两种方式可以同时使用：
-		- 如果 ANYROUTER_ACCOUNTS 中的账号有 name 字段，会查找对应的 ANYROUTER_ACCOUNT_{name}
+		三种方式可以同时使用：
+		- ANYROUTER_ACCOUNTS 与账号文件中的账号会查找匹配的 ANYROUTER_ACCOUNT_*，
 		  并用其中的字段覆盖原有配置
 		- 未被匹配的 ANYROUTER_ACCOUNT_* 会作为新账号添加
 		- 最后会去重和验证，无效的账号会被忽略
-		"""
-		# 1. 读取两个来源的配置
-		accounts_from_array = self._load_accounts_from_array()
-		prefix_configs = self._load_accounts_from_prefix()
-
-		# 2. 覆盖阶段：用 ANYROUTER_ACCOUNT_{name} 覆盖 ANYROUTER_ACCOUNTS 中的配置
-		accounts = self._apply_prefix_overrides(accounts_from_array, prefix_configs)
 
-		# 3. 合并阶段：将未被匹配的 prefix_configs 作为新账号添加
-		for config in prefix_configs.values():
-			accounts.append(config)
+		各阶段均为生成器，账号文件逐行解析后直接经过覆盖、去重与验证，只有最终的有效账号会保存在内存中。
+		"""
+		# 1. 读取配置：ANYROUTER_ACCOUNT_* 需要全部读取用于匹配，数组与文件中的账号按顺序逐个读取
+		override_index = AccountOverrideIndex(self._load_accounts_from_prefix())
+		loaded_accounts = chain(self._load_accounts_from_array(), self._load_accounts_from_file())
+
+		# 2. 覆盖阶段：用 ANYROUTER_ACCOUNT_* 覆盖数组与文件中的对应账号
+		# 3. 合并阶段：将未被匹配的 ANYROUTER_ACCOUNT_* 作为新账号添加
+		#    chain 在覆盖阶段结束后才开始读取剩余配置，此时匹配成功的配置已被移除
+		merged_accounts = chain(
+			self._apply_prefix_overrides(loaded_accounts, override_index),
+			override_index.remaining(),
+		)
 
 		# 未找到任何账号配置
-		if not accounts:
+		first_account = next(merged_accounts, self._NO_ACCOUNT)
+		if first_account is self._NO_ACCOUNT:
 			self._print_account_config_guide()
 			return []
 
-		# 4. 去重
-		accounts = self._deduplicate_accounts(accounts)
-
-		# 5. 验证并过滤无效账号
-		accounts = self._filter_valid_accounts(accounts)
-
-		return accounts
+		# 4. 去重，5. 验证并过滤无效账号
+		unique_accounts = self._deduplicate_accounts(chain([first_account], merged_accounts))
+		return list(self._filter_valid_accounts(unique_accounts))
 
 	def _apply_prefix_overrides(
 		self,
-		accounts: list[dict[str, Any]],
-		prefix_configs: dict[str, dict[str, Any]],
-	) -> list[dict[str, Any]]:
+		accounts: Iterable[dict[str, Any]],
+		override_index: AccountOverrideIndex,
+	) -> Iterator[dict[str, Any]]:
 		"""
-		用 ANYROUTER_ACCOUNT_* 的配置覆盖 ANYROUTER_ACCOUNTS 中的对应账号
+		用 ANYROUTER_ACCOUNT_* 的配置覆盖 ANYROUTER_ACCOUNTS 与账号文件中的对应账号
 
-		匹配规则：检查环境变量后缀是否包含账号的 api_user 值
+		匹配规则：优先按 api_user 精确匹配环境变量后缀中以 _ 分隔的某一段，没有时回退为后缀包含 api_user 值，
+		详见 AccountOverrideIndex
 
 		Args:
-		    accounts: 从 ANYROUTER_ACCOUNTS 加载的账号列表
-		    prefix_configs: 从 ANYROUTER_ACCOUNT_* 加载的配置字典，匹配成功的会被移除
+		    accounts: 从 ANYROUTER_ACCOUNTS 与账号文件加载的账号
+		    override_index: ANYROUTER_ACCOUNT_* 覆盖配置的索引，匹配成功的会被移除
 
-		Returns:
-		    list[dict[str, Any]]: 覆盖后的账号列表
+		Yields:
+		    dict[str, Any]: 覆盖后的账号
 		"""
-		result: list[dict[str, Any]] = []
-
 		for account_index, account in enumerate(accounts):
 			api_user = account.get('api_user')
 			if not api_user:
 				# 没有 api_user 字段，无法匹配，直接添加
-				result.append(account)
+				yield account
 				continue
 
-			# 查找后缀包含 api_user 的配置
-			matched_key = None
-			for suffix in prefix_configs:
-				if api_user in suffix:
-					matched_key = suffix
-					break
-
-			if matched_key:
-				# 找到匹配，用 prefix 配置覆盖原有字段
-				override_config = prefix_configs.pop(matched_key)
-				merged_account = {**account, **override_config}
-				result.append(merged_account)
-				# 覆盖日志仍需保留“哪个配置覆盖了哪个账号”的语义，
-				# 但 GitHub Actions 公共日志中不能直接暴露真实账号名和环境变量后缀。
-				safe_account_name = self.privacy_handler.get_safe_account_name(
-					account_info=account,
-					account_index=account_index,
-				)
-				safe_env_name = self.privacy_handler.get_safe_account_env_name(
-					f'{CheckinService.Config.Env.ACCOUNT_PREFIX}{matched_key}'
-				)
-				logger.info(f'已使用 {safe_env_name} 覆盖账号 "{safe_account_name}" 的配置')
-			else:
+			matched = override_index.pop(api_user)
+			if matched is None:
 				# 没有匹配，保持原样
-				result.append(account)
+				yield account
+				continue
 
-		return result
+			# 找到匹配，用 prefix 配置覆盖原有字段
+			matched_key, override_config = matched
+			# 覆盖日志仍需保留“哪个配置覆盖了哪个账号”的语义，
+			# 但 GitHub Actions 公共日志中不能直接暴露真实账号名和环境变量后缀。
+			safe_account_name = self.privacy_handler.get_safe_account_name(
+				account_info=account,
+				account_index=account_index,
+			)
+			safe_env_name = self.privacy_handler.get_safe_account_env_name(
+				f'{CheckinService.Config.Env.ACCOUNT_PREFIX}{matched_key}'
+			)
+			logger.info(f'已使用 {safe_env_name} 覆盖账号 "{safe_account_name}" 的配置')
+			yield {**account, **override_config}
 
-	def _filter_valid_accounts(self, accounts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+	def _filter_valid_accounts(self, accounts: Iterable[dict[str, Any]]) -> Iterator[AccountConfig]:
 		"""
 		过滤无效账号，只保留有效的账号
 
 		Args:
-		    accounts: 账号列表
+		    accounts: 账号
 
-		Returns:
-		    list[dict[str, Any]]: 有效的账号列表
+		Yields:
+		    AccountConfig: 有效的账号（只保留必需字段的不可变记录，账号名称按有效账号的索引计算一次）
 		"""
-		valid_accounts: list[dict[str, Any]] = []
-
+		valid_count = 0
 		for i, account in enumerate(accounts):
 			# 账号不是字典格式
 			if not isinstance(account, dict):
@@ -393,9 +720,13 @@ class Application:
 				logger.error(f'账号 {i + 1} 的名称字段不能为空，已忽略')
 				continue
 
-			valid_accounts.append(account)
-
-		return valid_accounts
+			full_name = self.privacy_handler.get_full_account_name(account, valid_count)
+			valid_count += 1
+			yield AccountConfig.from_dict(
+				account,
+				full_name=full_name,
+				safe_name=self.privacy_handler.mask_account_name(full_name),
+			)
 
 	def _load_accounts_from_array(self) -> list[dict[str, Any]]:
 		"""从 ANYROUTER_ACCOUNTS 环境变量加载账号列表"""
@@ -425,6 +756,19 @@ class Application:
 
 		return accounts_data
 
+	def _load_accounts_from_file(self) -> Iterable[dict[str, Any]]:
+		"""从 ANYROUTER_ACCOUNTS_FILE 指定的 JSON Lines 文件逐行加载账号"""
+		accounts_file = os.getenv(CheckinService.Config.Env.ACCOUNTS_FILE)
+		if not accounts_file:
+			return []
+
+		path = Path(accounts_file)
+		if not path.is_file():
+			logger.error(f'{CheckinService.Config.Env.ACCOUNTS_FILE} 指定的账号文件不存在：{path}')
+			return []
+
+		return AccountFileSource(path)
+
 	def _load_accounts_from_prefix(self) -> dict[str, dict[str, Any]]:
 		"""
 		从 ANYROUTER_ACCOUNT_* 环境变量加载单个账号
@@ -473,46 +817,60 @@ class Application:
 
 		return accounts
 
-	def _deduplicate_accounts(self, accounts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+	def _deduplicate_accounts(self, accounts: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
 		"""
-		对账号列表进行去重
+		对账号进行去重
 
-		去重条件：name + cookies + api_user 完全一致
+		去重条件：name + cookies + api_user 完全一致（cookies 的字符串与字典格式等价）。
+		只保存每个账号的定长摘要，不保存完整的 cookies。
 		"""
-		seen: set[str] = set()
-		unique_accounts: list[dict[str, Any]] = []
+		seen: dict[bytes, int] = {}  # 账号摘要 -> 首次出现的位置
+		removed_count = 0
 
-		for account in accounts:
+		for i, account in enumerate(accounts):
 			# 生成唯一标识
 			key = self._generate_account_key(account)
-			if key in seen:
+			first_index = seen.get(key)
+			if first_index is not None:
+				removed_count += 1
+				safe_account_name = self.privacy_handler.get_safe_account_name(account, i)
+				logger.info(f'"{safe_account_name}" 与第 {first_index + 1} 个账号的配置完全一致，已合并')
 				continue
 
-			seen.add(key)
-			unique_accounts.append(account)
+			seen[key] = i
+			yield account
 
 		# 记录去重结果
-		removed_count = len(accounts) - len(unique_accounts)
 		if removed_count > 0:
 			logger.info(f'去重后移除了 {removed_count} 个重复账号')
 
-		return unique_accounts
-
-	def _generate_account_key(self, account: dict[str, Any]) -> str:
+	@staticmethod
+	def _generate_account_key(account: dict[str, Any]) -> bytes:
 		"""
 		生成账号的唯一标识
 
-		基于 name + cookies + api_user 生成
+		基于 name + cookies + api_user 计算 16 字节摘要，cookies 按规范形式（按名称排序的 name=value 列表）参与计算，
+		不需要序列化或保存完整的 cookies。name 与 api_user 连同类型名一起参与计算，
+		避免 api_user 为 123 与 '123' 的两个账号被合并
 		"""
-		name = account.get('name', '')
-		cookies = account.get('cookies', '')
-		api_user = account.get('api_user', '')
+		digest = hashlib.blake2b(digest_size=16)
+		for value in (account.get('name', ''), account.get('api_user', '')):
+			digest.update(f'{type(value).__name__}:{value}'.encode('utf-8'))
+			digest.update(b'\0')
 
-		# cookies 可能是字典，需要序列化为字符串
+		cookies = account.get('cookies', '')
 		if isinstance(cookies, dict):
-			cookies = json.dumps(cookies, sort_keys=True)
+			pairs = [f'{name}={value}' for name, value in cookies.items()]
+		elif isinstance(cookies, str):
+			pairs = [pair.strip() for pair in cookies.split(';') if pair.strip()]
+		else:
+			pairs = [repr(cookies)]
+
+		for pair in sorted(pairs):
+			digest.update(pair.encode('utf-8'))
+			digest.update(b'\0')
 
-		return f'{name}|{cookies}|{api_user}'
+		return digest.digest()
 
 	def _print_account_config_guide(self):
 		"""打印账号配置指南"""
@@ -546,6 +904,7 @@ class Application:
 			'',
 			'💡 提示：',
 			'- 两种方式可以同时使用，账号会自动合并',
+			f'- 账号较多时可通过 {CheckinService.Config.Env.ACCOUNTS_FILE} 指定 JSON Lines 账号文件（每行一个账号）',
 			'- name 字段为账号显示名称（可选）',
 			'- cookies 为登录后的 cookie 字符串',
 			'- api_user 为 API 用户标识',
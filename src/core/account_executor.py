@@ -0,0 +1,131 @@
+import asyncio
+from dataclasses import replace
+
+from core.checkin_service import CheckinService
+from core.circuit_breaker import CircuitOpenError
+from core.models import AccountJob, AccountOutcome
+from tools.logger import logger
+from tools.retry import retry_scope
+
+
+class AccountExecutor:
+	"""
+	单个账号的执行器
+
+	只负责访问站点（WAF、签到、查询余额）并返回执行结果，不读写任何状态文件，
+	因此既可以在主进程中顺序执行，也可以在工作进程中执行后把结果传回主进程。
+	"""
+
+	def __init__(self, checkin_service: CheckinService):
+		"""
+		初始化账号执行器
+
+		Args:
+			checkin_service: 签到服务（包含浏览器、HTTP 客户端配置、熔断器与重试策略）
+		"""
+		self.checkin_service = checkin_service
+
+	async def execute(self, job: AccountJob, budget: float | None) -> AccountOutcome:
+		"""
+		执行单个账号的签到（或今日已签到时的余额刷新）
+
+		Args:
+			job: 账号任务
+			budget: 分配给该账号的时间预算（秒），None 表示不限制，0 表示剩余时间不足
+
+		Returns:
+			AccountOutcome: 执行结果
+		"""
+		# 剩余时间不足时标记为跳过，而不是被 Runner 强制终止
+		if budget == 0:
+			logger.warning('剩余运行时间不足，跳过该账号', job.account.safe_name)
+			return AccountOutcome(
+				index=job.index,
+				status='skipped',
+				error='超出运行时间预算，未执行签到',
+				record_ledger=False,
+			)
+
+		# 该账号的日志按分组收集，处理结束后连续写出，不会与其他账号的日志穿插；
+		# 同时统计处理过程中的重试次数（包括 WAF、余额和签到请求）
+		with logger.group(job.account.safe_name), retry_scope() as account_retries:
+			outcome = await self._execute(job, budget)
+
+		return replace(outcome, retry_count=account_retries.count)
+
+	async def _execute(self, job: AccountJob, budget: float | None) -> AccountOutcome:
+		"""
+		执行单个账号的签到，并把异常转换为失败结果
+
+		Args:
+			job: 账号任务
+			budget: 分配给该账号的时间预算（秒），None 表示不限制
+
+		Returns:
+			AccountOutcome: 执行结果
+		"""
+		try:
+			if job.already_checked_in:
+				# 服务端每天只能签到一次，今日已签到的账号跳过 WAF 与签到步骤
+				logger.info('今日已签到，跳过 WAF 与签到步骤', job.account.safe_name)
+				user_info = None
+				if job.refresh_balance:
+					user_info = await asyncio.wait_for(
+						self.checkin_service.refresh_balance(job.account, job.index),
+						timeout=budget,
+					)
+
+				return AccountOutcome(
+					index=job.index,
+					status='success',
+					user_info=user_info,
+					already_checked_in=True,
+					record_ledger=False,
+				)
+
+			success, user_info = await asyncio.wait_for(
+				self.checkin_service.check_in_account(job.account, job.index),
+				timeout=budget,
+			)
+			return AccountOutcome(
+				index=job.index,
+				status='success' if success else 'failed',
+				user_info=user_info,
+			)
+
+		except CircuitOpenError as e:
+			# 熔断期间不访问站点，也不计入账号自身的失败历史
+			logger.warning(str(e), job.account.safe_name)
+			return AccountOutcome(index=job.index, status='failed', error=str(e), record_ledger=False)
+
+		except TimeoutError:
+			# 超出分配给该账号的时间预算（未设置全局预算时，来自签到过程中的其他超时）
+			message = f'处理超时（时间预算 {budget:.0f} 秒）' if budget is not None else '处理超时'
+			logger.error(message, job.account.safe_name)
+			return AccountOutcome(index=job.index, status='failed', error=message)
+
+		except Exception as e:
+			logger.error(
+				message=f'处理异常：{e}',
+				account_name=job.account.safe_name,
+				exc_info=True,
+			)
+			return AccountOutcome(
+				index=job.index,
+				status='failed',
+				error=f'异常: {str(e)[:50]}...',
+				record_ledger=False,
+			)
+
+
+def create_account_executor(worker_count: int = 1) -> AccountExecutor:
+	"""
+	创建使用默认配置的账号执行器（工作进程中使用）
+
+	Args:
+		worker_count: 并行的工作进程数量，限流速率与重试预算按该数量平分
+
+	Returns:
+		AccountExecutor: 账号执行器
+	"""
+	return AccountExecutor(CheckinService(worker_count=worker_count))
@@ -0,0 +1,85 @@
+from bisect import bisect_left
+from collections.abc import Iterator
+from typing import Any
+
+
+class AccountOverrideIndex:
+	"""
+	ANYROUTER_ACCOUNT_* 覆盖配置的索引
+
+	构建时按 _ 拆分每个环境变量后缀（大写），以各段与完整后缀为键建立索引，
+	查找时优先按 api_user 精确匹配某一段（如 12427 匹配 12427_ALICE），多个候选时选择最短的后缀，
+	避免 api_user 互为子串（如 124 与 12427）时取决于环境变量的顺序。
+	没有精确匹配时才回退为子串匹配（兼容 USER12427 这类写法），同样按最短、字典序最小的后缀选择。
+	子串匹配通过排序后的后缀尾部二分查找，没有覆盖配置的账号不需要遍历全部后缀。
+	"""
+
+	def __init__(self, prefix_configs: dict[str, dict[str, Any]]):
+		"""
+		构建覆盖配置索引
+
+		Args:
+			prefix_configs: 后缀(大写) -> 账号配置 的字典
+		"""
+		self._configs = dict(prefix_configs)
+
+		# 回退匹配与精确匹配的候选都按（长度, 后缀）排序，保证结果与环境变量顺序无关
+		self._ordered_suffixes = sorted(self._configs, key=lambda suffix: (len(suffix), suffix))
+		self._tokens: dict[str, list[str]] = {}
+		for suffix in self._ordered_suffixes:
+			for token in {suffix, *suffix.split('_')}:
+				if token:
+					self._tokens.setdefault(token, []).append(suffix)
+
+		# 子串索引：每个后缀从各个位置开始的尾部按字典序排序，包含 key 的后缀对应以 key 开头的一段连续区间
+		self._tails = sorted((suffix[start:], suffix) for suffix in self._configs for start in range(len(suffix)))
+
+	def __len__(self) -> int:
+		"""尚未被匹配的覆盖配置数量"""
+		return len(self._configs)
+
+	def pop(self, api_user: Any) -> tuple[str, dict[str, Any]] | None:
+		"""
+		查找并移除与 api_user 匹配的覆盖配置
+
+		Args:
+			api_user: 账号的 api_user
+
+		Returns:
+			(后缀, 覆盖配置) 元组，没有匹配时返回 None
+		"""
+		if not self._configs:
+			return None
+
+		key = str(api_user)
+		suffix = self._find_exact(key) or self._find_substring(key)
+		if suffix is None:
+			return None
+		return suffix, self._configs.pop(suffix)
+
+	def remaining(self) -> Iterator[dict[str, Any]]:
+		"""
+		按原有顺序返回尚未被匹配的覆盖配置（作为新账号添加）
+
+		Yields:
+			dict[str, Any]: 账号配置
+		"""
+		yield from self._configs.values()
+
+	def _find_exact(self, key: str) -> str | None:
+		"""按后缀中的某一段精确匹配（已被匹配的后缀会被跳过）"""
+		for suffix in self._tokens.get(key, ()):
+			if suffix in self._configs:
+				return suffix
+		return None
+
+	def _find_substring(self, key: str) -> str | None:
+		"""回退为子串匹配（只检查包含 key 且尚未被匹配的后缀）"""
+		best: str | None = None
+		for position in range(bisect_left(self._tails, key, key=lambda item: item[0]), len(self._tails)):
+			tail, suffix = self._tails[position]
+			if not tail.startswith(key):
+				break
+			if suffix in self._configs and (best is None or (len(suffix), suffix) < (len(best), best)):
+				best = suffix
+		return best
@@ -0,0 +1,61 @@
+import gzip
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from tools.logger import logger
+
+
+class AccountFileSource:
+	"""
+	文件形式的账号来源
+
+	文件使用 JSON Lines（NDJSON）格式，每行一个账号对象，以 .gz 结尾时按 gzip 解压读取。
+	逐行解析并逐个返回，不会把整个文件读入内存，适合环境变量放不下的大量账号。
+	空行与 # 开头的注释行会被跳过，无效的行只记录行号（不输出内容，避免泄露 cookies）后跳过。
+	"""
+
+	def __init__(self, path: Path):
+		"""
+		初始化账号文件来源
+
+		Args:
+			path: 账号文件路径
+		"""
+		self.path = path
+
+	def __iter__(self) -> Iterator[dict[str, Any]]:
+		"""
+		逐行读取账号配置
+
+		Yields:
+			dict[str, Any]: 账号配置（未校验必需字段）
+		"""
+		try:
+			with self._open() as f:
+				for line_number, line in enumerate(f, start=1):
+					line = line.strip()
+					if not line or line.startswith('#'):
+						continue
+
+					try:
+						account = json.loads(line)
+					except json.JSONDecodeError as e:
+						logger.error(f'账号文件第 {line_number} 行的 JSON 格式无效：{e.msg}，已忽略')
+						continue
+
+					if not isinstance(account, dict):
+						logger.error(f'账号文件第 {line_number} 行必须使用对象格式 {{}}，已忽略')
+						continue
+
+					yield account
+
+		except (OSError, IOError, EOFError, UnicodeDecodeError) as e:
+			logger.error(f'读取账号文件 {self.path} 失败：{e}')
+
+	def _open(self) -> IO[str]:
+		"""按扩展名打开账号文件（.gz 按 gzip 解压）"""
+		if self.path.suffix == '.gz':
+			return gzip.open(self.path, 'rt', encoding='utf-8')
+		return open(self.path, 'r', encoding='utf-8')
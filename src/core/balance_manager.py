@@ -1,7 +1,9 @@
 import hashlib
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
+from core.models import BalanceHashState
 from tools.logger import logger
 
 
@@ -17,25 +19,41 @@ class BalanceManager:
 		"""
 		self.balance_hash_file = balance_hash_file
 
-	def load_balance_hash(self) -> dict[str, str] | None:
+	def load_balance_hash(self) -> BalanceHashState | None:
 		"""
-		加载余额 hash 字典
+		加载余额 hash 状态
+
+		优先按紧凑二进制格式解析；如果文件仍是旧版 JSON 格式，则自动转换，
+		下一次保存时会以紧凑格式写回，从而完成透明迁移。
 
 		Returns:
-			字典格式：{api_user_hash: balance_hash}，加载失败返回 None
+			余额 hash 状态，加载失败返回 None
 		"""
 		try:
 			if self.balance_hash_file.exists():
-				with open(self.balance_hash_file, 'r', encoding='utf-8') as f:
-					content = f.read().strip()
-					if not content:
-						return None
-					return json.loads(content)
+				with open(self.balance_hash_file, 'rb') as f:
+					content = f.read()
+
+				if not content.strip():
+					return None
+
+				# 紧凑格式
+				if content.startswith(BalanceHashState.MAGIC):
+					return BalanceHashState.from_bytes(content)
+
+				# 旧版 JSON 格式
+				balance_hash_dict = json.loads(content.decode('utf-8'))
+				if not isinstance(balance_hash_dict, dict):
+					logger.warning('余额哈希文件格式无效：必须是对象格式')
+					return None
+
+				logger.info('检测到旧版余额哈希文件，将在本次保存时迁移为紧凑格式')
+				return BalanceHashState.from_hash_dict(balance_hash_dict)
 
 		except (OSError, IOError) as e:
 			logger.warning(f'加载余额哈希失败：{e}')
 
-		except json.JSONDecodeError as e:
+		except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
 			logger.warning(f'余额哈希文件格式无效：{e}')
 
 		except Exception as e:
@@ -43,18 +61,71 @@ class BalanceManager:
 
 		return None
 
-	def save_balance_hash(self, balance_hash_dict: dict[str, str]):
+	def save_balance_hash(
+		self,
+		balance_hash_dict: dict[str, str],
+		previous_state: BalanceHashState | None = None,
+		carry_over_keys: Iterable[str] = (),
+	):
 		"""
-		保存余额 hash 字典
+		以紧凑格式保存余额 hash 字典
 
 		Args:
 			balance_hash_dict: 字典格式 {api_user_hash: balance_hash}
+			previous_state: 上次保存的余额 hash 状态
+			carry_over_keys: 本次未获取到余额、需要沿用上次记录的账号标识
+		"""
+		self.save_balance_state(
+			self.build_balance_state(
+				balance_hash_dict=balance_hash_dict,
+				previous_state=previous_state,
+				carry_over_keys=carry_over_keys,
+			)
+		)
+
+	@staticmethod
+	def build_balance_state(
+		balance_hash_dict: dict[str, str],
+		previous_state: BalanceHashState | None = None,
+		carry_over_keys: Iterable[str] = (),
+	) -> BalanceHashState:
+		"""
+		构建余额 hash 状态
+
+		Args:
+			balance_hash_dict: 字典格式 {api_user_hash: balance_hash}
+			previous_state: 上次保存的余额 hash 状态
+			carry_over_keys: 本次未获取到余额、需要沿用上次记录的账号标识
+
+		Returns:
+			余额 hash 状态
+		"""
+		records = {
+			BalanceHashState.digest(account_key): BalanceHashState.digest(balance_hash)
+			for account_key, balance_hash in balance_hash_dict.items()
+		}
+
+		# 沿用上次的余额摘要，避免跳过的账号在下次运行时被当作首次运行
+		if previous_state is not None:
+			for account_key in carry_over_keys:
+				last_digest = previous_state.get(account_key)
+				if last_digest is not None:
+					records.setdefault(BalanceHashState.digest(account_key), last_digest)
+
+		return BalanceHashState.from_records(records)
+
+	def save_balance_state(self, state: BalanceHashState):
+		"""
+		保存余额 hash 状态
+
+		Args:
+			state: 余额 hash 状态
 		"""
 		try:
 			# 确保父目录存在
 			self.balance_hash_file.parent.mkdir(parents=True, exist_ok=True)
-			with open(self.balance_hash_file, 'w', encoding='utf-8') as f:
-				json.dump(balance_hash_dict, f, ensure_ascii=False, indent=2)
+			with open(self.balance_hash_file, 'wb') as f:
+				f.write(state.to_bytes())
 
 		except (OSError, IOError) as e:
 			logger.warning(f'保存余额哈希失败：{e}')
@@ -0,0 +1,161 @@
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from tools.logger import logger
+
+
+class CheckinLedger:
+	"""签到台账，记录每个账号最近一次成功签到所在的服务端自然日"""
+
+	def __init__(self, ledger_file: Path, reset_timezone: ZoneInfo):
+		"""
+		初始化签到台账
+
+		Args:
+			ledger_file: 台账文件路径
+			reset_timezone: 服务端签到重置所使用的时区（每天 0 点重置）
+		"""
+		self.ledger_file = ledger_file
+		self.reset_timezone = reset_timezone
+		self._entries: dict[str, dict] = {}
+		self._dirty = False
+
+	def load(self):
+		"""从文件加载台账，文件不存在或格式无效时从空台账开始"""
+		self._entries = {}
+		self._dirty = False
+
+		try:
+			if not self.ledger_file.exists():
+				return
+
+			with open(self.ledger_file, 'r', encoding='utf-8') as f:
+				content = f.read().strip()
+
+			if not content:
+				return
+
+			data = json.loads(content)
+			if not isinstance(data, dict):
+				logger.warning('签到台账格式无效：必须是对象格式')
+				return
+
+			self._entries = {
+				key: value
+				for key, value in data.items()
+				if isinstance(value, dict)
+			}  # fmt: skip
+
+		except (OSError, IOError) as e:
+			logger.warning(f'加载签到台账失败：{e}')
+
+		except json.JSONDecodeError as e:
+			logger.warning(f'签到台账格式无效：{e}')
+
+	def save(self):
+		"""保存台账，没有变更时不写文件"""
+		if not self._dirty:
+			return
+
+		try:
+			self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+			with open(self.ledger_file, 'w', encoding='utf-8') as f:
+				json.dump(self._entries, f, ensure_ascii=False, separators=(',', ':'))
+			self._dirty = False
+
+		except (OSError, IOError) as e:
+			logger.warning(f'保存签到台账失败：{e}')
+
+	def export(self, account_keys: list[str]) -> dict[str, dict]:
+		"""
+		导出指定账号的台账记录（用于分片运行）
+
+		Args:
+			account_keys: 账号标识列表
+
+		Returns:
+			dict[str, dict]: 账号标识 -> 台账记录
+		"""
+		return {key: dict(self._entries[key]) for key in account_keys if key in self._entries}
+
+	def update_entries(self, entries: dict[str, dict]):
+		"""
+		用其他来源（如各分片）的记录覆盖对应账号的台账
+
+		Args:
+			entries: 账号标识 -> 台账记录
+		"""
+		for key, value in entries.items():
+			if isinstance(value, dict):
+				self._entries[key] = dict(value)
+				self._dirty = True
+
+	def current_day(self) -> str:
+		"""获取服务端当前自然日（ISO 格式）"""
+		return datetime.now(self.reset_timezone).date().isoformat()
+
+	def is_checked_in_today(self, account_key: str) -> bool:
+		"""
+		判断账号在服务端当前自然日内是否已签到成功
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+
+		Returns:
+			今日已签到返回 True
+		"""
+		entry = self._entries.get(account_key)
+		return entry is not None and entry.get('day') == self.current_day()
+
+	def record_success(self, account_key: str):
+		"""
+		记录一次成功签到
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+		"""
+		entry = self._entries.setdefault(account_key, {})
+		entry['day'] = self.current_day()
+		entry['last_success_at'] = time.time()
+		entry['consecutive_failures'] = 0
+		self._dirty = True
+
+	def record_failure(self, account_key: str):
+		"""
+		记录一次签到失败（累加连续失败次数）
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+		"""
+		entry = self._entries.setdefault(account_key, {})
+		entry['consecutive_failures'] = self.get_consecutive_failures(account_key) + 1
+		self._dirty = True
+
+	def get_last_success_at(self, account_key: str) -> float | None:
+		"""
+		获取账号最近一次成功签到的时间戳
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+
+		Returns:
+			Unix 时间戳，从未成功过返回 None
+		"""
+		value = self._entries.get(account_key, {}).get('last_success_at')
+		return float(value) if isinstance(value, (int, float)) else None
+
+	def get_consecutive_failures(self, account_key: str) -> int:
+		"""
+		获取账号的连续失败次数
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+
+		Returns:
+			连续失败次数
+		"""
+		value = self._entries.get(account_key, {}).get('consecutive_failures', 0)
+		return value if isinstance(value, int) else 0
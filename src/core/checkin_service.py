@@ -2,11 +2,24 @@ import json
 import os
 from typing import Any
 
-import httpx
-from playwright.async_api import async_playwright
-
+from core.circuit_breaker import CircuitAttempt, CircuitBreaker, FailureKind
+from core.models import AccountConfig
 from core.privacy_handler import PrivacyHandler
 from tools.logger import logger
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryableError, RetryBudget, RetryPolicy, RetryReason
+
+
+def async_playwright() -> Any:
+	"""
+	创建 Playwright 上下文管理器
+
+	Playwright 导入较慢，只在需要启动浏览器时才导入（httpx 同理在发起请求时导入），
+	未配置账号等提前退出的场景无需加载。
+	"""
+	from playwright.async_api import async_playwright as create_playwright
+
+	return create_playwright()
 
 
 class CheckinService:
@@ -25,10 +38,25 @@ class CheckinService:
 			CHECKIN = f'{API_BASE}/user/sign_in'
 			CONSOLE = f'{BASE}/console'
 
+			def __init__(self, base: str | None = None):
+				"""
+				按站点地址生成各页面与接口地址（用于指向本地模拟站点）
+
+				Args:
+					base: 站点地址，None 表示使用默认地址
+				"""
+				self.BASE = (base or type(self).BASE).rstrip('/')
+				self.LOGIN = f'{self.BASE}/login'
+				self.API_BASE = f'{self.BASE}/api'
+				self.USER_INFO = f'{self.API_BASE}/user/self'
+				self.CHECKIN = f'{self.API_BASE}/user/sign_in'
+				self.CONSOLE = f'{self.BASE}/console'
+
 		class Env:
 			"""环境变量配置"""
 
 			ACCOUNTS_KEY = 'ANYROUTER_ACCOUNTS'
+			ACCOUNTS_FILE = 'ANYROUTER_ACCOUNTS_FILE'
 			ACCOUNT_PREFIX = 'ANYROUTER_ACCOUNT_'
 			SHOW_SENSITIVE_INFO = 'SHOW_SENSITIVE_INFO'
 			REPO_VISIBILITY = 'REPO_VISIBILITY'
@@ -36,11 +64,31 @@ class CheckinService:
 			GITHUB_STEP_SUMMARY = 'GITHUB_STEP_SUMMARY'
 			CI = 'CI'
 			GITHUB_ACTIONS = 'GITHUB_ACTIONS'
+			SKIP_CHECKED_IN = 'SKIP_CHECKED_IN'
+			SKIPPED_BALANCE_REFRESH = 'SKIPPED_BALANCE_REFRESH'
+			CHECKIN_RESET_TZ = 'CHECKIN_RESET_TZ'
+			RUN_DEADLINE = 'CHECKIN_RUN_DEADLINE'
+			BREAKER_THRESHOLD = 'CHECKIN_BREAKER_THRESHOLD'
+			BREAKER_COOLDOWN = 'CHECKIN_BREAKER_COOLDOWN'
+			RETRY_MAX_ATTEMPTS = 'CHECKIN_RETRY_MAX_ATTEMPTS'
+			RETRY_BUDGET = 'CHECKIN_RETRY_BUDGET'
+			RATE_LIMITS = 'CHECKIN_RATE_LIMITS'
+			SHARD = 'CHECKIN_SHARD'
+			SHARD_DIR = 'CHECKIN_SHARD_DIR'
+			WORKERS = 'CHECKIN_WORKERS'
+			RESUME = 'CHECKIN_RESUME'
+			DAEMON_CRON = 'CHECKIN_DAEMON_CRON'
+			DAEMON_JITTER = 'CHECKIN_DAEMON_JITTER'
+			BASE_URL = 'ANYROUTER_BASE_URL'
 
 		class File:
 			"""文件配置"""
 
 			BALANCE_HASH_NAME = 'balance_hash.txt'
+			CHECKIN_LEDGER_NAME = 'checkin_ledger.json'
+			SHARD_DIR_NAME = 'shards'
+			RUN_JOURNAL_NAME = 'run_journal.jsonl'
+			SUMMARY_FULL_NAME = 'step_summary_full.md'
 
 		class Browser:
 			"""浏览器配置"""
@@ -66,9 +114,84 @@ class CheckinService:
 
 			COOKIE_NAMES = ['acw_tc', 'cdn_sec_tc', 'acw_sc__v2']
 
+		class Retry:
+			"""重试配置"""
+
+			# 整次运行默认允许的重试次数
+			DEFAULT_BUDGET = 10
+
+		class Daemon:
+			"""常驻模式配置"""
+
+			# 默认签到计划（与 GitHub Actions 工作流一致）
+			DEFAULT_CRON = '0 */6 * * *'
+
+			# 默认随机抖动上限（秒）
+			DEFAULT_JITTER = 300.0
+
+	def __init__(self, privacy_handler: PrivacyHandler | None = None, worker_count: int = 1):
+		"""
+		初始化签到服务
+
+		Args:
+			privacy_handler: 隐私处理器，None 表示按当前环境变量创建（整个进程共用同一个实例）
+			worker_count: 并行的工作进程数量，限流速率与重试预算按该数量平分，保证整次运行的总量不超过配置
+		"""
+		self.privacy_handler = privacy_handler or PrivacyHandler(PrivacyHandler.should_show_sensitive_info())
+
+		# 站点地址，可指向本地模拟站点进行测试
+		self.urls = self.Config.URLs(os.getenv(self.Config.Env.BASE_URL, '').strip() or None)
+
+		# 按主机限流，所有账号与通知发送共享同一组令牌桶（多进程时每个进程使用其中一份速率）
+		rate_limits = os.getenv(self.Config.Env.RATE_LIMITS, '').strip()
+		self.rate_limiter = HostRateLimiter(HostRateLimiter.parse_limits(rate_limits) if rate_limits else None).split(
+			worker_count
+		)
+
+		# 重试策略在所有账号之间共享同一份重试预算
+		# 多进程时每个进程使用平分后的预算（向上取整），进程数量多于预算时每个进程仍至少可以重试 1 次
+		retry_budget = self._load_positive_number(
+			env_key=self.Config.Env.RETRY_BUDGET,
+			default=self.Config.Retry.DEFAULT_BUDGET,
+			cast=int,
+		)
+		worker_budget = -(-retry_budget // max(worker_count, 1))
+		if worker_budget < retry_budget:
+			logger.info(f'{worker_count} 个工作进程平分重试预算，每个进程最多重试 {worker_budget} 次', tag='重试')
+		max_attempts = self._load_positive_number(
+			env_key=self.Config.Env.RETRY_MAX_ATTEMPTS,
+			default=RetryPolicy.DEFAULT_MAX_ATTEMPTS,
+			cast=int,
+		)
+		self.retry_policy = RetryPolicy(max_attempts=max_attempts, budget=RetryBudget(max_retries=worker_budget))
+
+		# 通知推送使用独立的重试预算，持续失败的 Webhook 不会耗尽签到请求的重试次数
+		self.notification_retry_policy = RetryPolicy(
+			max_attempts=max_attempts,
+			budget=RetryBudget(max_retries=retry_budget),
+		)
+
+		# 常驻浏览器（仅常驻模式启动，未启动时每次获取 WAF cookies 都临时启动浏览器）
+		self._playwright: Any = None
+		self._browser: Any = None
+
+		# 熔断器在同一进程的所有账号之间共享（多进程时每个进程各自统计、各自熔断）
+		self.circuit_breaker = CircuitBreaker(
+			failure_threshold=self._load_positive_number(
+				env_key=self.Config.Env.BREAKER_THRESHOLD,
+				default=CircuitBreaker.DEFAULT_FAILURE_THRESHOLD,
+				cast=int,
+			),
+			cooldown=self._load_positive_number(
+				env_key=self.Config.Env.BREAKER_COOLDOWN,
+				default=CircuitBreaker.DEFAULT_COOLDOWN,
+				cast=float,
+			),
+		)
+
 	async def check_in_account(
 		self,
-		account_info: dict[str, Any],
+		account_info: AccountConfig,
 		account_index: int,
 	) -> tuple[bool, dict[str, Any] | None]:
 		"""
@@ -80,14 +203,18 @@ class CheckinService:
 
 		Returns:
 		    tuple[bool, dict[str, Any] | None]: (是否签到成功, 用户信息)
+
+		Raises:
+		    CircuitOpenError: 熔断器处于打开状态时抛出，此时不会访问站点
 		"""
-		privacy_handler = PrivacyHandler(PrivacyHandler.should_show_sensitive_info())
-		account_name = privacy_handler.get_safe_account_name(account_info, account_index)
+		import httpx
+
+		account_name = account_info.safe_name
 		logger.processing(f'开始处理 {account_name}')
 
 		# 解析账号配置
-		cookies_data = account_info.get('cookies', {})
-		api_user = account_info.get('api_user', '')
+		cookies_data = account_info.cookies
+		api_user = account_info.api_user
 
 		# 未找到 API 用户标识符
 		if not api_user:
@@ -100,197 +227,386 @@ class CheckinService:
 			logger.error('配置格式无效', account_name)
 			return False, None
 
-		# 步骤1：获取 WAF cookies
-		waf_cookies = await self._get_waf_cookies_with_playwright(account_name)
-		if not waf_cookies:
-			logger.error('无法获取 WAF cookies', account_name)
-			return False, None
+		# 之后的步骤都会访问站点，受跨账号共享的熔断器保护
+		with self.circuit_breaker.attempt() as circuit_attempt:
+			# 步骤1：获取 WAF cookies
+			waf_cookies = await self._get_waf_cookies_with_playwright(
+				account_name=account_name,
+				circuit_attempt=circuit_attempt,
+			)
+			if not waf_cookies:
+				logger.error('无法获取 WAF cookies', account_name)
+				return False, None
 
-		# 步骤2：使用 httpx 进行 API 请求
-		async with httpx.AsyncClient(http2=True, timeout=30.0) as client:
-			try:
-				# 合并 WAF cookies 和用户 cookies
-				all_cookies = {**waf_cookies, **user_cookies}
-				client.cookies.update(all_cookies)
-
-				headers = {
-					'User-Agent': ' '.join(self.Config.Browser.USER_AGENT_PARTS),
-					'Referer': self.Config.URLs.CONSOLE,
-					'Origin': self.Config.URLs.BASE,
-					'new-api-user': api_user,
-					'Accept': 'application/json, text/plain, */*',
-					'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-					'Accept-Encoding': 'gzip, deflate, br, zstd',
-					'Connection': 'keep-alive',
-					'Sec-Fetch-Dest': 'empty',
-					'Sec-Fetch-Mode': 'cors',
-					'Sec-Fetch-Site': 'same-origin',
-				}
+			# 步骤2：使用 httpx 进行 API 请求
+			async with httpx.AsyncClient(
+				http2=True, timeout=30.0, event_hooks=self.rate_limiter.event_hooks()
+			) as client:
+				try:
+					# 合并 WAF cookies 和用户 cookies
+					all_cookies = {**waf_cookies, **user_cookies}
+					client.cookies.update(all_cookies)
+
+					headers = self._build_headers(api_user)
+
+					# 获取用户信息
+					user_info = await self._get_user_info(
+						client=client,
+						headers=headers,
+						account_name=account_name,
+						circuit_attempt=circuit_attempt,
+					)
+					if user_info and user_info.get('success'):
+						logger.info(user_info['display'], account_name)
+					elif user_info:
+						logger.warning(user_info.get('error', '未知错误'), account_name)
+
+					logger.debug(
+						message='执行签到',
+						tag='网络',
+						account_name=account_name,
+					)
+
+					# 更新签到请求头
+					checkin_headers = headers.copy()
+					checkin_headers.update({
+						'Content-Type': 'application/json',
+						'X-Requested-With': 'XMLHttpRequest'
+					})  # fmt: skip
+
+					response = await self.retry_policy.call(
+						lambda: client.post(
+							url=self.urls.CHECKIN,
+							headers=checkin_headers,
+							timeout=30,
+						),
+						operation='签到请求',
+						account_name=account_name,
+						# 签到请求不是幂等的，超时或 5xx 时站点可能已经完成签到，只重试确定未送达的请求
+						idempotent=False,
+					)
+
+					logger.debug(
+						message=lambda: f'响应状态码 {response.status_code}',
+						tag='响应',
+						account_name=account_name,
+					)
+
+					# 5xx 说明站点异常，其余状态码说明站点可以正常响应
+					if response.status_code >= 500:
+						circuit_attempt.record_failure(FailureKind.SERVER_ERROR)
+					else:
+						circuit_attempt.record_success()
+
+					# HTTP 请求失败
+					if response.status_code != 200:
+						logger.error(f'签到失败 - HTTP {response.status_code}', account_name)
+						return False, user_info
+
+					# 处理响应结果
+					try:
+						result = response.json()
+						if result.get('ret') == 1 or result.get('code') == 0 or result.get('success'):
+							logger.success('签到成功!', account_name)
+							return True, user_info
+
+						# 签到失败
+						error_msg = result.get('msg', result.get('message', '未知错误'))
+						logger.error(f'签到失败 - {error_msg}', account_name)
+						return False, user_info
+
+					except json.JSONDecodeError:
+						# 如果不是 JSON 响应，检查是否包含成功标识
+						if 'success' in response.text.lower():
+							logger.success('签到成功!', account_name)
+							return True, user_info
+
+						# 签到失败
+						logger.error('签到失败 - 无效响应格式', account_name)
+						return False, user_info
+
+				except Exception as e:
+					if isinstance(e, httpx.TimeoutException):
+						circuit_attempt.record_failure(FailureKind.TIMEOUT)
+
+					logger.error(
+						message=f'签到过程中发生错误 - {str(e)[:50]}...',
+						account_name=account_name,
+						exc_info=True,
+					)
+					return False, None
+
+	async def refresh_balance(
+		self,
+		account_info: AccountConfig,
+		account_index: int,
+	) -> dict[str, Any] | None:
+		"""
+		仅刷新账号余额（用于今日已签到的账号）
 
-				# 获取用户信息
-				user_info = await self._get_user_info(
-					client=client,
-					headers=headers,
-					privacy_handler=privacy_handler,
-				)
-				if user_info and user_info.get('success'):
-					logger.info(user_info['display'], account_name)
-				elif user_info:
-					logger.warning(user_info.get('error', '未知错误'), account_name)
-
-				logger.debug(
-					message='执行签到',
-					tag='网络',
-					account_name=account_name,
-				)
-
-				# 更新签到请求头
-				checkin_headers = headers.copy()
-				checkin_headers.update({
-					'Content-Type': 'application/json',
-					'X-Requested-With': 'XMLHttpRequest'
-				})  # fmt: skip
-
-				response = await client.post(
-					url=self.Config.URLs.CHECKIN,
-					headers=checkin_headers,
-					timeout=30,
-				)
+		不启动浏览器获取 WAF cookies，也不调用签到接口，只使用用户 cookies 查询一次余额。
+		WAF 拦截等原因导致查询失败时返回失败信息，调用方应视为余额未知。
 
-				logger.debug(
-					message=f'响应状态码 {response.status_code}',
-					tag='响应',
-					account_name=account_name,
-				)
+		Args:
+		    account_info: 账号配置信息
+		    account_index: 账号索引
 
-				# HTTP 请求失败
-				if response.status_code != 200:
-					logger.error(f'签到失败 - HTTP {response.status_code}', account_name)
-					return False, user_info
+		Returns:
+		    dict[str, Any] | None: 用户信息，账号配置无效时返回 None
+		"""
+		import httpx
 
-				# 处理响应结果
-				try:
-					result = response.json()
-					if result.get('ret') == 1 or result.get('code') == 0 or result.get('success'):
-						logger.success('签到成功!', account_name)
-						return True, user_info
-
-					# 签到失败
-					error_msg = result.get('msg', result.get('message', '未知错误'))
-					logger.error(f'签到失败 - {error_msg}', account_name)
-					return False, user_info
-
-				except json.JSONDecodeError:
-					# 如果不是 JSON 响应，检查是否包含成功标识
-					if 'success' in response.text.lower():
-						logger.success('签到成功!', account_name)
-						return True, user_info
-
-					# 签到失败
-					logger.error('签到失败 - 无效响应格式', account_name)
-					return False, user_info
-
-			except Exception as e:
-				logger.error(
-					message=f'签到过程中发生错误 - {str(e)[:50]}...',
-					account_name=account_name,
-					exc_info=True,
-				)
-				return False, None
+		account_name = account_info.safe_name
+
+		api_user = account_info.api_user
+		user_cookies = self._parse_cookies(account_info.cookies)
+		if not api_user or not user_cookies:
+			return None
+
+		async with httpx.AsyncClient(http2=True, timeout=30.0, event_hooks=self.rate_limiter.event_hooks()) as client:
+			client.cookies.update(user_cookies)
+			user_info = await self._get_user_info(
+				client=client,
+				headers=self._build_headers(api_user),
+				account_name=account_name,
+			)
 
-	async def _get_waf_cookies_with_playwright(self, account_name: str) -> dict[str, str] | None:
+		if user_info.get('success'):
+			logger.info(user_info['display'], account_name)
+		else:
+			logger.debug(
+				message=lambda: f'余额刷新失败：{user_info.get("error", "未知错误")}',
+				tag='网络',
+				account_name=account_name,
+			)
+
+		return user_info
+
+	def _build_headers(self, api_user: str) -> dict[str, str]:
+		"""
+		构建 API 请求头
+
+		Args:
+		    api_user: API 用户标识
+
+		Returns:
+		    dict[str, str]: 请求头
+		"""
+		return {
+			'User-Agent': ' '.join(self.Config.Browser.USER_AGENT_PARTS),
+			'Referer': self.urls.CONSOLE,
+			'Origin': self.urls.BASE,
+			'new-api-user': api_user,
+			'Accept': 'application/json, text/plain, */*',
+			'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+			'Accept-Encoding': 'gzip, deflate, br, zstd',
+			'Connection': 'keep-alive',
+			'Sec-Fetch-Dest': 'empty',
+			'Sec-Fetch-Mode': 'cors',
+			'Sec-Fetch-Site': 'same-origin',
+		}
+
+	async def _get_waf_cookies_with_playwright(
+		self,
+		account_name: str,
+		circuit_attempt: CircuitAttempt | None = None,
+	) -> dict[str, str] | None:
 		"""
 		使用 Playwright 获取 WAF cookies（无痕模式）
 
+		WAF 拦截（缺少 cookies）或页面加载超时时，按重试策略重新启动浏览器获取。
+
 		Args:
 		    account_name: 账号名称（用于日志）
+		    circuit_attempt: 熔断器的处理过程，用于记录站点级失败
 
 		Returns:
 		    dict[str, str] | None: WAF cookies 字典，失败返回 None
 		"""
-		logger.processing('正在启动浏览器获取 WAF cookies...', account_name)
+		try:
+			return await self.retry_policy.call(
+				lambda: self._collect_waf_cookies(account_name),
+				operation='获取 WAF cookies',
+				account_name=account_name,
+			)
+
+		except RetryableError as e:
+			# 重试后仍被 WAF 拦截或页面加载超时，说明站点异常
+			if circuit_attempt:
+				if e.reason == RetryReason.WAF_BLOCKED:
+					circuit_attempt.record_failure(FailureKind.WAF_BLOCKED)
+				else:
+					circuit_attempt.record_failure(FailureKind.TIMEOUT)
+
+			logger.error(str(e), account_name)
+			return None
+
+		except Exception as e:
+			logger.error(
+				message=f'获取 WAF cookies 时发生错误：{e}',
+				account_name=account_name,
+				exc_info=True,
+			)
+			return None
+
+	async def start_browser(self):
+		"""
+		启动常驻浏览器（常驻模式使用）
+
+		启动后每个账号在该浏览器中创建独立的无痕上下文获取 WAF cookies，不再每次重新启动浏览器。
+		"""
+		if self._browser is not None and self._browser.is_connected():
+			return
+
+		await self.stop_browser()
+		self._playwright = await async_playwright().start()
+		self._browser = await self._launch_browser(self._playwright)
+		logger.info('常驻浏览器已启动', tag='浏览器')
+
+	async def stop_browser(self):
+		"""关闭常驻浏览器"""
+		browser, playwright = self._browser, self._playwright
+		self._browser = None
+		self._playwright = None
+
+		if browser is not None:
+			try:
+				await browser.close()
+			except Exception:
+				pass
+		if playwright is not None:
+			try:
+				await playwright.stop()
+			except Exception:
+				pass
+
+	async def _launch_browser(self, playwright: Any) -> Any:
+		"""
+		启动 Chromium
+
+		Args:
+		    playwright: Playwright 实例
+
+		Returns:
+		    Browser: 浏览器实例
+		"""
+		# 检测是否在 CI 环境中运行
+		is_ci = any(
+			os.getenv(env) == 'true'
+			for env in (self.Config.Env.CI, self.Config.Env.GITHUB_ACTIONS)
+		)  # fmt: skip
+
+		# 使用标准无痕模式，避免临时目录的潜在问题
+		# CI 环境使用 headless 模式，本地开发可以看到浏览器界面
+		return await playwright.chromium.launch(
+			headless=is_ci,
+			args=self.Config.Browser.ARGS,
+		)
+
+	async def _collect_waf_cookies(self, account_name: str) -> dict[str, str]:
+		"""
+		获取一次 WAF cookies（已启动常驻浏览器时复用，否则临时启动一次浏览器）
 
-		browser = None
-		context = None
+		Args:
+		    account_name: 账号名称（用于日志）
 
+		Returns:
+		    dict[str, str]: WAF cookies 字典
+
+		Raises:
+		    RetryableError: 缺少 WAF cookies 或页面加载超时
+		"""
 		try:
+			if self._browser is not None and self._browser.is_connected():
+				return await self._collect_waf_cookies_in(self._browser, account_name)
+
+			logger.processing('正在启动浏览器获取 WAF cookies...', account_name)
 			async with async_playwright() as p:
-				# 检测是否在 CI 环境中运行
-				is_ci = any(
-					os.getenv(env) == 'true'
-					for env in (self.Config.Env.CI, self.Config.Env.GITHUB_ACTIONS)
-				)  # fmt: skip
+				browser = await self._launch_browser(p)
+				try:
+					return await self._collect_waf_cookies_in(browser, account_name)
+				finally:
+					# 确保资源被正确释放
+					try:
+						await browser.close()
+					except Exception:
+						pass
 
-				# 使用标准无痕模式，避免临时目录的潜在问题
-				# CI 环境使用 headless 模式，本地开发可以看到浏览器界面
-				browser = await p.chromium.launch(
-					headless=is_ci,
-					args=self.Config.Browser.ARGS,
-				)
+		except RetryableError:
+			raise
 
-				context = await browser.new_context(
-					user_agent=' '.join(self.Config.Browser.USER_AGENT_PARTS),
-					viewport={'width': 1920, 'height': 1080},
-				)
+		except Exception as e:
+			# Playwright 的超时异常（如页面加载超时）说明站点无响应，可以重试
+			from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-				page = await context.new_page()
+			if isinstance(e, PlaywrightTimeoutError):
+				raise RetryableError(RetryReason.TIMEOUT, f'获取 WAF cookies 超时：{e}') from e
+			raise
 
-				logger.processing('步骤 1: 访问登录页面获取初始 cookies...', account_name)
+	async def _collect_waf_cookies_in(self, browser: Any, account_name: str) -> dict[str, str]:
+		"""
+		在独立的无痕上下文中访问登录页面并读取 WAF cookies
 
-				await page.goto(self.Config.URLs.LOGIN, wait_until='networkidle')
+		Args:
+		    browser: 浏览器实例
+		    account_name: 账号名称（用于日志）
 
-				try:
-					await page.wait_for_function('document.readyState === "complete"', timeout=5000)
-				except Exception:
-					await page.wait_for_timeout(3000)
+		Returns:
+		    dict[str, str]: WAF cookies 字典
 
-				cookies = await context.cookies()
+		Raises:
+		    RetryableError: 缺少 WAF cookies
+		"""
+		context = await browser.new_context(
+			user_agent=' '.join(self.Config.Browser.USER_AGENT_PARTS),
+			viewport={'width': 1920, 'height': 1080},
+		)
 
-				waf_cookies = {}
-				for cookie in cookies:
-					cookie_name = cookie.get('name')
-					cookie_value = cookie.get('value')
-					if cookie_name in self.Config.WAF.COOKIE_NAMES and cookie_value is not None:
-						waf_cookies[cookie_name] = cookie_value
+		try:
+			page = await context.new_page()
 
-				logger.info(f'步骤 1 后获得 {len(waf_cookies)} 个 WAF cookies', account_name)
+			logger.processing('步骤 1: 访问登录页面获取初始 cookies...', account_name)
 
-				missing_cookies = [c for c in self.Config.WAF.COOKIE_NAMES if c not in waf_cookies]
+			await self.rate_limiter.acquire(self.urls.LOGIN)
+			await page.goto(self.urls.LOGIN, wait_until='networkidle')
 
-				if missing_cookies:
-					logger.error(f'缺少 WAF cookies: {missing_cookies}', account_name)
-					return None
+			try:
+				await page.wait_for_function('document.readyState === "complete"', timeout=5000)
+			except Exception:
+				await page.wait_for_timeout(3000)
 
-				logger.success('成功获取所有 WAF cookies', account_name)
+			cookies = await context.cookies()
 
-				return waf_cookies
+			waf_cookies = {}
+			for cookie in cookies:
+				cookie_name = cookie.get('name')
+				cookie_value = cookie.get('value')
+				if cookie_name in self.Config.WAF.COOKIE_NAMES and cookie_value is not None:
+					waf_cookies[cookie_name] = cookie_value
 
-		except Exception as e:
-			logger.error(
-				message=f'获取 WAF cookies 时发生错误：{e}',
-				account_name=account_name,
-				exc_info=True,
-			)
-			return None
+			logger.info(f'步骤 1 后获得 {len(waf_cookies)} 个 WAF cookies', account_name)
+
+			missing_cookies = [c for c in self.Config.WAF.COOKIE_NAMES if c not in waf_cookies]
+
+			if missing_cookies:
+				raise RetryableError(RetryReason.WAF_BLOCKED, f'缺少 WAF cookies: {missing_cookies}')
+
+			logger.success('成功获取所有 WAF cookies', account_name)
+
+			return waf_cookies
 
 		finally:
-			# 确保资源被正确释放
-			if context:
-				try:
-					await context.close()
-				except Exception:
-					pass
-			if browser:
-				try:
-					await browser.close()
-				except Exception:
-					pass
+			try:
+				await context.close()
+			except Exception:
+				pass
 
 	async def _get_user_info(
 		self,
 		client,
 		headers: dict[str, str],
-		privacy_handler: PrivacyHandler,
+		account_name: str | None = None,
+		circuit_attempt: CircuitAttempt | None = None,
 	) -> dict[str, Any]:
 		"""
 		获取用户信息
@@ -298,18 +614,32 @@ class CheckinService:
 		Args:
 		    client: httpx 客户端
 		    headers: 请求头
-		    privacy_handler: 隐私处理器
+		    account_name: 账号名称（用于日志）
+		    circuit_attempt: 熔断器的处理过程，用于记录站点级失败
 
 		Returns:
 		    dict[str, Any]: 用户信息字典
 		"""
+		import httpx
+
 		try:
-			response = await client.get(
-				url=self.Config.URLs.USER_INFO,
-				headers=headers,
-				timeout=30,
+			response = await self.retry_policy.call(
+				lambda: client.get(
+					url=self.urls.USER_INFO,
+					headers=headers,
+					timeout=30,
+				),
+				operation='获取用户信息',
+				account_name=account_name,
 			)
 
+			# 5xx 说明站点异常，其余状态码说明站点可以正常响应
+			if circuit_attempt:
+				if response.status_code >= 500:
+					circuit_attempt.record_failure(FailureKind.SERVER_ERROR)
+				else:
+					circuit_attempt.record_success()
+
 			# HTTP 请求失败
 			if response.status_code != 200:
 				return {
@@ -341,10 +671,12 @@ class CheckinService:
 				'success': True,
 				'quota': quota,
 				'used_quota': used_quota,
-				'display': privacy_handler.get_safe_balance_display(quota=quota, used=used_quota),
+				'display': self.privacy_handler.get_safe_balance_display(quota=quota, used=used_quota),
 			}
 
 		except httpx.TimeoutException:
+			if circuit_attempt:
+				circuit_attempt.record_failure(FailureKind.TIMEOUT)
 			return {
 				'success': False,
 				'error': '获取用户信息失败：请求超时',
@@ -362,6 +694,35 @@ class CheckinService:
 				'error': f'获取用户信息失败：{str(e)[:50]}...',
 			}
 
+	@staticmethod
+	def _load_positive_number(env_key: str, default, cast: type):
+		"""
+		从环境变量加载正数配置
+
+		Args:
+		    env_key: 环境变量名
+		    default: 默认值
+		    cast: 转换类型（int 或 float）
+
+		Returns:
+		    配置值，未配置或无效时返回默认值
+		"""
+		value = os.getenv(env_key, '').strip()
+		if not value:
+			return default
+
+		try:
+			number = cast(value)
+		except ValueError:
+			logger.warning(f'{env_key} 配置无效：{value}，使用默认值 {default}')
+			return default
+
+		if number <= 0:
+			logger.warning(f'{env_key} 必须大于 0，使用默认值 {default}')
+			return default
+
+		return number
+
 	@staticmethod
 	def _parse_cookies(cookies_data) -> dict[str, str]:
 		"""
@@ -0,0 +1,185 @@
+import time
+from enum import Enum
+
+from tools.logger import logger
+
+
+class FailureKind(Enum):
+	"""站点级失败类型（与具体账号无关的失败）"""
+
+	TIMEOUT = ('timeout', '请求超时')
+	SERVER_ERROR = ('server_error', '服务端错误')
+	WAF_BLOCKED = ('waf_blocked', 'WAF 拦截')
+
+	def __init__(self, value: str, tag: str):
+		"""
+		初始化失败类型枚举
+
+		Args:
+			value: 失败类型的字符串值
+			tag: 失败类型的中文描述
+		"""
+		self._value_ = value
+		self._tag = tag
+
+	def get_tag(self) -> str:
+		"""获取失败类型的中文描述"""
+		return self._tag
+
+
+class CircuitState(Enum):
+	"""熔断器状态"""
+
+	# 正常放行
+	CLOSED = 'closed'
+
+	# 已熔断，直接失败
+	OPEN = 'open'
+
+	# 冷却结束，仅放行一次探测请求
+	HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+	"""熔断器处于打开状态时抛出"""
+
+
+class CircuitAttempt:
+	"""
+	一次受熔断器保护的账号处理过程
+
+	同一个账号可能经历多次请求（WAF、余额、签到），这里只记录第一次站点级失败，
+	保证熔断计数以「账号」为单位，而不会因为同一账号的多个请求重复累加。
+	"""
+
+	def __init__(self, breaker: 'CircuitBreaker'):
+		"""
+		初始化处理过程
+
+		Args:
+			breaker: 所属的熔断器
+		"""
+		self._breaker = breaker
+		self.failure: FailureKind | None = None
+		self.reached = False
+
+	def record_success(self):
+		"""记录站点正常响应（即使账号本身签到失败，也说明站点可用）"""
+		self.reached = True
+
+	def record_failure(self, kind: FailureKind):
+		"""
+		记录站点级失败
+
+		Args:
+			kind: 失败类型
+		"""
+		if self.failure is None:
+			self.failure = kind
+
+	def __enter__(self) -> 'CircuitAttempt':
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self._breaker._finish(self)
+
+
+class CircuitBreaker:
+	"""
+	跨账号共享的熔断器
+
+	连续 N 个账号出现同一类站点级失败（超时、5xx、缺少 WAF cookies）时熔断，
+	之后的账号直接失败；冷却时间结束后放行一个探测请求，成功则恢复，失败则继续熔断。
+	"""
+
+	# 默认连续失败阈值
+	DEFAULT_FAILURE_THRESHOLD = 3
+
+	# 默认冷却时间（秒）
+	DEFAULT_COOLDOWN = 60.0
+
+	def __init__(
+		self,
+		failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+		cooldown: float = DEFAULT_COOLDOWN,
+	):
+		"""
+		初始化熔断器
+
+		Args:
+			failure_threshold: 触发熔断的连续同类失败次数
+			cooldown: 熔断后进入半开状态前的冷却时间（秒）
+		"""
+		self.failure_threshold = failure_threshold
+		self.cooldown = cooldown
+		self.state = CircuitState.CLOSED
+		self.last_failure: FailureKind | None = None
+		self._streak = 0
+		self._opened_at = 0.0
+		self._probe_in_flight = False
+
+	def attempt(self) -> CircuitAttempt:
+		"""
+		开始一次受保护的处理过程
+
+		Returns:
+			CircuitAttempt: 处理过程，需配合 with 语句使用
+
+		Raises:
+			CircuitOpenError: 熔断器处于打开状态，或半开状态下已有探测请求
+		"""
+		if self.state == CircuitState.OPEN:
+			if time.monotonic() - self._opened_at < self.cooldown:
+				raise CircuitOpenError(self._open_message())
+
+			# 冷却结束，进入半开状态
+			self.state = CircuitState.HALF_OPEN
+			logger.info('熔断冷却结束，放行一次探测请求', tag='熔断')
+
+		if self.state == CircuitState.HALF_OPEN:
+			if self._probe_in_flight:
+				raise CircuitOpenError(self._open_message())
+			self._probe_in_flight = True
+
+		return CircuitAttempt(self)
+
+	def _finish(self, attempt: CircuitAttempt):
+		"""根据处理结果更新熔断器状态"""
+		was_probe = self.state == CircuitState.HALF_OPEN
+		self._probe_in_flight = False
+
+		if attempt.failure is not None:
+			self._on_failure(attempt.failure, was_probe)
+		elif attempt.reached:
+			self._on_success(was_probe)
+
+	def _on_success(self, was_probe: bool):
+		"""站点正常响应"""
+		if was_probe:
+			logger.info('探测请求成功，熔断解除', tag='熔断')
+		self.state = CircuitState.CLOSED
+		self.last_failure = None
+		self._streak = 0
+
+	def _on_failure(self, kind: FailureKind, was_probe: bool):
+		"""站点级失败"""
+		# 只累计同一类失败，类型变化时重新计数
+		if kind == self.last_failure:
+			self._streak += 1
+		else:
+			self.last_failure = kind
+			self._streak = 1
+
+		if was_probe or self._streak >= self.failure_threshold:
+			if self.state != CircuitState.OPEN:
+				logger.warning(
+					f'连续 {self._streak} 个账号出现{kind.get_tag()}，触发熔断，{self.cooldown:.0f} 秒内的账号将直接失败',
+					tag='熔断',
+				)
+			self.state = CircuitState.OPEN
+			self._opened_at = time.monotonic()
+
+	def _open_message(self) -> str:
+		"""熔断状态下的失败原因"""
+		reason = self.last_failure.get_tag() if self.last_failure else '站点异常'
+		return f'AnyRouter 连续出现{reason}，已熔断跳过'
@@ -1,38 +1,69 @@
 import os
+from collections import Counter
+from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 
 from core.models import AccountResult
 from core.privacy_handler import PrivacyHandler
+from core.summary_writer import SummaryWriter
 from tools.logger import logger
 
+# 账号表格的一个分区：(标题, 表头行, (展示名称, 结果) 列表, 生成表格行的函数)
+SummarySection = tuple[str, list[str], list[tuple[str, AccountResult]], Callable[[str, AccountResult], str]]
+
 
 class GitHubReporter:
 	"""GitHub Actions 报告生成器"""
 
 	ENV_GITHUB_STEP_SUMMARY = 'GITHUB_STEP_SUMMARY'
 
-	def __init__(self, privacy_handler: PrivacyHandler):
+	# Step Summary 的大小上限（GitHub 超过 1 MiB 会截断）
+	SUMMARY_MAX_BYTES = 1024 * 1024
+
+	# 逐行写入账号表格时为汇总视图保留的空间
+	COMPACT_RESERVE_BYTES = 16 * 1024
+
+	# 汇总视图中最多展示的失败原因种类与每种原因的最大长度
+	COMPACT_TOP_ERRORS = 10
+	COMPACT_ERROR_LENGTH = 100
+
+	def __init__(
+		self,
+		privacy_handler: PrivacyHandler,
+		full_summary_file: Path,
+		max_bytes: int = SUMMARY_MAX_BYTES,
+	):
 		"""
 		初始化 GitHub 报告生成器
 
 		Args:
 			privacy_handler: 隐私保护处理器
+			full_summary_file: Step Summary 空间不足时写入完整账号列表的文件（作为 Artifact 上传）
+			max_bytes: Step Summary 的大小上限（字节）
 		"""
 		self.privacy_handler = privacy_handler
+		self.full_summary_file = full_summary_file
+		self.max_bytes = max_bytes
 
 	def generate_summary(
 		self,
 		success_count: int,
 		total_count: int,
 		account_results: list[AccountResult],
+		account_names: list[str] | None = None,
 	):
 		"""
 		生成 GitHub Actions Step Summary
 
+		账号表格逐行写入并统计字节数，即将超过大小上限时停止写入表格，改为写入按状态汇总的紧凑视图，
+		完整的账号列表写入单独的文件。
+
 		Args:
 			success_count: 成功数量
 			total_count: 总数量
 			account_results: 账号结果列表
+			account_names: Summary 中展示的账号名称（与 account_results 一一对应），None 表示使用结果中的名称
 		"""
 		# 检查是否在 GitHub Actions 环境中运行
 		summary_file = os.getenv(self.ENV_GITHUB_STEP_SUMMARY)
@@ -41,17 +72,19 @@ class GitHubReporter:
 			return
 
 		try:
-			# 分组账号
-			success_accounts = [acc for acc in account_results if acc.status == 'success']
-			failed_accounts = [acc for acc in account_results if acc.status != 'success']
+			# 分组账号（同时保留展示名称）
+			if account_names is None:
+				account_names = [acc.name for acc in account_results]
+			named_results = list(zip(account_names, account_results))
+			success_accounts = [(name, acc) for name, acc in named_results if acc.status == 'success']
+			failed_accounts = [(name, acc) for name, acc in named_results if acc.status != 'success']
 
 			failed_count = total_count - success_count
 			has_success = len(success_accounts) > 0
 			has_failed = len(failed_accounts) > 0
 			all_success = len(failed_accounts) == 0
-			all_failed = len(success_accounts) == 0
 
-			# 构建 markdown 字符串
+			# 构建标题与详细信息
 			lines = []
 
 			# 主标题
@@ -73,51 +106,188 @@ class GitHubReporter:
 			lines.append(f'- **执行时间**：{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
 			lines.append(f'- **成功比例**：{success_count}/{total_count}')
 			lines.append(f'- **失败比例**：{failed_count}/{total_count}')
+
+			# 有重试时才展示重试次数
+			retry_count = sum(acc.retry_count for acc in account_results)
+			if retry_count > 0:
+				lines.append(f'- **重试次数**：{retry_count}')
 			lines.append('')
 
-			# 成功账号表格
-			if has_success:
-				lines.append('### 成功账号')
-				if self.privacy_handler.show_sensitive_info:
-					# 显示详细余额信息
-					lines.append('| 账号 | 剩余（$） | 已用（$） |')
-					lines.append('| :----- | :---- | :---- |')
-					for account in success_accounts:
-						lines.append(f'|{account.name}|{account.quota}|{account.used}|')
-				else:
-					# 脱敏模式：只显示账号和状态
-					lines.append('| 账号 | 状态 |')
-					lines.append('| :----- | :---- |')
-					for account in success_accounts:
-						lines.append(f'|{account.name}|✅ 签到成功|')
-				lines.append('')
+			sections = self._build_sections(success_accounts, failed_accounts)
 
-			# 失败账号表格
-			if has_failed:
-				lines.append('### 失败账号')
-				if self.privacy_handler.show_sensitive_info:
-					# 显示详细错误信息
-					lines.append('| 账号 | 错误原因 |')
-					lines.append('| :----- | :----- |')
-					for account in failed_accounts:
-						error_msg = account.error if account.error else '未知错误'
-						lines.append(f'|{account.name}|{error_msg}|')
-				else:
-					# 脱敏模式：只显示账号和简单错误提示
-					lines.append('| 账号 | 状态 |')
-					lines.append('| :----- | :----- |')
-					for account in failed_accounts:
-						lines.append(f'|{account.name}|❌ 签到失败|')
-
-			# 拼接成最终字符串
-			summary_content = '\n'.join(lines)
-
-			# 写入 summary 文件
-			with open(summary_file, 'a', encoding='utf-8') as f:
-				f.write(summary_content)
-				f.write('\n')
+			# 同一步骤中已写入的内容同样计入大小上限
+			summary_path = Path(summary_file)
+			existing_bytes = summary_path.stat().st_size if summary_path.exists() else 0
+
+			with open(summary_path, 'a', encoding='utf-8') as f:
+				# 标题与详细信息同样为汇总视图保留空间，已有内容较多时直接写入汇总视图
+				writer = SummaryWriter(f, max_bytes=self.max_bytes - existing_bytes)
+				if not (self._write_lines(writer, lines) and self._write_sections(writer, sections)):
+					# 空间不足时完整列表写入单独的文件，Step Summary 改为汇总视图
+					self._write_full_summary(sections)
+					self._write_compact_view(writer, named_results)
+					logger.info(
+						f'Step Summary 即将超过大小上限，已改为汇总视图，完整的账号列表写入 {self.full_summary_file}',
+						tag='Summary',
+					)
 
 			logger.info('GitHub Actions Step Summary 生成成功', tag='Summary')
 
 		except Exception as e:
 			logger.warning(f'生成 GitHub Actions Step Summary 失败：{e}', tag='Summary')
+
+	def _build_sections(
+		self,
+		success_accounts: list[tuple[str, AccountResult]],
+		failed_accounts: list[tuple[str, AccountResult]],
+	) -> list[SummarySection]:
+		"""
+		构建成功与失败账号表格（表格行在写入时才逐行生成）
+
+		Args:
+			success_accounts: 成功账号的 (展示名称, 结果) 列表
+			failed_accounts: 失败账号的 (展示名称, 结果) 列表
+
+		Returns:
+			list[SummarySection]: 非空的表格分区
+		"""
+		sections: list[SummarySection] = []
+
+		# 成功账号表格
+		if success_accounts:
+			if self.privacy_handler.show_sensitive_info:
+				# 显示详细余额信息
+				sections.append((
+					'### 成功账号',
+					['| 账号 | 剩余（$） | 已用（$） |', '| :----- | :---- | :---- |'],
+					success_accounts,
+					lambda name, account: f'|{name}|{account.quota}|{account.used}|',
+				))
+			else:
+				# 脱敏模式：只显示账号和状态
+				sections.append((
+					'### 成功账号',
+					['| 账号 | 状态 |', '| :----- | :---- |'],
+					success_accounts,
+					lambda name, account: f'|{name}|✅ 签到成功|',
+				))
+
+		# 失败账号表格
+		if failed_accounts:
+			if self.privacy_handler.show_sensitive_info:
+				# 显示详细错误信息
+				sections.append((
+					'### 失败账号',
+					['| 账号 | 错误原因 |', '| :----- | :----- |'],
+					failed_accounts,
+					lambda name, account: f'|{name}|{account.error if account.error else "未知错误"}|',
+				))
+			else:
+				# 脱敏模式：只显示账号和简单错误提示
+				sections.append((
+					'### 失败账号',
+					['| 账号 | 状态 |', '| :----- | :----- |'],
+					failed_accounts,
+					lambda name, account: f'|{name}|{"⏭️ 未执行" if account.status == "skipped" else "❌ 签到失败"}|',
+				))
+
+		return sections
+
+	def _write_lines(self, writer: SummaryWriter, lines: list[str]) -> bool:
+		"""
+		逐行写入，剩余空间不足以容纳汇总视图时停止
+
+		Args:
+			writer: Step Summary 写入器
+			lines: 要写入的行
+
+		Returns:
+			bool: 全部写入时返回 True，因空间不足停止时返回 False
+		"""
+		return all(writer.try_write(line, reserve=self.COMPACT_RESERVE_BYTES) for line in lines)
+
+	def _write_sections(self, writer: SummaryWriter, sections: list[SummarySection]) -> bool:
+		"""
+		逐行写入账号表格，剩余空间不足以容纳汇总视图时停止
+
+		Args:
+			writer: Step Summary 写入器
+			sections: 表格分区
+
+		Returns:
+			bool: 全部写入时返回 True，因空间不足停止时返回 False
+		"""
+		for title, header, accounts, format_row in sections:
+			if not self._write_lines(writer, [title, *header]):
+				return False
+
+			for name, account in accounts:
+				if not writer.try_write(format_row(name, account), reserve=self.COMPACT_RESERVE_BYTES):
+					return False
+
+			writer.write()
+
+		return True
+
+	def _write_full_summary(self, sections: list[SummarySection]):
+		"""
+		把完整的账号表格写入单独的文件
+
+		Args:
+			sections: 表格分区
+		"""
+		self.full_summary_file.parent.mkdir(parents=True, exist_ok=True)
+		with open(self.full_summary_file, 'w', encoding='utf-8') as f:
+			f.write('## 🎯 AnyRouter 签到结果（完整账号列表）\n\n')
+			for title, header, accounts, format_row in sections:
+				f.write(f'{title}\n')
+				for line in header:
+					f.write(f'{line}\n')
+				for name, account in accounts:
+					f.write(f'{format_row(name, account)}\n')
+				f.write('\n')
+
+	def _write_compact_view(self, writer: SummaryWriter, named_results: list[tuple[str, AccountResult]]):
+		"""
+		写入按状态汇总的紧凑视图（剩余空间连汇总视图都放不下时写到放不下为止，不会超过大小上限）
+
+		Args:
+			writer: Step Summary 写入器
+			named_results: (展示名称, 结果) 列表
+		"""
+		status_counts = Counter(account.status for _, account in named_results)
+
+		lines = [
+			'',
+			(
+				f'> 账号数量较多，Step Summary 即将超过大小上限，以上表格未完整展示。'
+				f'完整的账号列表见 Artifact 中的 `{self.full_summary_file.name}`'
+			),
+			'',
+			'### 汇总',
+			'| 状态 | 账号数量 |',
+			'| :----- | :---- |',
+			f'|✅ 签到成功|{status_counts["success"]}|',
+			f'|❌ 签到失败|{status_counts["failed"]}|',
+		]
+		if status_counts['skipped']:
+			lines.append(f'|⏭️ 未执行|{status_counts["skipped"]}|')
+		lines.append('')
+
+		# 显示敏感信息时按失败原因汇总（原因可能包含账号相关信息，脱敏模式下不展示）
+		if self.privacy_handler.show_sensitive_info:
+			error_counts = Counter(
+				(account.error or '未知错误')[: self.COMPACT_ERROR_LENGTH]
+				for _, account in named_results
+				if account.status != 'success'
+			)
+			if error_counts:
+				lines.append(f'### 失败原因（前 {self.COMPACT_TOP_ERRORS} 种）')
+				lines.append('| 错误原因 | 账号数量 |')
+				lines.append('| :----- | :---- |')
+				lines.extend(f'|{error}|{count}|' for error, count in error_counts.most_common(self.COMPACT_TOP_ERRORS))
+				lines.append('')
+
+		for line in lines:
+			if not writer.try_write(line):
+				return
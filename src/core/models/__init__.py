@@ -1,9 +1,21 @@
+from core.models.account_config import AccountConfig
+from core.models.account_job import AccountJob
+from core.models.account_outcome import AccountOutcome
 from core.models.account_result import AccountResult
+from core.models.balance_hash_state import BalanceHashState
 from core.models.notification_data import NotificationData
 from core.models.notification_stats import NotificationStats
+from core.models.shard_fragment import ShardFragment
+from core.models.shard_spec import ShardSpec
 
 __all__ = [
+	'AccountConfig',
+	'AccountJob',
+	'AccountOutcome',
 	'AccountResult',
+	'BalanceHashState',
 	'NotificationStats',
 	'NotificationData',
+	'ShardFragment',
+	'ShardSpec',
 ]
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class AccountConfig:
+	"""单个账号的配置（加载、覆盖、去重与验证完成后的不可变记录）"""
+
+	# API 用户标识
+	api_user: str
+
+	# 登录后的 cookies（字符串或字典格式）
+	cookies: str | dict[str, str]
+
+	# 完整的账号名称（未配置 name 时为 "账号 N"），用于通知与结果
+	full_name: str
+
+	# 按隐私设置脱敏后的账号名称，用于日志与 Step Summary
+	safe_name: str
+
+	@classmethod
+	def from_dict(cls, data: dict[str, Any], full_name: str, safe_name: str) -> 'AccountConfig':
+		"""
+		从已验证的账号配置字典创建记录（忽略必需字段以外的字段）
+
+		账号名称在加载时按最终索引计算一次，后续的日志、结果与报告直接复用，不再重复脱敏
+
+		Args:
+			data: 包含 cookies 与 api_user 的账号配置
+			full_name: 完整的账号名称
+			safe_name: 脱敏后的账号名称
+
+		Returns:
+			AccountConfig: 账号配置
+		"""
+		return cls(api_user=str(data['api_user']), cookies=data['cookies'], full_name=full_name, safe_name=safe_name)
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from core.models.account_config import AccountConfig
+
+
+@dataclass(frozen=True, slots=True)
+class AccountJob:
+	"""单个账号的执行任务（可跨进程传递）"""
+
+	# 账号在完整配置中的索引
+	index: int
+
+	# 账号配置
+	account: AccountConfig
+
+	# 今日是否已签到（已签到时跳过 WAF 与签到步骤）
+	already_checked_in: bool = False
+
+	# 今日已签到时是否仍刷新一次余额
+	refresh_balance: bool = True
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class AccountOutcome:
+	"""单个账号的执行结果（可跨进程传递），余额对比与通知由协调方统一处理"""
+
+	# 账号在完整配置中的索引
+	index: int
+
+	# 执行状态：success、failed 或 skipped（超出运行时间预算未执行）
+	status: str
+
+	# 用户信息（包含余额），未获取到时为 None
+	user_info: dict[str, Any] | None = None
+
+	# 执行异常时的错误信息（熔断、超时、意外异常）
+	error: str | None = None
+
+	# 是否因今日已签到而跳过了签到步骤
+	already_checked_in: bool = False
+
+	# 是否需要记入签到台账（熔断与意外异常不属于账号自身的失败）
+	record_ledger: bool = True
+
+	# 处理过程中的重试次数
+	retry_count: int = 0
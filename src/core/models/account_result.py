@@ -1,14 +1,14 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AccountResult:
 	"""单个账号的处理结果"""
 
 	# 账号名称
 	name: str
 
-	# 处理状态：success 或 failed
+	# 处理状态：success、failed 或 skipped（超出运行时间预算未执行）
 	status: str
 
 	# 当前余额，成功时才有
@@ -22,3 +22,9 @@ class AccountResult:
 
 	# 错误信息，失败时才有
 	error: str | None = None
+
+	# 是否因今日已签到而跳过了签到步骤
+	already_checked_in: bool = False
+
+	# 处理过程中的重试次数（WAF、余额和签到请求的重试总和）
+	retry_count: int = 0
@@ -0,0 +1,176 @@
+import hashlib
+import struct
+from collections.abc import Iterator
+
+
+class BalanceHashState:
+	"""
+	紧凑格式的余额 hash 状态
+
+	文件结构：固定长度的头部 + 按账号摘要排序的定长记录数组。
+	每条记录由「账号标识摘要 + 余额摘要」组成，查找时直接在字节数组上二分，
+	无需解析整个文件，也不会在内存中构建字典。
+	"""
+
+	# 文件魔数，用于区分旧版 JSON 格式
+	MAGIC = b'ARBH'
+
+	# 当前格式版本
+	VERSION = 1
+
+	# 摘要长度（BLAKE2b 截断到 16 字节）
+	DIGEST_SIZE = 16
+
+	# 头部结构：魔数、版本号、摘要长度、记录数量
+	HEADER = struct.Struct('<4sBBI')
+
+	def __init__(self, buffer: bytes, count: int):
+		"""
+		初始化余额 hash 状态
+
+		Args:
+			buffer: 记录区的字节数据（不包含头部），记录必须按账号摘要升序排列
+			count: 记录数量
+		"""
+		self._buffer = buffer
+		self._count = count
+		self._record_size = self.DIGEST_SIZE * 2
+
+	@classmethod
+	def from_bytes(cls, data: bytes) -> 'BalanceHashState':
+		"""
+		从文件内容解析余额 hash 状态
+
+		Args:
+			data: 文件的完整字节内容
+
+		Returns:
+			余额 hash 状态
+
+		Raises:
+			ValueError: 当文件头或记录长度不合法时抛出
+		"""
+		if len(data) < cls.HEADER.size:
+			raise ValueError('文件长度不足')
+
+		magic, version, digest_size, count = cls.HEADER.unpack_from(data)
+		if magic != cls.MAGIC:
+			raise ValueError('文件魔数不匹配')
+		if version != cls.VERSION:
+			raise ValueError(f'不支持的格式版本：{version}')
+		if digest_size != cls.DIGEST_SIZE:
+			raise ValueError(f'不支持的摘要长度：{digest_size}')
+
+		buffer = data[cls.HEADER.size :]
+		if len(buffer) != count * cls.DIGEST_SIZE * 2:
+			raise ValueError('记录区长度与记录数量不一致')
+
+		return cls(buffer=buffer, count=count)
+
+	@classmethod
+	def from_records(cls, records: dict[bytes, bytes]) -> 'BalanceHashState':
+		"""
+		从摘要记录构建余额 hash 状态
+
+		Args:
+			records: 字典格式 {账号标识摘要: 余额摘要}
+
+		Returns:
+			余额 hash 状态
+		"""
+		buffer = b''.join(key + records[key] for key in sorted(records))
+		return cls(buffer=buffer, count=len(records))
+
+	@classmethod
+	def from_hash_dict(cls, balance_hash_dict: dict[str, str]) -> 'BalanceHashState':
+		"""
+		从 hash 字典构建余额 hash 状态（同时用于旧版 JSON 文件的迁移）
+
+		Args:
+			balance_hash_dict: 字典格式 {api_user_hash: balance_hash}
+
+		Returns:
+			余额 hash 状态
+		"""
+		return cls.from_records({
+			cls.digest(account_key): cls.digest(balance_hash)
+			for account_key, balance_hash in balance_hash_dict.items()
+		})  # fmt: skip
+
+	@classmethod
+	def digest(cls, value: str) -> bytes:
+		"""
+		计算定长摘要
+
+		Args:
+			value: 原始字符串（账号标识或余额 hash）
+
+		Returns:
+			截断后的 BLAKE2b 摘要
+		"""
+		return hashlib.blake2b(value.encode('utf-8'), digest_size=cls.DIGEST_SIZE).digest()
+
+	def to_bytes(self) -> bytes:
+		"""序列化为文件内容"""
+		header = self.HEADER.pack(self.MAGIC, self.VERSION, self.DIGEST_SIZE, self._count)
+		return header + self._buffer
+
+	def get(self, account_key: str) -> bytes | None:
+		"""
+		获取账号的余额摘要
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+
+		Returns:
+			余额摘要，账号不存在时返回 None
+		"""
+		return self._find(self.digest(account_key))
+
+	def is_changed(self, account_key: str, balance_hash: str) -> bool | None:
+		"""
+		判断账号余额是否发生变化
+
+		Args:
+			account_key: 账号标识（api_user 的 hash）
+			balance_hash: 当前余额 hash
+
+		Returns:
+			有历史记录时返回是否变化，没有历史记录时返回 None
+		"""
+		last_digest = self.get(account_key)
+		if last_digest is None:
+			return None
+		return last_digest != self.digest(balance_hash)
+
+	def records(self) -> Iterator[tuple[bytes, bytes]]:
+		"""按顺序遍历所有 (账号标识摘要, 余额摘要) 记录"""
+		size = self.DIGEST_SIZE
+		for offset in range(0, self._count * self._record_size, self._record_size):
+			yield (
+				self._buffer[offset : offset + size],
+				self._buffer[offset + size : offset + self._record_size],
+			)
+
+	def _find(self, key_digest: bytes) -> bytes | None:
+		"""在有序记录区上二分查找"""
+		size = self.DIGEST_SIZE
+		low, high = 0, self._count
+		while low < high:
+			middle = (low + high) // 2
+			offset = middle * self._record_size
+			current = self._buffer[offset : offset + size]
+			if current == key_digest:
+				return self._buffer[offset + size : offset + self._record_size]
+			if current < key_digest:
+				low = middle + 1
+			else:
+				high = middle
+
+		return None
+
+	def __contains__(self, account_key: object) -> bool:
+		return isinstance(account_key, str) and self.get(account_key) is not None
+
+	def __len__(self) -> int:
+		return self._count
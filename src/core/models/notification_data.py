@@ -4,7 +4,7 @@ from core.models.account_result import AccountResult
 from core.models.notification_stats import NotificationStats
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationData:
 	"""通知数据结构"""
 
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationStats:
 	"""通知统计信息"""
 
@@ -13,3 +13,6 @@ class NotificationStats:
 
 	# 总数量
 	total_count: int
+
+	# 因超出运行时间预算而跳过的数量（包含在失败数量中）
+	skipped_count: int = 0
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+
+from core.models.account_result import AccountResult
+from core.models.balance_hash_state import BalanceHashState
+from core.models.shard_spec import ShardSpec
+
+
+@dataclass
+class ShardFragment:
+	"""单个分片的处理结果，由 merge 子命令合并"""
+
+	# 分片配置
+	shard: ShardSpec
+
+	# 分片运行时加载到的账号总数（用于校验各分片的账号配置一致）
+	total_accounts: int
+
+	# 分片运行时是否没有余额历史
+	is_first_run: bool
+
+	# 账号结果，key 为账号在完整配置中的索引（不包含账号名称，合并时重新生成）
+	results: dict[int, AccountResult] = field(default_factory=dict)
+
+	# 当前分片账号的余额状态
+	balance_state: BalanceHashState | None = None
+
+	# 当前分片账号的签到台账记录
+	ledger_entries: dict[str, dict] = field(default_factory=dict)
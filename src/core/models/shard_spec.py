@@ -0,0 +1,62 @@
+import hashlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+	"""账号分片配置，例如 2/8 表示共 8 个分片中的第 2 个"""
+
+	# 分片序号（从 1 开始）
+	index: int
+
+	# 分片总数
+	count: int
+
+	@classmethod
+	def parse(cls, value: str) -> 'ShardSpec':
+		"""
+		解析 `序号/总数` 格式的分片配置
+
+		Args:
+			value: 分片配置字符串，例如 `2/8`
+
+		Returns:
+			分片配置
+
+		Raises:
+			ValueError: 格式无效或序号超出范围时抛出
+		"""
+		index_text, separator, count_text = value.strip().partition('/')
+		if not separator:
+			raise ValueError(f'分片配置 {value} 格式无效，应为「序号/总数」，例如 2/8')
+
+		try:
+			index = int(index_text)
+			count = int(count_text)
+		except ValueError:
+			raise ValueError(f'分片配置 {value} 格式无效，序号与总数必须是整数') from None
+
+		if count < 1 or not 1 <= index <= count:
+			raise ValueError(f'分片配置 {value} 无效，序号必须在 1 到 {max(count, 1)} 之间')
+
+		return cls(index=index, count=count)
+
+	@property
+	def label(self) -> str:
+		"""分片标识（用于文件名）"""
+		return f'{self.index}-of-{self.count}'
+
+	def owns(self, api_user: str) -> bool:
+		"""
+		判断账号是否属于当前分片
+
+		按 api_user 的 SHA256 取模划分，与账号顺序和进程无关，同一账号总是落在同一个分片。
+
+		Args:
+			api_user: API 用户标识
+
+		Returns:
+			属于当前分片返回 True
+		"""
+		digest = hashlib.sha256(api_user.encode('utf-8')).digest()
+		return int.from_bytes(digest[:8], 'big') % self.count == self.index - 1
@@ -21,6 +21,9 @@ class PrivacyHandler:
 		"""
 		self.show_sensitive_info = show_sensitive_info
 
+		# 脱敏结果缓存（原始值 -> 脱敏值），同一账号名或环境变量后缀只计算一次哈希
+		self._masked_values: dict[str, str] = {}
+
 	@staticmethod
 	def should_show_sensitive_info() -> bool:
 		"""
@@ -66,7 +69,7 @@ class PrivacyHandler:
 			完整的账号名称
 		"""
 		# 获取原始名称并去除首尾空格
-		name = account_info.get('name', '').strip()
+		name = (account_info.get('name') or '').strip()
 
 		# 如果没有配置 name 或者 name 是空字符串（包括纯空格的情况）
 		if not name:
@@ -90,7 +93,18 @@ class PrivacyHandler:
 			account_info=account_info,
 			account_index=account_index,
 		)
+		return self.mask_account_name(full_name)
+
+	def mask_account_name(self, full_name: str) -> str:
+		"""
+		对完整的账号名称脱敏（根据隐私设置）
 
+		Args:
+			full_name: 完整的账号名称
+
+		Returns:
+			脱敏时返回 "首字符 + hash 后 4 位"，否则返回完整名称
+		"""
 		# 如果不需要脱敏，直接返回完整名称
 		if self.show_sensitive_info:
 			return full_name
@@ -148,11 +162,14 @@ class PrivacyHandler:
 		if not value:
 			return value
 
-		# 统一使用“首字符 + 哈希前 4 位”的规则，
-		# 这样账号名、环境变量后缀和其他敏感标识在日志中的展示风格完全一致。
-		first_char = value[0]
-		value_hash = hashlib.sha256(value.encode('utf-8')).hexdigest()[:4]
-		return f'{first_char}{value_hash}'
+		masked = self._masked_values.get(value)
+		if masked is None:
+			# 统一使用“首字符 + 哈希前 4 位”的规则，
+			# 这样账号名、环境变量后缀和其他敏感标识在日志中的展示风格完全一致。
+			first_char = value[0]
+			value_hash = hashlib.sha256(value.encode('utf-8')).hexdigest()[:4]
+			masked = self._masked_values[value] = f'{first_char}{value_hash}'
+		return masked
 
 	def get_safe_balance_display(self, quota: float, used: float) -> str:
 		"""
@@ -0,0 +1,95 @@
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from core.models import AccountOutcome
+from tools.logger import logger
+
+
+class RunJournal:
+	"""
+	运行日志
+
+	每个账号签到成功后立即追加一行 JSON 并落盘，运行中途被终止（Runner 超时、Chromium OOM）时，
+	下一次以恢复模式运行可以跳过同一服务端自然日内已完成的账号，并把它们的结果重新计入通知与 Summary。
+	正常结束并保存余额状态后日志会被清空。
+	"""
+
+	# 日志格式版本
+	FORMAT_VERSION = 1
+
+	def __init__(self, journal_file: Path):
+		"""
+		初始化运行日志
+
+		Args:
+			journal_file: 日志文件路径
+		"""
+		self.journal_file = journal_file
+
+	def load(self, window: str) -> dict[str, AccountOutcome]:
+		"""
+		加载指定自然日内已完成账号的执行结果，其他日期的记录与无效的行（如写入一半时被终止）会被忽略
+
+		Args:
+			window: 服务端自然日（ISO 格式）
+
+		Returns:
+			dict[str, AccountOutcome]: 账号标识 -> 执行结果
+		"""
+		outcomes: dict[str, AccountOutcome] = {}
+		try:
+			if not self.journal_file.exists():
+				return outcomes
+
+			with open(self.journal_file, 'r', encoding='utf-8') as f:
+				lines = f.readlines()
+
+		except (OSError, IOError) as e:
+			logger.warning(f'读取运行日志失败：{e}', tag='恢复')
+			return outcomes
+
+		for line in lines:
+			try:
+				record = json.loads(line)
+				if record.get('version') != self.FORMAT_VERSION or record.get('window') != window:
+					continue
+				outcomes[record['account_key']] = AccountOutcome(**record['outcome'])
+			except (json.JSONDecodeError, AttributeError, KeyError, TypeError):
+				continue
+
+		return outcomes
+
+	def append(self, window: str, account_key: str, outcome: AccountOutcome):
+		"""
+		追加一个账号的执行结果并立即落盘
+
+		Args:
+			window: 服务端自然日（ISO 格式）
+			account_key: 账号标识（api_user 的 hash）
+			outcome: 执行结果
+		"""
+		record = {
+			'version': self.FORMAT_VERSION,
+			'window': window,
+			'account_key': account_key,
+			'outcome': asdict(outcome),
+		}
+
+		try:
+			self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+			with open(self.journal_file, 'a', encoding='utf-8') as f:
+				f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+				f.flush()
+				os.fsync(f.fileno())
+
+		except (OSError, IOError) as e:
+			logger.warning(f'写入运行日志失败：{e}', tag='恢复')
+
+	def clear(self):
+		"""清空运行日志"""
+		try:
+			self.journal_file.unlink(missing_ok=True)
+		except (OSError, IOError) as e:
+			logger.warning(f'清空运行日志失败：{e}', tag='恢复')
@@ -0,0 +1,94 @@
+import time
+from collections.abc import Callable
+
+from core.checkin_ledger import CheckinLedger
+
+
+class RunScheduler:
+	"""
+	运行调度器
+
+	负责两件事：
+	1. 根据签到台账确定账号的处理顺序：最久未成功的账号优先，长期连续失败的账号（通常是 cookies 过期）放到最后
+	2. 在配置了全局时间预算时，把剩余时间平均分配给尚未处理的账号，预算不足时停止处理剩余账号
+	"""
+
+	# 连续失败达到该次数的账号视为长期失败，排到最后处理
+	CHRONIC_FAILURE_THRESHOLD = 3
+
+	# 单个账号的最小时间预算（秒），剩余时间不足时不再开始新的账号
+	MIN_ACCOUNT_BUDGET = 15.0
+
+	def __init__(self, deadline: float | None, ledger: CheckinLedger | None = None):
+		"""
+		初始化运行调度器
+
+		Args:
+			deadline: 全局时间预算（秒），None 表示不限制
+			ledger: 签到台账，用于读取账号的历史成功与失败记录（只分配时间预算、不排序时可以为 None）
+		"""
+		self.deadline = deadline
+		self.ledger = ledger
+		self._started_at = time.monotonic()
+
+	def start(self):
+		"""开始计时"""
+		self._started_at = time.monotonic()
+
+	def order(self, account_keys: list[str]) -> list[int]:
+		"""
+		计算账号的处理顺序
+
+		Args:
+			account_keys: 按原始顺序排列的账号标识列表
+
+		Returns:
+			list[int]: 排序后的账号索引
+		"""
+		return sorted(range(len(account_keys)), key=self._priority_key(account_keys))
+
+	def remaining(self) -> float | None:
+		"""获取剩余时间（秒），未配置时间预算时返回 None"""
+		if self.deadline is None:
+			return None
+		return self.deadline - (time.monotonic() - self._started_at)
+
+	def next_budget(self, pending_count: int) -> float | None:
+		"""
+		为下一个账号分配时间预算
+
+		Args:
+			pending_count: 尚未处理的账号数量（包含即将处理的账号）
+
+		Returns:
+			float | None: 分配的时间预算（秒）；未配置时间预算时返回 None；剩余时间不足时返回 0
+		"""
+		remaining = self.remaining()
+		if remaining is None:
+			return None
+
+		# 剩余时间连最小预算都不够时，不再开始新的账号
+		if remaining < self.MIN_ACCOUNT_BUDGET:
+			return 0
+
+		# 平均分配剩余时间，但至少保证最小预算（后面的账号可能因此被跳过）
+		return min(remaining, max(remaining / max(pending_count, 1), self.MIN_ACCOUNT_BUDGET))
+
+	def _priority_key(self, account_keys: list[str]) -> Callable[[int], tuple[bool, float]]:
+		"""
+		构建排序键：(是否长期失败, 最近一次成功时间)，从未成功的账号时间视为 0
+
+		没有签到台账时所有账号的排序键相同，保持原有顺序
+		"""
+		ledger = self.ledger
+
+		def key(index: int) -> tuple[bool, float]:
+			if ledger is None:
+				return (False, 0.0)
+
+			account_key = account_keys[index]
+			is_chronic = ledger.get_consecutive_failures(account_key) >= self.CHRONIC_FAILURE_THRESHOLD
+			last_success_at = ledger.get_last_success_at(account_key) or 0.0
+			return (is_chronic, last_success_at)
+
+		return key
@@ -0,0 +1,127 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from core.models import AccountResult, BalanceHashState, ShardFragment, ShardSpec
+from tools.logger import logger
+
+
+class ShardStore:
+	"""
+	分片结果存储
+
+	每个分片写入两个文件：账号结果（JSON）与余额状态片段（与 balance_hash.txt 相同的紧凑格式）。
+	结果中不保存账号名称，避免上传为 Artifact 时泄露账号信息，合并时根据账号配置重新生成。
+	"""
+
+	# 结果文件格式版本
+	FORMAT_VERSION = 1
+
+	def __init__(self, shard_dir: Path):
+		"""
+		初始化分片结果存储
+
+		Args:
+			shard_dir: 分片结果所在目录
+		"""
+		self.shard_dir = shard_dir
+
+	def result_path(self, shard: ShardSpec) -> Path:
+		"""获取分片结果文件路径"""
+		return self.shard_dir / f'shard-{shard.label}.json'
+
+	def balance_path(self, shard: ShardSpec) -> Path:
+		"""获取分片余额状态文件路径"""
+		return self.shard_dir / f'balance_hash-{shard.label}.txt'
+
+	def write(self, fragment: ShardFragment):
+		"""
+		写入分片结果
+
+		Args:
+			fragment: 分片结果
+		"""
+		data = {
+			'version': self.FORMAT_VERSION,
+			'shard': fragment.shard.index,
+			'shard_count': fragment.shard.count,
+			'total_accounts': fragment.total_accounts,
+			'is_first_run': fragment.is_first_run,
+			'results': [
+				{'index': index, **{key: value for key, value in asdict(result).items() if key != 'name'}}
+				for index, result in sorted(fragment.results.items())
+			],
+			'ledger': fragment.ledger_entries,
+		}
+
+		try:
+			self.shard_dir.mkdir(parents=True, exist_ok=True)
+			with open(self.result_path(fragment.shard), 'w', encoding='utf-8') as f:
+				json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+			if fragment.balance_state is not None:
+				with open(self.balance_path(fragment.shard), 'wb') as f:
+					f.write(fragment.balance_state.to_bytes())
+
+			logger.info(f'分片结果已写入 {self.result_path(fragment.shard)}', tag='分片')
+
+		except (OSError, IOError) as e:
+			logger.error(f'写入分片结果失败：{e}', tag='分片')
+
+	def load(self) -> list[ShardFragment]:
+		"""
+		加载目录中所有分片的结果，格式无效的文件会被忽略
+
+		Returns:
+			list[ShardFragment]: 按分片序号排序的分片结果
+		"""
+		fragments: list[ShardFragment] = []
+		if not self.shard_dir.is_dir():
+			return fragments
+
+		for result_file in sorted(self.shard_dir.glob('shard-*.json')):
+			try:
+				fragments.append(self._load_fragment(result_file))
+			except (OSError, IOError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+				logger.warning(f'分片结果 {result_file.name} 无效，已忽略：{e}', tag='分片')
+
+		return sorted(fragments, key=lambda fragment: fragment.shard.index)
+
+	def _load_fragment(self, result_file: Path) -> ShardFragment:
+		"""
+		加载单个分片结果
+
+		Args:
+			result_file: 分片结果文件
+
+		Returns:
+			ShardFragment: 分片结果
+
+		Raises:
+			ValueError: 文件格式无效时抛出
+		"""
+		with open(result_file, 'r', encoding='utf-8') as f:
+			data = json.load(f)
+
+		if data.get('version') != self.FORMAT_VERSION:
+			raise ValueError(f'不支持的格式版本：{data.get("version")}')
+
+		shard = ShardSpec(index=int(data['shard']), count=int(data['shard_count']))
+		results = {
+			int(item.pop('index')): AccountResult(name='', **item)
+			for item in data['results']
+		}  # fmt: skip
+
+		balance_state = None
+		balance_file = self.balance_path(shard)
+		if balance_file.exists():
+			balance_state = BalanceHashState.from_bytes(balance_file.read_bytes())
+
+		return ShardFragment(
+			shard=shard,
+			total_accounts=int(data['total_accounts']),
+			is_first_run=bool(data['is_first_run']),
+			results=results,
+			balance_state=balance_state,
+			ledger_entries=data.get('ledger') or {},
+		)
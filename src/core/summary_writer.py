@@ -0,0 +1,71 @@
+from typing import IO
+
+
+class SummaryWriter:
+	"""
+	按行写入 Markdown 并统计已写入的字节数
+
+	GitHub Actions 的 Step Summary 超过 1 MiB 会被截断，写入前可以通过 fits 判断剩余空间，
+	在空间不足时改为写入更紧凑的内容。
+	"""
+
+	def __init__(self, stream: IO[str], max_bytes: int):
+		"""
+		初始化写入器
+
+		Args:
+			stream: 以文本模式打开的输出流
+			max_bytes: 最多写入的字节数（UTF-8 编码）
+		"""
+		self.stream = stream
+		self.max_bytes = max_bytes
+		self.written = 0
+
+	@property
+	def remaining(self) -> int:
+		"""剩余可写入的字节数"""
+		return max(self.max_bytes - self.written, 0)
+
+	def fits(self, line: str, reserve: int = 0) -> bool:
+		"""
+		判断写入一行后是否仍保留指定的剩余空间
+
+		Args:
+			line: 要写入的行（不含换行符）
+			reserve: 写入后至少保留的字节数
+
+		Returns:
+			bool: 空间足够时返回 True
+		"""
+		return self._line_size(line) + reserve <= self.remaining
+
+	def try_write(self, line: str = '', reserve: int = 0) -> bool:
+		"""
+		空间足够时写入一行
+
+		Args:
+			line: 要写入的行
+			reserve: 写入后至少保留的字节数
+
+		Returns:
+			bool: 写入时返回 True，空间不足未写入时返回 False
+		"""
+		if not self.fits(line, reserve):
+			return False
+		self.write(line)
+		return True
+
+	def write(self, line: str = ''):
+		"""
+		写入一行（自动添加换行符）
+
+		Args:
+			line: 要写入的行
+		"""
+		self.stream.write(f'{line}\n')
+		self.written += self._line_size(line)
+
+	@staticmethod
+	def _line_size(line: str) -> int:
+		"""一行（含换行符）的 UTF-8 字节数"""
+		return len(line.encode('utf-8')) + 1
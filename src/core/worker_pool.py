@@ -0,0 +1,212 @@
+import asyncio
+import multiprocessing
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+
+from core.account_executor import AccountExecutor, create_account_executor
+from core.models import AccountJob, AccountOutcome
+from core.run_scheduler import RunScheduler
+from tools.logger import logger
+
+
+class WorkerPool:
+	"""
+	多进程执行池
+
+	把账号任务按处理顺序轮流分配给多个工作进程，每个工作进程使用独立的浏览器、HTTP 客户端与熔断器，
+	限流速率与重试预算按工作进程数量平分，逐个执行后通过管道把 AccountOutcome 传回主进程。
+	状态文件（余额 hash、签到台账）只由主进程读写，工作进程不接触任何状态文件。
+	"""
+
+	def __init__(
+		self,
+		worker_count: int,
+		executor_factory: Callable[[int], AccountExecutor] = create_account_executor,
+	):
+		"""
+		初始化多进程执行池
+
+		Args:
+			worker_count: 工作进程数量
+			executor_factory: 在工作进程中创建账号执行器的函数，参数为工作进程数量（必须可以被 pickle，即模块级函数）
+		"""
+		self.worker_count = worker_count
+		self.executor_factory = executor_factory
+
+	def split(self, jobs: list[AccountJob]) -> list[list[AccountJob]]:
+		"""
+		按处理顺序轮流分配账号任务，优先处理的账号分散到各个工作进程的前面
+
+		Args:
+			jobs: 按处理顺序排列的账号任务
+
+		Returns:
+			list[list[AccountJob]]: 每个工作进程的任务列表（不包含空列表）
+		"""
+		batches = [jobs[worker::self.worker_count] for worker in range(self.worker_count)]  # fmt: skip
+		return [batch for batch in batches if batch]
+
+	async def run(self, jobs: list[AccountJob], deadline: float | None) -> AsyncIterator[AccountOutcome]:
+		"""
+		启动工作进程执行账号任务，按完成顺序逐个返回执行结果
+
+		工作进程异常退出时，尚未返回结果的账号会以失败结果返回，保证每个任务都有且只有一个结果。
+
+		Args:
+			jobs: 按处理顺序排列的账号任务
+			deadline: 剩余的全局时间预算（秒），None 表示不限制
+
+		Yields:
+			AccountOutcome: 账号执行结果
+		"""
+		batches = self.split(jobs)
+		if not batches:
+			return
+
+		logger.info(f'使用 {len(batches)} 个工作进程处理 {len(jobs)} 个账号', tag='进程池')
+		logger.flush()
+
+		# spawn 方式启动，避免 fork 时复制主进程中的事件循环与浏览器状态
+		context = multiprocessing.get_context('spawn')
+		queue: asyncio.Queue[AccountOutcome | None] = asyncio.Queue()
+		processes: list[multiprocessing.process.BaseProcess] = []
+		readers: list[asyncio.Task] = []
+
+		# 管道的 recv 是阻塞调用，每个工作进程使用一个线程读取
+		with ThreadPoolExecutor(max_workers=len(batches), thread_name_prefix='worker-pipe') as pipe_executor:
+			try:
+				for worker_id, batch in enumerate(batches, start=1):
+					receiver, sender = context.Pipe(duplex=False)
+					process = context.Process(
+						target=_worker_main,
+						args=(sender, batch, deadline, self.executor_factory, len(batches)),
+						name=f'checkin-worker-{worker_id}',
+						daemon=True,
+					)
+					process.start()
+					sender.close()
+					processes.append(process)
+					readers.append(
+						asyncio.create_task(self._read_outcomes(worker_id, receiver, batch, queue, pipe_executor))
+					)
+
+				finished = 0
+				while finished < len(readers):
+					outcome = await queue.get()
+					if outcome is None:
+						finished += 1
+						continue
+					yield outcome
+
+			finally:
+				for reader in readers:
+					reader.cancel()
+				for process in processes:
+					process.join(timeout=5)
+					if process.is_alive():
+						process.terminate()
+						process.join()
+
+	@staticmethod
+	async def _read_outcomes(
+		worker_id: int,
+		receiver: Connection,
+		batch: list[AccountJob],
+		queue: asyncio.Queue[AccountOutcome | None],
+		pipe_executor: ThreadPoolExecutor,
+	):
+		"""
+		读取单个工作进程返回的执行结果，结束时放入 None 作为结束标记
+
+		Args:
+			worker_id: 工作进程编号（用于日志）
+			receiver: 管道的接收端
+			batch: 分配给该工作进程的账号任务
+			queue: 汇总执行结果的队列
+			pipe_executor: 执行阻塞读取的线程池
+		"""
+		loop = asyncio.get_running_loop()
+		received: set[int] = set()
+		try:
+			while True:
+				outcome = await loop.run_in_executor(pipe_executor, receiver.recv)
+				if outcome is None:
+					break
+				received.add(outcome.index)
+				await queue.put(outcome)
+		except (EOFError, OSError):
+			logger.error(f'工作进程 {worker_id} 异常退出', tag='进程池')
+		finally:
+			receiver.close()
+
+		# 没有返回结果的账号按失败处理（不计入账号自身的失败历史）
+		for job in batch:
+			if job.index not in received:
+				await queue.put(
+					AccountOutcome(
+						index=job.index,
+						status='failed',
+						error='工作进程异常退出，未获取到签到结果',
+						record_ledger=False,
+					)
+				)
+		await queue.put(None)
+
+
+def _worker_main(
+	sender: Connection,
+	jobs: list[AccountJob],
+	deadline: float | None,
+	executor_factory: Callable[[int], AccountExecutor],
+	worker_count: int,
+):
+	"""
+	工作进程入口
+
+	Args:
+		sender: 管道的发送端
+		jobs: 分配给该工作进程的账号任务
+		deadline: 剩余的全局时间预算（秒），None 表示不限制
+		executor_factory: 创建账号执行器的函数
+		worker_count: 工作进程数量
+	"""
+	try:
+		asyncio.run(_run_jobs(sender, jobs, deadline, executor_factory, worker_count))
+	except Exception as e:
+		logger.error(message=f'工作进程执行失败：{e}', tag='进程池', exc_info=True)
+	finally:
+		# 先写出剩余日志再通知主进程结束，保证日志出现在最终结果之前
+		logger.flush()
+		try:
+			sender.send(None)
+		except (OSError, ValueError):
+			pass
+		sender.close()
+
+
+async def _run_jobs(
+	sender: Connection,
+	jobs: list[AccountJob],
+	deadline: float | None,
+	executor_factory: Callable[[int], AccountExecutor],
+	worker_count: int,
+):
+	"""
+	在工作进程中逐个执行账号任务，每完成一个立即传回主进程
+
+	Args:
+		sender: 管道的发送端
+		jobs: 分配给该工作进程的账号任务
+		deadline: 剩余的全局时间预算（秒），None 表示不限制
+		executor_factory: 创建账号执行器的函数
+		worker_count: 工作进程数量（限流速率与重试预算按该数量平分）
+	"""
+	executor = executor_factory(worker_count)
+	scheduler = RunScheduler(deadline=deadline)
+	scheduler.start()
+
+	for position, job in enumerate(jobs):
+		budget = scheduler.next_budget(pending_count=len(jobs) - position)
+		# 每个账号的日志在执行结束时按分组连续写出，多个工作进程的日志不会互相穿插
+		sender.send(await executor.execute(job, budget))
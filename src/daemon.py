@@ -0,0 +1,159 @@
+import asyncio
+import random
+import signal
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from application import Application
+from tools.cron import CronSchedule
+from tools.logger import logger
+
+
+class Daemon:
+	"""
+	常驻模式
+
+	按 cron 表达式定时签到（在触发时间上加入随机抖动），两次签到之间保持浏览器与已解析的通知配置常驻，
+	省去每次运行的启动开销。收到 SIGHUP 时重新加载配置；收到 SIGTERM 或 SIGINT 时等待当前签到结束后退出。
+	"""
+
+	def __init__(
+		self,
+		schedule: CronSchedule,
+		jitter: float = 0.0,
+		env_file: Path | None = None,
+		app_factory: Callable[[], Application] = Application,
+	):
+		"""
+		初始化常驻模式
+
+		Args:
+			schedule: 签到计划
+			jitter: 随机抖动上限（秒），实际签到时间在计划时间之后的 [0, jitter] 秒内
+			env_file: 配置文件（.env 格式），重新加载配置时会重新读取并覆盖同名环境变量
+			app_factory: 创建应用实例的函数，重新加载配置时会重新创建
+		"""
+		self.schedule = schedule
+		self.jitter = jitter
+		self.env_file = env_file
+		self.app_factory = app_factory
+		self.app: Application | None = None
+		self._wakeup = asyncio.Event()
+		self._stop_requested = False
+		self._reload_requested = False
+
+	async def serve(self):
+		"""启动常驻模式，直到收到退出信号"""
+		self._install_signal_handlers()
+		self._load_env_file()
+		self.app = self.app_factory()
+		await self.app.checkin_service.start_browser()
+		logger.info(f'常驻模式已启动，签到计划：{self.schedule.expression}', tag='常驻', show_timestamp=True)
+
+		try:
+			while not self._stop_requested:
+				if self._reload_requested:
+					await self._reload()
+
+				run_at = self._next_run_at(datetime.now())
+				logger.info(f'下一次签到时间：{run_at:%Y-%m-%d %H:%M:%S}', tag='常驻')
+				if await self._wait_until(run_at):
+					await self.run_once()
+
+		finally:
+			await self.app.checkin_service.stop_browser()
+			logger.info('常驻模式已退出', tag='常驻', show_timestamp=True)
+
+	async def run_once(self):
+		"""执行一次签到，结束后继续常驻"""
+		# 重试预算（签到与通知各一份）按每次签到计算
+		checkin_service = self.app.checkin_service
+		for policy in (checkin_service.retry_policy, checkin_service.notification_retry_policy):
+			if policy.budget is not None:
+				policy.budget.reset()
+
+		try:
+			await self.app.run()
+		except SystemExit as e:
+			# Application.run 结束时会以退出码表示签到结果，常驻模式下只记录日志
+			logger.info(f'本次签到结束，退出码 {e.code}', tag='常驻', show_timestamp=True)
+		except Exception as e:
+			logger.error(message=f'本次签到执行失败：{e}', tag='常驻', exc_info=True)
+
+	def stop(self):
+		"""请求退出（正在进行的签到会先执行完）"""
+		logger.info('收到退出信号，将在当前签到结束后退出', tag='常驻')
+		self._stop_requested = True
+		self._wakeup.set()
+
+	def reload(self):
+		"""请求重新加载配置（在两次签到之间生效）"""
+		logger.info('收到重新加载信号', tag='常驻')
+		self._reload_requested = True
+		self._wakeup.set()
+
+	async def _reload(self):
+		"""重新读取配置文件并重新创建应用实例（包括账号、通知配置与浏览器）"""
+		self._reload_requested = False
+		self._load_env_file()
+
+		await self.app.checkin_service.stop_browser()
+		self.app = self.app_factory()
+		await self.app.checkin_service.start_browser()
+		logger.info('配置已重新加载', tag='常驻')
+
+	def _load_env_file(self):
+		"""读取配置文件，覆盖同名环境变量"""
+		if self.env_file is None:
+			return
+
+		if not self.env_file.exists():
+			logger.warning(f'配置文件 {self.env_file} 不存在，使用当前环境变量', tag='常驻')
+			return
+
+		load_dotenv(self.env_file, override=True, interpolate=False)
+		logger.load_level_from_env()
+
+	def _next_run_at(self, now: datetime) -> datetime:
+		"""计算下一次签到时间（计划时间加上随机抖动）"""
+		return self.schedule.next_after(now) + timedelta(seconds=random.uniform(0, self.jitter))
+
+	async def _wait_until(self, run_at: datetime) -> bool:
+		"""
+		等待到指定时间
+
+		Args:
+			run_at: 目标时间
+
+		Returns:
+			bool: 正常到达目标时间返回 True，等待期间收到退出或重新加载信号返回 False
+		"""
+		self._wakeup.clear()
+		if self._stop_requested or self._reload_requested:
+			return False
+
+		# 等待期间不会有新日志，先写出缓冲区中的日志
+		logger.flush()
+
+		delay = max((run_at - datetime.now()).total_seconds(), 0.0)
+		try:
+			await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+		except TimeoutError:
+			return True
+		return False
+
+	def _install_signal_handlers(self):
+		"""注册信号处理（不支持信号处理的平台上忽略）"""
+		loop = asyncio.get_running_loop()
+		handlers = {'SIGTERM': self.stop, 'SIGINT': self.stop, 'SIGHUP': self.reload}
+		for name, handler in handlers.items():
+			sig = getattr(signal, name, None)
+			if sig is None:
+				continue
+			try:
+				loop.add_signal_handler(sig, handler)
+			except (NotImplementedError, RuntimeError):
+				pass
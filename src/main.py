@@ -1,15 +1,141 @@
+import argparse
 import asyncio
+import os
 import sys
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any
 
 from application import Application
+from core.checkin_service import CheckinService
+from core.models import ShardSpec
 from tools.logger import logger
+from tools.profiling import RunProfiler
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+	"""
+	解析命令行参数
+
+	Args:
+		argv: 命令行参数列表，None 表示使用 sys.argv
+
+	Returns:
+		解析结果
+	"""
+	parser = argparse.ArgumentParser(prog='autocheck-anyrouter', description='AnyRouter 多账号自动签到')
+	parser.add_argument(
+		'command',
+		nargs='?',
+		choices=['checkin', 'merge', 'daemon'],
+		default='checkin',
+		help='checkin：执行签到（默认）；merge：合并各分片的结果并发送通知；daemon：常驻并按计划定时签到',
+	)
+	parser.add_argument(
+		'--shard',
+		default=os.getenv(CheckinService.Config.Env.SHARD) or None,
+		help=f'只处理指定分片的账号，格式为「序号/总数」，例如 2/8（也可通过 {CheckinService.Config.Env.SHARD} 设置）',
+	)
+	parser.add_argument(
+		'--shard-dir',
+		type=Path,
+		default=Path(os.getenv(CheckinService.Config.Env.SHARD_DIR) or CheckinService.Config.File.SHARD_DIR_NAME),
+		help=f'分片结果目录，默认为 {CheckinService.Config.File.SHARD_DIR_NAME}（也可通过 {CheckinService.Config.Env.SHARD_DIR} 设置）',
+	)
+	parser.add_argument(
+		'--workers',
+		type=int,
+		default=os.getenv(CheckinService.Config.Env.WORKERS) or 1,
+		help=f'工作进程数量，大于 1 时使用多进程执行签到，默认为 1（也可通过 {CheckinService.Config.Env.WORKERS} 设置）',
+	)
+	parser.add_argument(
+		'--resume',
+		action='store_true',
+		default=os.getenv(CheckinService.Config.Env.RESUME, '').lower() == 'true',
+		help=f'从运行日志恢复上一次中断的运行，跳过今日已完成的账号（也可通过 {CheckinService.Config.Env.RESUME} 设置）',
+	)
+	parser.add_argument(
+		'--cron',
+		default=os.getenv(CheckinService.Config.Env.DAEMON_CRON) or CheckinService.Config.Daemon.DEFAULT_CRON,
+		help=f'常驻模式的签到计划（cron 表达式，使用本机时区），默认为 "{CheckinService.Config.Daemon.DEFAULT_CRON}"（也可通过 {CheckinService.Config.Env.DAEMON_CRON} 设置）',
+	)
+	parser.add_argument(
+		'--jitter',
+		type=float,
+		default=os.getenv(CheckinService.Config.Env.DAEMON_JITTER) or CheckinService.Config.Daemon.DEFAULT_JITTER,
+		help=f'常驻模式的随机抖动上限（秒），默认为 {CheckinService.Config.Daemon.DEFAULT_JITTER:.0f}（也可通过 {CheckinService.Config.Env.DAEMON_JITTER} 设置）',
+	)
+	parser.add_argument(
+		'--env-file',
+		type=Path,
+		default=None,
+		help='常驻模式的配置文件（.env 格式），启动与收到 SIGHUP 时读取',
+	)
+	return parser.parse_args(argv)
+
+
+def run_async(coroutine: Coroutine[Any, Any, Any]):
+	"""
+	执行协程，按环境变量开启性能分析（未开启时直接执行）
+
+	Args:
+		coroutine: 要执行的协程
+	"""
+	profiler = RunProfiler.from_env()
+	if profiler is None:
+		asyncio.run(coroutine)
+		return
+
+	with profiler:
+		profiler.run(coroutine)
 
 
 def run_main():
 	"""运行主函数的包装函数"""
 	try:
-		app = Application()
-		asyncio.run(app.run())
+		args = parse_args()
+
+		if args.command == 'merge':
+			app = Application(shard_dir=args.shard_dir)
+			run_async(app.merge())
+			return
+
+		shard = None
+		if args.shard:
+			try:
+				shard = ShardSpec.parse(args.shard)
+			except ValueError as e:
+				logger.error(str(e))
+				sys.exit(2)
+
+		if args.workers < 1:
+			logger.error(f'工作进程数量必须大于 0：{args.workers}')
+			sys.exit(2)
+
+		if args.command == 'daemon':
+			from daemon import Daemon
+			from tools.cron import CronSchedule
+
+			try:
+				schedule = CronSchedule(args.cron)
+			except ValueError as e:
+				logger.error(str(e))
+				sys.exit(2)
+
+			daemon = Daemon(
+				schedule=schedule,
+				jitter=max(args.jitter, 0.0),
+				env_file=args.env_file,
+				# 分片与恢复选项同样作用于每一次定时签到
+				app_factory=lambda: Application(
+					shard=shard, shard_dir=args.shard_dir, workers=args.workers, resume=args.resume
+				),
+			)
+			run_async(daemon.serve())
+			return
+
+		app = Application(shard=shard, shard_dir=args.shard_dir, workers=args.workers, resume=args.resume)
+		run_async(app.run())
 
 	except KeyboardInterrupt:
 		logger.warning('程序被用户中断')
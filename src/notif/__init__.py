@@ -1,9 +1,25 @@
+from typing import TYPE_CHECKING, Any
+
 from .models import NotifyTrigger
-from .notification_kit import NotificationKit
+from .notify_rules import NotifyRule, NotifyRuleMatcher
 from .trigger_manager import NotifyTriggerManager
 
+if TYPE_CHECKING:
+	from .notification_kit import NotificationKit
+
 __all__ = [
 	'NotificationKit',
+	'NotifyRule',
+	'NotifyRuleMatcher',
 	'NotifyTrigger',
 	'NotifyTriggerManager',
 ]
+
+
+def __getattr__(name: str) -> Any:
+	"""延迟导入 NotificationKit（会加载模板引擎与各平台发送器），仅在发送通知时才需要"""
+	if name == 'NotificationKit':
+		from .notification_kit import NotificationKit
+
+		return NotificationKit
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,7 +1,10 @@
+import asyncio
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import httpx
 import json5
 import stencil
 
@@ -26,23 +29,43 @@ from notif.senders import (
 	TelegramSender,
 	WeComSender,
 )
+from notif.senders.http_client import create_client
 from tools.logger import logger
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class NotificationKit:
-	def __init__(self):
+	def __init__(
+		self,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
+		"""
+		初始化通知编排器
+
+		Args:
+			retry_policy: 各平台发送器共享的重试策略，未提供时使用默认策略
+			rate_limiter: 各平台发送器共享的限流器，未提供时使用默认配置
+		"""
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
+
 		# 配置文件路径
 		self.config_dir = Path(__file__).parent / 'configs'
 
-		# 加载各平台配置
-		self.bark_config = self._load_bark_config()
-		self.email_config = self._load_email_config()
-		self.dingtalk_config = self._load_dingtalk_config()
-		self.feishu_config = self._load_feishu_config()
-		self.wecom_config = self._load_wecom_config()
-		self.pushplus_config = self._load_pushplus_config()
-		self.serverpush_config = self._load_serverpush_config()
-		self.telegram_config = self._load_telegram_config()
+		# 默认配置缓存（平台名称 -> 默认配置），同一平台的多个目标只读取一次配置文件
+		self._default_configs: dict[str, dict[str, Any] | None] = {}
+
+		# 加载各平台配置（每个平台可配置多个目标）
+		self.bark_configs = self._load_configs('BARK_NOTIF_CONFIG', self._load_bark_config)
+		self.email_configs = self._load_configs('EMAIL_NOTIF_CONFIG', self._load_email_config)
+		self.dingtalk_configs = self._load_configs('DINGTALK_NOTIF_CONFIG', self._load_dingtalk_config)
+		self.feishu_configs = self._load_configs('FEISHU_NOTIF_CONFIG', self._load_feishu_config)
+		self.wecom_configs = self._load_configs('WECOM_NOTIF_CONFIG', self._load_wecom_config)
+		self.pushplus_configs = self._load_configs('PUSHPLUS_NOTIF_CONFIG', self._load_pushplus_config)
+		self.serverpush_configs = self._load_configs('SERVERPUSH_NOTIF_CONFIG', self._load_serverpush_config)
+		self.telegram_configs = self._load_configs('TELEGRAM_NOTIF_CONFIG', self._load_telegram_config)
 
 		# 注册所有通知处理器
 		self._handlers = self._register_handlers()
@@ -62,37 +85,63 @@ class NotificationKit:
 		# 构建上下文数据
 		context_data = self._build_context_data(content)
 
-		# 向所有可用的 handler 发送通知
-		for handler in self._handlers:
-			if handler.is_available():
-				await self._send_to_handler(
-					handler=handler,
-					context_data=context_data,
+		# 相同模板的渲染结果（模板 -> (标题, 内容)），同一平台的多个目标共享一份渲染结果
+		rendered_cache: dict[tuple[str | None, str], tuple[str | None, str]] = {}
+
+		# 所有 handler 共享一个连接池，并发发送；每个请求仍按目标主机经过限流器
+		async with create_client(self.rate_limiter) as client:
+			await asyncio.gather(
+				*(
+					self._send_to_handler(
+						handler=handler,
+						context_data=context_data,
+						client=client,
+						rendered_cache=rendered_cache,
+					)
+					for handler in self._handlers
+					if handler.is_available()
 				)
+			)
 
-	async def _send_to_handler(self, handler: NotificationHandler, context_data: dict):
+	async def _send_to_handler(
+		self,
+		handler: NotificationHandler,
+		context_data: dict,
+		client: httpx.AsyncClient | None = None,
+		rendered_cache: dict[tuple[str | None, str], tuple[str | None, str]] | None = None,
+	):
 		"""
 		向单个 handler 发送通知
 
 		Args:
 			handler: 通知处理器
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，未提供时由发送器单独创建
+			rendered_cache: 本次推送的模板渲染缓存，未提供时每次重新渲染
 		"""
 		# 类型收窄：确保 config 不是 None
 		assert handler.config is not None
 
 		try:
-			# 渲染模板
-			rendered_title, rendered_content = self._render_template(
-				template=handler.config.template,
-				context_data=context_data,
-			)
+			# 渲染模板（相同模板只渲染一次）
+			template = handler.config.template
+			cache_key = (template.title, template.content)
+			rendered = rendered_cache.get(cache_key) if rendered_cache is not None else None
+			if rendered is None:
+				rendered = self._render_template(
+					template=template,
+					context_data=context_data,
+				)
+				if rendered_cache is not None:
+					rendered_cache[cache_key] = rendered
+			rendered_title, rendered_content = rendered
 
 			# 发送消息
 			await handler.send_func(
 				title=rendered_title,
 				content=rendered_content,
 				context_data=context_data,
+				client=client,
 			)
 
 			logger.success(f'{handler.name} 消息发送成功！')
@@ -111,25 +160,30 @@ class NotificationKit:
 		Returns:
 			通知处理器列表
 		"""
-		# 平台配置映射表：(平台名称, 配置对象, Sender 类)
+		# 平台配置映射表：(平台名称, 配置对象列表, Sender 类)
 		platform_configs = [
-			('Bark', self.bark_config, BarkSender),
-			('邮箱', self.email_config, EmailSender),
-			('PushPlus', self.pushplus_config, PushPlusSender),
-			('Server 酱', self.serverpush_config, ServerPushSender),
-			('钉钉', self.dingtalk_config, DingTalkSender),
-			('飞书', self.feishu_config, FeishuSender),
-			('企业微信', self.wecom_config, WeComSender),
-			('Telegram', self.telegram_config, TelegramSender),
+			('Bark', self.bark_configs, BarkSender),
+			('邮箱', self.email_configs, EmailSender),
+			('PushPlus', self.pushplus_configs, PushPlusSender),
+			('Server 酱', self.serverpush_configs, ServerPushSender),
+			('钉钉', self.dingtalk_configs, DingTalkSender),
+			('飞书', self.feishu_configs, FeishuSender),
+			('企业微信', self.wecom_configs, WeComSender),
+			('Telegram', self.telegram_configs, TelegramSender),
 		]
 
 		handlers = []
-		for name, config, sender_class in platform_configs:
-			if config:
-				sender = sender_class(config)
+		for name, configs, sender_class in platform_configs:
+			# 每个目标对应一个 handler，多个目标时用序号区分（不在日志中展示 Webhook 等敏感信息）
+			for index, config in enumerate(configs, start=1):
+				sender = sender_class(
+					config,
+					retry_policy=self.retry_policy,
+					rate_limiter=self.rate_limiter,
+				)
 				handlers.append(
 					NotificationHandler(
-						name=name,
+						name=f'{name} #{index}' if len(configs) > 1 else name,
 						config=config,
 						send_func=sender.send,
 					)
@@ -270,13 +324,39 @@ class NotificationKit:
 			'all_balance_unchanged': balance_determinable_count > 0 and len(balance_changed_accounts) == 0,
 		}
 
-	def _load_email_config(self) -> EmailConfig | None:
-		"""加载邮箱配置"""
-		email_notif_config = os.getenv('EMAIL_NOTIF_CONFIG')
-		if not email_notif_config:
-			return None
+	def _load_configs(self, env_key: str, load_config: Callable[[Any], Any]) -> list:
+		"""
+		加载单个平台的全部目标配置
+
+		环境变量为 JSON 数组时表示多个目标，数组中每一项的格式与单个配置相同（字符串或字典）
+
+		Args:
+			env_key: 环境变量键名
+			load_config: 把单个目标的配置值转换为配置对象的方法，配置无效时返回 None
+
+		Returns:
+			配置对象列表，未配置时为空列表
+		"""
+		notif_config = os.getenv(env_key)
+		if not notif_config:
+			return []
+
+		parsed = self._parse_env_config(notif_config)
+		entries = parsed if isinstance(parsed, list) else [parsed]
 
-		parsed = self._parse_env_config(email_notif_config)
+		configs = []
+		for index, entry in enumerate(entries, start=1):
+			config = load_config(entry)
+			if config is None:
+				if len(entries) > 1:
+					logger.warning(f'{env_key} 中第 {index} 个目标的配置无效，已忽略')
+				continue
+			configs.append(config)
+
+		return configs
+
+	def _load_email_config(self, parsed: Any) -> EmailConfig | None:
+		"""加载邮箱配置"""
 		if not isinstance(parsed, dict):
 			return None
 
@@ -306,13 +386,8 @@ class NotificationKit:
 			template=template,
 		)
 
-	def _load_bark_config(self) -> BarkConfig | None:
+	def _load_bark_config(self, parsed: Any) -> BarkConfig | None:
 		"""加载 Bark 配置"""
-		bark_notif_config = os.getenv('BARK_NOTIF_CONFIG')
-		if not bark_notif_config:
-			return None
-
-		parsed = self._parse_env_config(bark_notif_config)
 		if not isinstance(parsed, dict):
 			return None
 
@@ -339,52 +414,47 @@ class NotificationKit:
 			template=template,
 		)
 
-	def _load_dingtalk_config(self) -> WebhookConfig | None:
+	def _load_dingtalk_config(self, parsed: Any) -> WebhookConfig | None:
 		"""加载钉钉配置"""
 		return self._load_webhook_config(
 			platform='dingtalk',
-			notif_config_key='DINGTALK_NOTIF_CONFIG',
+			parsed=parsed,
 		)
 
-	def _load_feishu_config(self) -> WebhookConfig | None:
+	def _load_feishu_config(self, parsed: Any) -> WebhookConfig | None:
 		"""加载飞书配置"""
 		return self._load_webhook_config(
 			platform='feishu',
-			notif_config_key='FEISHU_NOTIF_CONFIG',
+			parsed=parsed,
 		)
 
-	def _load_wecom_config(self) -> WebhookConfig | None:
+	def _load_wecom_config(self, parsed: Any) -> WebhookConfig | None:
 		"""加载企业微信配置"""
 		return self._load_webhook_config(
 			platform='wecom',
-			notif_config_key='WECOM_NOTIF_CONFIG',
+			parsed=parsed,
 		)
 
-	def _load_pushplus_config(self) -> PushPlusConfig | None:
+	def _load_pushplus_config(self, parsed: Any) -> PushPlusConfig | None:
 		"""加载 PushPlus 配置"""
 		return self._load_token_based_config(
 			platform='pushplus',
-			env_key='PUSHPLUS_NOTIF_CONFIG',
+			parsed=parsed,
 			config_class=PushPlusConfig,
 			token_field='token',
 		)
 
-	def _load_serverpush_config(self) -> ServerPushConfig | None:
+	def _load_serverpush_config(self, parsed: Any) -> ServerPushConfig | None:
 		"""加载 Server 酱配置"""
 		return self._load_token_based_config(
 			platform='serverpush',
-			env_key='SERVERPUSH_NOTIF_CONFIG',
+			parsed=parsed,
 			config_class=ServerPushConfig,
 			token_field='send_key',
 		)
 
-	def _load_telegram_config(self) -> TelegramConfig | None:
+	def _load_telegram_config(self, parsed: Any) -> TelegramConfig | None:
 		"""加载 Telegram 配置"""
-		telegram_notif_config = os.getenv('TELEGRAM_NOTIF_CONFIG')
-		if not telegram_notif_config:
-			return None
-
-		parsed = self._parse_env_config(telegram_notif_config)
 		if not isinstance(parsed, dict):
 			return None
 
@@ -411,14 +481,8 @@ class NotificationKit:
 			template=template,
 		)
 
-	def _load_webhook_config(self, platform: str, notif_config_key: str) -> WebhookConfig | None:
+	def _load_webhook_config(self, platform: str, parsed: Any) -> WebhookConfig | None:
 		"""加载 Webhook 配置的通用方法"""
-		notif_config = os.getenv(notif_config_key)
-		if not notif_config:
-			return None
-
-		parsed = self._parse_env_config(notif_config)
-
 		# 字典格式配置
 		if isinstance(parsed, dict):
 			# 验证必需字段
@@ -458,7 +522,7 @@ class NotificationKit:
 	def _load_token_based_config(
 		self,
 		platform: str,
-		env_key: str,
+		parsed: Any,
 		config_class: type,
 		token_field: str,
 	):
@@ -467,19 +531,13 @@ class NotificationKit:
 
 		Args:
 			platform: 平台名称
-			env_key: 环境变量键名
+			parsed: 单个目标的配置值（字符串或字典）
 			config_class: 配置类
 			token_field: token 字段名（如 'token' 或 'send_key'）
 
 		Returns:
-			配置对象，如果配置不存在则返回 None
+			配置对象，如果配置无效则返回 None
 		"""
-		notif_config = os.getenv(env_key)
-		if not notif_config:
-			return None
-
-		parsed = self._parse_env_config(notif_config)
-
 		# 字典格式配置
 		if isinstance(parsed, dict):
 			# 验证必需字段
@@ -654,15 +712,21 @@ class NotificationKit:
 		return result
 
 	def _load_default_config(self, platform: str) -> dict[str, Any] | None:
-		"""加载默认配置文件"""
+		"""加载默认配置文件（每个平台只读取一次）"""
+		if platform in self._default_configs:
+			return self._default_configs[platform]
+
+		default_config = None
 		config_file = self.config_dir / f'{platform}.json5'
 		if config_file.exists():
 			try:
 				with open(config_file, 'r', encoding='utf-8') as f:
-					return json5.load(f)
+					default_config = json5.load(f)
 			except Exception as e:
 				logger.warning(f'加载默认配置文件 {config_file} 失败：{e}')
-		return None
+
+		self._default_configs[platform] = default_config
+		return default_config
 
 	def _parse_env_config(self, env_value: str) -> Any:
 		"""解析环境变量配置"""
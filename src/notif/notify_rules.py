@@ -0,0 +1,211 @@
+import operator
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+
+from core.models import AccountResult
+
+# 规则判断函数：(账号结果, 连续失败次数) -> 是否匹配
+RulePredicate = Callable[[AccountResult, int], bool]
+
+# 数值字段：字段名 -> 取值函数（None 表示没有该值，此时比较结果为不匹配）
+_NUMERIC_FIELDS: dict[str, Callable[[AccountResult, int], float | None]] = {
+	'quota': lambda result, failures: result.quota,
+	'used': lambda result, failures: result.used,
+	'retry_count': lambda result, failures: result.retry_count,
+	'consecutive_failures': lambda result, failures: failures,
+}
+
+# 文本字段：字段名 -> 取值函数
+_TEXT_FIELDS: dict[str, Callable[[AccountResult, int], str]] = {
+	'name': lambda result, failures: result.name,
+	'status': lambda result, failures: result.status,
+}
+
+# 布尔字段：字段名 -> 判断函数
+_BOOL_FIELDS: dict[str, RulePredicate] = {
+	'success': lambda result, failures: result.status == 'success',
+	'failed': lambda result, failures: result.status == 'failed',
+	'skipped': lambda result, failures: result.status == 'skipped',
+	'balance_changed': lambda result, failures: result.balance_changed is True,
+	'already_checked_in': lambda result, failures: result.already_checked_in,
+}
+
+# 比较运算符（= 与 == 等价）
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+	'=': operator.eq,
+	'==': operator.eq,
+	'!=': operator.ne,
+	'<': operator.lt,
+	'<=': operator.le,
+	'>': operator.gt,
+	'>=': operator.ge,
+}
+
+# 文本运算符（~ 表示通配符匹配，区分大小写）
+_TEXT_OPERATORS: dict[str, Callable[[str, str], bool]] = {
+	'=': operator.eq,
+	'==': operator.eq,
+	'!=': operator.ne,
+	'~': fnmatchcase,
+}
+
+_COMPARISON_PATTERN = re.compile(r'^(?P<field>\w+)\s*(?P<op>==|!=|<=|>=|=|<|>|~)\s*(?P<value>.+)$')
+_FLAG_PATTERN = re.compile(r'^(?P<negate>not\s+)?(?P<field>\w+)$', re.IGNORECASE)
+_AND_PATTERN = re.compile(r'\s+and\s+', re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class NotifyRule:
+	"""
+	编译后的单条通知规则
+
+	规则由 and 连接的若干条件组成，全部满足时匹配，例如：
+	- failed and consecutive_failures >= 3
+	- quota < 10
+	- name ~ "prod-*" and balance_changed
+	"""
+
+	# 规则序号（从 1 开始，日志中只展示序号，避免规则中的账号名称出现在公共日志里）
+	number: int
+
+	# 规则原文
+	source: str
+
+	# 编译后的条件
+	conditions: tuple[RulePredicate, ...] = field(repr=False)
+
+	# 是否使用了连续失败次数（需要签到台账中的历史记录）
+	uses_failure_history: bool = False
+
+	@classmethod
+	def compile(cls, number: int, source: str) -> 'NotifyRule':
+		"""
+		把规则文本编译为判断函数
+
+		Args:
+			number: 规则序号
+			source: 规则文本
+
+		Returns:
+			NotifyRule: 编译后的规则
+
+		Raises:
+			ValueError: 规则语法错误、字段或运算符无效时抛出
+		"""
+		parts = [part.strip() for part in _AND_PATTERN.split(source.strip())]
+		if not all(parts):
+			raise ValueError(f'规则 #{number} 为空或包含空条件')
+
+		conditions = tuple(cls._compile_condition(number, part) for part in parts)
+		uses_failure_history = any(re.match(r'consecutive_failures\b', part) for part in parts)
+		return cls(
+			number=number,
+			source=source.strip(),
+			conditions=conditions,
+			uses_failure_history=uses_failure_history,
+		)
+
+	def matches(self, result: AccountResult, consecutive_failures: int = 0) -> bool:
+		"""
+		判断账号结果是否匹配该规则
+
+		Args:
+			result: 账号结果
+			consecutive_failures: 账号的连续失败次数
+
+		Returns:
+			bool: 全部条件满足时返回 True
+		"""
+		for condition in self.conditions:
+			if not condition(result, consecutive_failures):
+				return False
+		return True
+
+	@staticmethod
+	def _compile_condition(number: int, text: str) -> RulePredicate:
+		"""编译单个条件（字段 运算符 值，或布尔字段）"""
+		flag = _FLAG_PATTERN.match(text)
+		if flag:
+			name = flag.group('field')
+			check = _BOOL_FIELDS.get(name)
+			if check is None:
+				raise ValueError(f'规则 #{number} 的条件 "{name}" 不是布尔字段，可选值为 {", ".join(_BOOL_FIELDS)}')
+			if flag.group('negate'):
+				return lambda result, failures: not check(result, failures)
+			return check
+
+		comparison = _COMPARISON_PATTERN.match(text)
+		if comparison is None:
+			raise ValueError(f'规则 #{number} 的条件格式无效，应为「字段 运算符 值」或布尔字段')
+
+		name, op, raw_value = comparison.group('field', 'op', 'value')
+		raw_value = raw_value.strip()
+
+		if name in _NUMERIC_FIELDS:
+			compare = _NUMERIC_OPERATORS.get(op)
+			if compare is None:
+				raise ValueError(f'规则 #{number} 的数值字段 {name} 不支持运算符 {op}')
+			try:
+				expected = float(raw_value)
+			except ValueError:
+				raise ValueError(f'规则 #{number} 中 {name} 的比较值必须是数字') from None
+
+			get_value = _NUMERIC_FIELDS[name]
+
+			def numeric_condition(result: AccountResult, failures: int) -> bool:
+				value = get_value(result, failures)
+				return value is not None and compare(value, expected)
+
+			return numeric_condition
+
+		if name in _TEXT_FIELDS:
+			compare_text = _TEXT_OPERATORS.get(op)
+			if compare_text is None:
+				raise ValueError(f'规则 #{number} 的文本字段 {name} 不支持运算符 {op}')
+			expected_text = raw_value
+			if len(expected_text) >= 2 and expected_text[0] == expected_text[-1] and expected_text[0] in '"\'':
+				expected_text = expected_text[1:-1]
+
+			get_text = _TEXT_FIELDS[name]
+			return lambda result, failures: compare_text(get_text(result, failures), expected_text)
+
+		fields = [*_NUMERIC_FIELDS, *_TEXT_FIELDS]
+		raise ValueError(f'规则 #{number} 的字段 {name} 无效，可选值为 {", ".join(fields)}')
+
+
+class NotifyRuleMatcher:
+	"""
+	在一次运行中逐个账号评估通知规则
+
+	每处理完一个账号调用一次 observe，运行结束后不需要再次遍历全部结果。
+	"""
+
+	def __init__(self, rules: list[NotifyRule]):
+		"""
+		初始化规则匹配器
+
+		Args:
+			rules: 编译后的通知规则
+		"""
+		self.rules = rules
+		# 规则序号 -> 匹配的账号数量
+		self.match_counts: dict[int, int] = {}
+
+	@property
+	def has_match(self) -> bool:
+		"""是否有任意规则匹配了账号"""
+		return bool(self.match_counts)
+
+	def observe(self, result: AccountResult, consecutive_failures: int = 0):
+		"""
+		评估单个账号的结果
+
+		Args:
+			result: 账号结果
+			consecutive_failures: 账号的连续失败次数
+		"""
+		for rule in self.rules:
+			if rule.matches(result, consecutive_failures):
+				self.match_counts[rule.number] = self.match_counts.get(rule.number, 0) + 1
@@ -1,19 +1,37 @@
 import httpx
 
 from notif.models import BarkConfig
+from notif.senders.http_client import open_client
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class BarkSender:
-	def __init__(self, config: BarkConfig):
+	def __init__(
+		self,
+		config: BarkConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化 Bark 发送器
 
 		Args:
 		    config: Bark 配置
+		    retry_policy: 重试策略，未提供时使用默认策略
+		    rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
 
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: httpx.AsyncClient | None = None,
+	):
 		"""
 		发送 Bark 消息
 
@@ -21,6 +39,7 @@ class BarkSender:
 		    title: 消息标题
 		    content: 消息内容
 		    context_data: 模板渲染的上下文数据
+		    client: 共享的 HTTP 客户端，未提供时为本次发送单独创建
 
 		Raises:
 		    Exception: 当 HTTP 响应状态码不是 2xx 时抛出异常
@@ -82,8 +101,12 @@ class BarkSender:
 		# 发送 POST 请求到 Bark API
 		push_url = f'{self.config.server_url.rstrip("/")}/push'
 
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			response = await client.post(push_url, json=data)
+		async with open_client(client, self.rate_limiter) as client:
+			response = await self.retry_policy.call(
+				lambda: client.post(push_url, json=data),
+				operation='Bark 推送',
+				idempotent=False,
+			)
 
 			# 检查响应状态码
 			if not response.is_success:
@@ -1,19 +1,37 @@
 import httpx
 
 from notif.models import WebhookConfig
+from notif.senders.http_client import open_client
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class DingTalkSender:
-	def __init__(self, config: WebhookConfig):
+	def __init__(
+		self,
+		config: WebhookConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化钉钉发送器
 
 		Args:
 			config: 钉钉 Webhook 配置
+			retry_policy: 重试策略，未提供时使用默认策略
+			rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
 
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: httpx.AsyncClient | None = None,
+	):
 		"""
 		发送钉钉消息
 
@@ -21,6 +39,7 @@ class DingTalkSender:
 			title: 消息标题，`markdown` 模式必须提供非空的标题，纯文本模式下 None 或空字符串则不展示标题
 			content: 消息内容
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，未提供时为本次发送单独创建
 
 		Raises:
 			ValueError: 当配置了 markdown 模式但未提供 title 时抛出
@@ -54,8 +73,12 @@ class DingTalkSender:
 			msgtype: message_body,
 		}
 
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			response = await client.post(self.config.webhook, json=data)
+		async with open_client(client, self.rate_limiter) as client:
+			response = await self.retry_policy.call(
+				lambda: client.post(self.config.webhook, json=data),
+				operation='钉钉推送',
+				idempotent=False,
+			)
 
 			# 检查响应状态码
 			if not response.is_success:
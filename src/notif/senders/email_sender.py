@@ -1,22 +1,44 @@
+import asyncio
 import re
 import smtplib
 from email.mime.text import MIMEText
+from typing import TYPE_CHECKING
 
 from notif.models import EmailConfig
 from tools.logger import logger
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
+
+if TYPE_CHECKING:
+	import httpx
 
 
 class EmailSender:
-	def __init__(self, config: EmailConfig):
+	def __init__(
+		self,
+		config: EmailConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化邮件发送器
 
 		Args:
 			config: 邮件配置
+			retry_policy: 重试策略，未提供时使用默认策略
+			rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
-
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
+
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: 'httpx.AsyncClient | None' = None,
+	):
 		"""
 		发送邮件
 
@@ -24,6 +46,7 @@ class EmailSender:
 			title: 邮件标题，邮件要求必须提供非空标题
 			content: 邮件内容
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，邮件通过 SMTP 发送，不使用该参数
 
 		Raises:
 			ValueError: 当 title 为 None 或空字符串时抛出
@@ -49,9 +72,18 @@ class EmailSender:
 		else:
 			smtp_server = f'smtp.{self.config.user.split("@")[1]}'
 
-		with smtplib.SMTP_SSL(smtp_server, 465) as server:
-			server.login(self.config.user, self.config.password)
-			server.send_message(msg)
+		def deliver_sync():
+			with smtplib.SMTP_SSL(smtp_server, 465) as server:
+				server.login(self.config.user, self.config.password)
+				server.send_message(msg)
+
+		async def deliver():
+			await self.rate_limiter.acquire(f'smtp://{smtp_server}')
+			# smtplib 是阻塞调用，放到线程中执行，避免与其他平台并发发送时阻塞事件循环
+			await asyncio.to_thread(deliver_sync)
+
+		# 只在连接被拒绝时重试：超时或连接中断时邮件可能已经发出，认证失败等错误也不会重试
+		await self.retry_policy.call(deliver, operation='邮件推送', idempotent=False)
 
 	def _determine_msg_type(self, content: str) -> str:
 		"""
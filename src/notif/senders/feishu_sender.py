@@ -2,20 +2,38 @@ import httpx
 import stencil
 
 from notif.models import WebhookConfig
+from notif.senders.http_client import open_client
 from tools.logger import logger
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class FeishuSender:
-	def __init__(self, config: WebhookConfig):
+	def __init__(
+		self,
+		config: WebhookConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化飞书发送器
 
 		Args:
 			config: 飞书 Webhook 配置
+			retry_policy: 重试策略，未提供时使用默认策略
+			rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
 
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: httpx.AsyncClient | None = None,
+	):
 		"""
 		发送飞书消息
 
@@ -23,6 +41,7 @@ class FeishuSender:
 			title: 消息标题，为 None 或空字符串时不展示标题
 			content: 消息内容
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，未提供时为本次发送单独创建
 
 		Raises:
 			Exception: 当 HTTP 响应状态码不是 2xx 时抛出异常
@@ -95,8 +114,12 @@ class FeishuSender:
 				'text': {'content': text_content},
 			}
 
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			response = await client.post(self.config.webhook, json=data)
+		async with open_client(client, self.rate_limiter) as client:
+			response = await self.retry_policy.call(
+				lambda: client.post(self.config.webhook, json=data),
+				operation='飞书推送',
+				idempotent=False,
+			)
 
 			# 检查响应状态码
 			if not response.is_success:
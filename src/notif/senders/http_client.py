@@ -0,0 +1,46 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+
+from tools.rate_limiter import HostRateLimiter
+
+# 通知请求的超时时间（秒）
+SEND_TIMEOUT = 30.0
+
+
+def create_client(rate_limiter: HostRateLimiter) -> httpx.AsyncClient:
+	"""
+	创建发送通知使用的 HTTP 客户端
+
+	Args:
+		rate_limiter: 按主机划分的限流器，所有经过该客户端的请求都会先获取令牌
+
+	Returns:
+		httpx.AsyncClient: 带限流钩子的客户端
+	"""
+	return httpx.AsyncClient(timeout=SEND_TIMEOUT, event_hooks=rate_limiter.event_hooks())
+
+
+@asynccontextmanager
+async def open_client(
+	client: httpx.AsyncClient | None, rate_limiter: HostRateLimiter
+) -> AsyncIterator[httpx.AsyncClient]:
+	"""
+	获取本次发送使用的 HTTP 客户端
+
+	传入共享客户端时直接复用其连接池，由调用方负责关闭；否则创建一次性的客户端，发送完成后关闭
+
+	Args:
+		client: 共享的 HTTP 客户端
+		rate_limiter: 创建一次性客户端时使用的限流器
+
+	Yields:
+		httpx.AsyncClient: HTTP 客户端
+	"""
+	if client is not None:
+		yield client
+		return
+
+	async with create_client(rate_limiter) as own_client:
+		yield own_client
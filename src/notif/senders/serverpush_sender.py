@@ -1,19 +1,37 @@
 import httpx
 
 from notif.models import ServerPushConfig
+from notif.senders.http_client import open_client
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class ServerPushSender:
-	def __init__(self, config: ServerPushConfig):
+	def __init__(
+		self,
+		config: ServerPushConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化 Server 酱发送器
 
 		Args:
 			config: Server 酱配置
+			retry_policy: 重试策略，未提供时使用默认策略
+			rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
 
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: httpx.AsyncClient | None = None,
+	):
 		"""
 		发送 Server 酱消息
 
@@ -21,6 +39,7 @@ class ServerPushSender:
 			title: 消息标题，Server 酱要求必须提供非空的标题
 			content: 消息内容
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，未提供时为本次发送单独创建
 
 		Raises:
 			ValueError: 当 title 为 None 或空字符串时抛出
@@ -34,10 +53,14 @@ class ServerPushSender:
 			'desp': content,
 		}
 
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			response = await client.post(
-				f'https://sctapi.ftqq.com/{self.config.send_key}.send',
-				json=data,
+		async with open_client(client, self.rate_limiter) as client:
+			response = await self.retry_policy.call(
+				lambda: client.post(
+					f'https://sctapi.ftqq.com/{self.config.send_key}.send',
+					json=data,
+				),
+				operation='Server 酱推送',
+				idempotent=False,
 			)
 
 			# 检查响应状态码
@@ -1,19 +1,37 @@
 import httpx
 
 from notif.models import WebhookConfig
+from notif.senders.http_client import open_client
+from tools.rate_limiter import HostRateLimiter
+from tools.retry import RetryPolicy
 
 
 class WeComSender:
-	def __init__(self, config: WebhookConfig):
+	def __init__(
+		self,
+		config: WebhookConfig,
+		retry_policy: RetryPolicy | None = None,
+		rate_limiter: HostRateLimiter | None = None,
+	):
 		"""
 		初始化企业微信发送器
 
 		Args:
 			config: 企业微信 Webhook 配置
+			retry_policy: 重试策略，未提供时使用默认策略
+			rate_limiter: 按主机划分的限流器，未提供时使用默认配置
 		"""
 		self.config = config
+		self.retry_policy = retry_policy or RetryPolicy()
+		self.rate_limiter = rate_limiter or HostRateLimiter()
 
-	async def send(self, title: str | None, content: str, context_data: dict | None = None):
+	async def send(
+		self,
+		title: str | None,
+		content: str,
+		context_data: dict | None = None,
+		client: httpx.AsyncClient | None = None,
+	):
 		"""
 		发送企业微信消息
 
@@ -21,6 +39,7 @@ class WeComSender:
 			title: 消息标题，为 None 或空字符串时不展示标题
 			content: 消息内容
 			context_data: 模板渲染的上下文数据
+			client: 共享的 HTTP 客户端，未提供时为本次发送单独创建
 
 		Raises:
 			Exception: 当 HTTP 响应状态码不是 2xx 时抛出异常
@@ -46,8 +65,12 @@ class WeComSender:
 			},
 		}
 
-		async with httpx.AsyncClient(timeout=30.0) as client:
-			response = await client.post(self.config.webhook, json=data)
+		async with open_client(client, self.rate_limiter) as client:
+			response = await self.retry_policy.call(
+				lambda: client.post(self.config.webhook, json=data),
+				operation='企业微信推送',
+				idempotent=False,
+			)
 
 			# 检查响应状态码
 			if not response.is_success:
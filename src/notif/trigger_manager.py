@@ -1,8 +1,21 @@
 import os
+import re
+from collections.abc import Callable
 
 from notif.models.notify_trigger import NotifyTrigger
+from notif.notify_rules import NotifyRule, NotifyRuleMatcher
 from tools.logger import logger
 
+# 运行级触发条件：(触发器, 通知原因, 判断函数)，判断函数的参数依次为
+# has_success、has_failed、has_balance_changed、is_first_run
+_TRIGGER_CHECKS: tuple[tuple[NotifyTrigger, str, Callable[[bool, bool, bool, bool], bool]], ...] = (
+	# 余额变化包括首次运行或实际余额变化
+	(NotifyTrigger.BALANCE_CHANGED, '首次运行', lambda success, failed, changed, first_run: first_run),
+	(NotifyTrigger.BALANCE_CHANGED, '余额变化', lambda success, failed, changed, first_run: changed),
+	(NotifyTrigger.FAILED, '账号失败', lambda success, failed, changed, first_run: failed),
+	(NotifyTrigger.SUCCESS, '账号成功', lambda success, failed, changed, first_run: success),
+)
+
 
 class NotifyTriggerManager:
 	"""通知触发器管理器"""
@@ -10,17 +23,37 @@ class NotifyTriggerManager:
 	# 默认触发器：余额变化或失败时发送通知
 	DEFAULT_TRIGGERS = {NotifyTrigger.BALANCE_CHANGED, NotifyTrigger.FAILED}
 	ENV_KEY = 'NOTIFY_TRIGGERS'
+	ENV_RULES_KEY = 'NOTIFY_RULES'
 
 	def __init__(self):
-		"""初始化通知触发器管理器"""
+		"""初始化通知触发器管理器（触发器与通知规则只在这里解析、编译一次）"""
+		self.rules = self._parse_rules()
 		self.triggers = self._parse_triggers()
 
+		# 只保留已配置的触发条件，判断时不需要再逐个检查触发器集合
+		self._checks = [(reason, check) for trigger, reason, check in _TRIGGER_CHECKS if trigger in self.triggers]
+
+	@property
+	def needs_failure_history(self) -> bool:
+		"""通知规则是否使用了连续失败次数（需要签到台账）"""
+		return any(rule.uses_failure_history for rule in self.rules)
+
+	def create_rule_matcher(self) -> NotifyRuleMatcher:
+		"""
+		创建本次运行使用的规则匹配器
+
+		Returns:
+			NotifyRuleMatcher: 规则匹配器（处理每个账号后调用 observe）
+		"""
+		return NotifyRuleMatcher(self.rules)
+
 	def should_notify(
 		self,
 		has_success: bool,
 		has_failed: bool,
 		has_balance_changed: bool,
 		is_first_run: bool,
+		rule_matcher: NotifyRuleMatcher | None = None,
 	) -> bool:
 		"""
 		判断是否应该发送通知
@@ -30,6 +63,7 @@ class NotifyTriggerManager:
 			has_failed: 是否有失败的账号
 			has_balance_changed: 是否有余额变化
 			is_first_run: 是否是首次运行
+			rule_matcher: 本次运行的规则匹配器，任意规则匹配时发送通知
 
 		Returns:
 			是否应该发送通知
@@ -42,19 +76,11 @@ class NotifyTriggerManager:
 		if NotifyTrigger.ALWAYS in self.triggers:
 			return True
 
-		# 检查是否满足任一触发条件（OR 关系）
-		if NotifyTrigger.BALANCE_CHANGED in self.triggers:
-			# 余额变化包括首次运行或实际余额变化
-			if is_first_run or has_balance_changed:
-				return True
-
-		if NotifyTrigger.FAILED in self.triggers and has_failed:
+		# 检查是否满足任一触发条件或通知规则（OR 关系）
+		if rule_matcher is not None and rule_matcher.has_match:
 			return True
 
-		if NotifyTrigger.SUCCESS in self.triggers and has_success:
-			return True
-
-		return False
+		return any(check(has_success, has_failed, has_balance_changed, is_first_run) for _, check in self._checks)
 
 	def get_notify_reasons(
 		self,
@@ -62,6 +88,7 @@ class NotifyTriggerManager:
 		has_failed: bool,
 		has_balance_changed: bool,
 		is_first_run: bool,
+		rule_matcher: NotifyRuleMatcher | None = None,
 	) -> list[str]:
 		"""
 		获取通知触发的原因列表
@@ -71,25 +98,44 @@ class NotifyTriggerManager:
 			has_failed: 是否有失败的账号
 			has_balance_changed: 是否有余额变化
 			is_first_run: 是否是首次运行
+			rule_matcher: 本次运行的规则匹配器
 
 		Returns:
 			触发原因列表
 		"""
-		reasons = []
+		reasons = [
+			reason
+			for reason, check in self._checks
+			if check(has_success, has_failed, has_balance_changed, is_first_run)
+		]
 
-		if is_first_run and NotifyTrigger.BALANCE_CHANGED in self.triggers:
-			reasons.append('首次运行')
+		# 规则只展示序号，规则原文可能包含账号名称
+		if rule_matcher is not None:
+			for number, count in sorted(rule_matcher.match_counts.items()):
+				reasons.append(f'通知规则 #{number}（{count} 个账号）')
 
-		if has_balance_changed and NotifyTrigger.BALANCE_CHANGED in self.triggers:
-			reasons.append('余额变化')
+		return reasons
 
-		if has_failed and NotifyTrigger.FAILED in self.triggers:
-			reasons.append('账号失败')
+	def _parse_rules(self) -> list[NotifyRule]:
+		"""
+		解析并编译通知规则（分号或换行分隔，无效的规则会被忽略）
 
-		if has_success and NotifyTrigger.SUCCESS in self.triggers:
-			reasons.append('账号成功')
+		Returns:
+			编译后的通知规则列表
+		"""
+		env_value = os.getenv(self.ENV_RULES_KEY, '').strip()
+		if not env_value:
+			return []
 
-		return reasons
+		rules = []
+		sources = [source.strip() for source in re.split(r'[;\n]', env_value) if source.strip()]
+		for number, source in enumerate(sources, start=1):
+			try:
+				rules.append(NotifyRule.compile(number, source))
+			except ValueError as e:
+				logger.warning(f'{e}，该规则将被忽略')
+
+		return rules
 
 	def _parse_triggers(self) -> set[NotifyTrigger]:
 		"""
@@ -100,9 +146,9 @@ class NotifyTriggerManager:
 		"""
 		env_value = os.getenv(self.ENV_KEY, '').strip()
 
-		# 如果没有配置，使用默认值
+		# 如果没有配置，使用默认值（只配置了通知规则时只按规则发送通知）
 		if not env_value:
-			return self.DEFAULT_TRIGGERS.copy()
+			return set() if self.rules else self.DEFAULT_TRIGGERS.copy()
 
 		# 解析逗号分隔的字符串
 		trigger_strings = [s.strip().lower() for s in env_value.split(',') if s.strip()]
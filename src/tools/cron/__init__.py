@@ -0,0 +1,5 @@
+from .cron_schedule import CronSchedule
+
+__all__ = [
+	'CronSchedule',
+]
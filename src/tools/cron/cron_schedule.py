@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+
+class CronSchedule:
+	"""
+	标准 5 段 cron 表达式（分 时 日 月 周）
+
+	每段支持 *、数字、范围 a-b、步长 */n 与 a-b/n，以及逗号分隔的列表；周的取值为 0-7（0 和 7 都表示周日）。
+	与 cron 的约定一致：日和周都不是 * 时，满足其中任意一个即可。
+	"""
+
+	# 各段的取值范围
+	FIELD_RANGES = [
+		('分钟', 0, 59),
+		('小时', 0, 23),
+		('日', 1, 31),
+		('月', 1, 12),
+		('周', 0, 7),
+	]
+
+	# 查找下一次触发时间的最大范围（天），超出说明表达式永远不会触发（如 2 月 30 日）
+	MAX_LOOKAHEAD_DAYS = 366 * 5
+
+	def __init__(self, expression: str):
+		"""
+		解析 cron 表达式
+
+		Args:
+			expression: cron 表达式，例如 "0 */6 * * *"
+
+		Raises:
+			ValueError: 表达式格式无效时抛出
+		"""
+		fields = expression.split()
+		if len(fields) != len(self.FIELD_RANGES):
+			raise ValueError(f'cron 表达式必须包含 5 段（分 时 日 月 周）：{expression}')
+
+		self.expression = expression
+		parsed = [
+			self._parse_field(field, name, low, high)
+			for field, (name, low, high) in zip(fields, self.FIELD_RANGES)
+		]  # fmt: skip
+		self.minutes, self.hours, self.days, self.months, weekdays = parsed
+
+		# cron 中 0 与 7 都表示周日，统一转换为 Python 的 weekday（周一为 0）
+		self.weekdays = {(weekday - 1) % 7 for weekday in weekdays}
+		self._any_day = fields[2] == '*'
+		self._any_weekday = fields[4] == '*'
+
+	def next_after(self, after: datetime) -> datetime:
+		"""
+		计算指定时间之后的下一次触发时间（精确到分钟）
+
+		Args:
+			after: 起始时间
+
+		Returns:
+			datetime: 下一次触发时间
+
+		Raises:
+			ValueError: 表达式永远不会触发时抛出
+		"""
+		current = (after + timedelta(minutes=1)).replace(second=0, microsecond=0)
+		limit = current + timedelta(days=self.MAX_LOOKAHEAD_DAYS)
+
+		while current < limit:
+			if current.month not in self.months:
+				current = (current.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+			elif not self._matches_day(current):
+				current = current.replace(hour=0, minute=0) + timedelta(days=1)
+			elif current.hour not in self.hours:
+				current = current.replace(minute=0) + timedelta(hours=1)
+			elif current.minute not in self.minutes:
+				current += timedelta(minutes=1)
+			else:
+				return current
+
+		raise ValueError(f'cron 表达式永远不会触发：{self.expression}')
+
+	def _matches_day(self, moment: datetime) -> bool:
+		"""判断日期是否满足日与周的限制"""
+		day_matches = moment.day in self.days
+		weekday_matches = moment.weekday() in self.weekdays
+
+		if self._any_day:
+			return weekday_matches
+		if self._any_weekday:
+			return day_matches
+		return day_matches or weekday_matches
+
+	@staticmethod
+	def _parse_field(field: str, name: str, low: int, high: int) -> set[int]:
+		"""
+		解析单段表达式
+
+		Args:
+			field: 单段表达式
+			name: 字段名称（用于错误信息）
+			low: 最小值
+			high: 最大值
+
+		Returns:
+			set[int]: 该段允许的取值
+
+		Raises:
+			ValueError: 格式无效或超出范围时抛出
+		"""
+		values: set[int] = set()
+		for part in field.split(','):
+			range_part, _, step_part = part.partition('/')
+			try:
+				step = int(step_part) if step_part else 1
+				if range_part == '*':
+					start, end = low, high
+				elif '-' in range_part:
+					start_text, end_text = range_part.split('-', 1)
+					start, end = int(start_text), int(end_text)
+				else:
+					start = int(range_part)
+					# 单个值带步长时（如 5/15）表示从该值开始到最大值
+					end = high if step_part else start
+			except ValueError:
+				raise ValueError(f'cron 表达式的{name}段无效：{field}') from None
+
+			if step <= 0 or not low <= start <= end <= high:
+				raise ValueError(f'cron 表达式的{name}段超出范围 {low}-{high}：{field}')
+
+			values.update(range(start, end + 1, step))
+
+		return values
@@ -1,10 +1,19 @@
+from .console_sink import ConsoleSink
+from .json_lines_sink import JsonLinesSink
 from .log_level import LogLevel
-from .logger import Logger
+from .log_record import LogRecord
+from .log_sink import LogSink
+from .logger import Logger, LogMessage
 
 logger = Logger()
 
 __all__ = [
+	'ConsoleSink',
+	'JsonLinesSink',
 	'Logger',
 	'LogLevel',
+	'LogMessage',
+	'LogRecord',
+	'LogSink',
 	'logger',
 ]
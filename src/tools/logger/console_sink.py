@@ -0,0 +1,120 @@
+import sys
+
+from .log_record import LogRecord
+
+
+class ConsoleSink:
+	"""
+	控制台输出目标，使用 [标签] 账号: 消息 的可读格式写到标准输出
+
+	日志先写入缓冲区，缓冲区写满或调用 flush 时一次性写出；输出到终端时逐行写出，保持实时显示。
+	GitHub Actions 中同样按批写出，由 Logger 在每个分组（账号）结束与错误日志时写出缓冲区。
+	"""
+
+	# 非终端输出时缓冲区最多保存的行数
+	DEFAULT_BUFFER_LINES = 64
+
+	def __init__(self, buffer_lines: int | None = None):
+		"""
+		初始化控制台输出目标
+
+		Args:
+			buffer_lines: 缓冲区行数，None 表示输出到终端时逐行写出、其余情况使用默认行数
+		"""
+		if buffer_lines is None:
+			buffer_lines = 1 if self._is_terminal() else self.DEFAULT_BUFFER_LINES
+		self.buffer_lines = max(buffer_lines, 1)
+		self._buffer: list[str] = []
+
+	def emit(self, record: LogRecord):
+		"""
+		格式化日志记录并写入缓冲区
+
+		Args:
+			record: 日志记录
+		"""
+		self._append(record)
+		if len(self._buffer) >= self.buffer_lines:
+			self.flush()
+
+	def emit_batch(self, records: list[LogRecord]):
+		"""
+		格式化一批日志记录并连同缓冲区中已有的日志一次写出
+
+		Args:
+			records: 日志记录
+		"""
+		for record in records:
+			self._append(record)
+		self.flush()
+
+	def flush(self):
+		"""写出缓冲区中的日志"""
+		if not self._buffer:
+			return
+
+		lines, self._buffer = self._buffer, []
+		stream = sys.stdout
+		if stream is None:
+			return
+
+		try:
+			stream.write('\n'.join(lines) + '\n')
+			stream.flush()
+		except (OSError, ValueError):
+			# 标准输出已关闭（如程序退出阶段），丢弃剩余日志
+			pass
+
+	@staticmethod
+	def _is_terminal() -> bool:
+		"""判断标准输出是否为终端"""
+		try:
+			return sys.stdout is not None and sys.stdout.isatty()
+		except (AttributeError, ValueError):
+			return False
+
+	def _append(self, record: LogRecord):
+		"""
+		格式化日志记录并追加到缓冲区
+
+		Args:
+			record: 日志记录
+		"""
+		if record.plain:
+			self._buffer.append(record.message)
+		else:
+			self._buffer.append(self._format_message(record))
+
+		# 堆栈信息每行缩进后作为独立的日志行输出
+		if record.exc_text:
+			self._buffer.extend(f'  {line}' for line in record.exc_text.splitlines())
+
+	@staticmethod
+	def _format_message(record: LogRecord) -> str:
+		"""
+		格式化日志消息
+
+		Args:
+			record: 日志记录
+
+		Returns:
+			格式化后的日志字符串
+		"""
+		# 构建消息组件数组
+		message_parts = []
+
+		# 添加时间戳
+		if record.show_timestamp:
+			message_parts.append(f'[{record.wall_time:%Y-%m-%d %H:%M:%S}]')
+
+		# 使用自定义标签或级别标签
+		display_tag = record.tag if record.tag else record.level.get_tag()
+		message_parts.append(f'[{display_tag}]')
+
+		# 添加账号名称
+		if record.account_name:
+			message_parts.append(f'{record.account_name}:')
+
+		message_parts.append(record.message)
+
+		return ' '.join(message_parts)
@@ -0,0 +1,91 @@
+import json
+import os
+from pathlib import Path
+
+from .log_record import LogRecord
+
+
+class JsonLinesSink:
+	"""
+	JSON Lines 输出目标，每条日志写成一行 JSON，便于日志采集系统直接索引
+
+	每行包含级别、标签、账号名称（脱敏）、单调时钟读数、距离启动的秒数与进程号，
+	多进程模式下各工作进程追加写入同一个文件，可以按 pid 与 monotonic 区分和排序。
+	横幅与多行提示等原样输出的文本只用于控制台展示，不写入该文件。
+	"""
+
+	# 缓冲区最多保存的行数
+	DEFAULT_BUFFER_LINES = 64
+
+	def __init__(self, path: Path, buffer_lines: int = DEFAULT_BUFFER_LINES):
+		"""
+		初始化 JSON Lines 输出目标
+
+		Args:
+			path: 日志文件路径（追加写入，目录不存在时自动创建）
+			buffer_lines: 缓冲区行数
+		"""
+		self.path = path
+		self.buffer_lines = max(buffer_lines, 1)
+		self._buffer: list[str] = []
+		self._pid = os.getpid()
+
+	def emit(self, record: LogRecord):
+		"""
+		序列化日志记录并写入缓冲区
+
+		Args:
+			record: 日志记录
+		"""
+		self._append(record)
+		if len(self._buffer) >= self.buffer_lines:
+			self.flush()
+
+	def emit_batch(self, records: list[LogRecord]):
+		"""
+		序列化一批日志记录并连同缓冲区中已有的日志一次写出
+
+		Args:
+			records: 日志记录
+		"""
+		for record in records:
+			self._append(record)
+		self.flush()
+
+	def flush(self):
+		"""把缓冲区中的日志追加写入文件（写入失败时丢弃，不影响签到）"""
+		if not self._buffer:
+			return
+
+		lines, self._buffer = self._buffer, []
+		try:
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			with open(self.path, 'a', encoding='utf-8') as f:
+				f.write('\n'.join(lines) + '\n')
+		except OSError:
+			pass
+
+	def _append(self, record: LogRecord):
+		"""
+		序列化日志记录并追加到缓冲区（原样输出的文本只用于控制台展示，跳过）
+
+		Args:
+			record: 日志记录
+		"""
+		if record.plain:
+			return
+
+		entry = {
+			'time': record.wall_time.isoformat(timespec='milliseconds'),
+			'monotonic': round(record.monotonic, 6),
+			'elapsed': round(record.elapsed, 6),
+			'pid': self._pid,
+			'level': record.level.value,
+			'tag': record.tag,
+			'account': record.account_name,
+			'message': record.message,
+		}
+		if record.exc_text:
+			entry['exception'] = record.exc_text
+
+		self._buffer.append(json.dumps(entry, ensure_ascii=False))
@@ -4,21 +4,23 @@ from enum import Enum
 class LogLevel(Enum):
 	"""日志级别枚举 - 参考常见的日志级别设置"""
 
-	DEBUG = ('DEBUG', '调试')
-	INFO = ('INFO', '信息')
-	WARNING = ('WARNING', '警告')
-	ERROR = ('ERROR', '错误')
+	DEBUG = ('DEBUG', '调试', 10)
+	INFO = ('INFO', '信息', 20)
+	WARNING = ('WARNING', '警告', 30)
+	ERROR = ('ERROR', '错误', 40)
 
-	def __init__(self, value: str, tag: str):
+	def __init__(self, value: str, tag: str, severity: int):
 		"""
 		初始化日志级别枚举
 
 		Args:
 			value: 日志级别的字符串值
 			tag: 日志级别的中文标签
+			severity: 日志级别的严重程度（数值越大越严重）
 		"""
 		self._value_ = value
 		self._tag = tag
+		self._severity = severity
 
 	def get_tag(self) -> str:
 		"""
@@ -28,3 +30,32 @@ class LogLevel(Enum):
 			日志级别的中文标签
 		"""
 		return self._tag
+
+	def get_severity(self) -> int:
+		"""
+		获取日志级别的严重程度
+
+		Returns:
+			日志级别的严重程度（数值越大越严重）
+		"""
+		return self._severity
+
+	@classmethod
+	def parse(cls, value: str) -> 'LogLevel':
+		"""
+		解析日志级别名称（不区分大小写）
+
+		Args:
+			value: 日志级别名称，例如 debug、INFO
+
+		Returns:
+			LogLevel: 对应的日志级别
+
+		Raises:
+			ValueError: 名称不是有效的日志级别时抛出
+		"""
+		levels = {level.value: level for level in cls}
+		level = levels.get(value.strip().upper())
+		if level is None:
+			raise ValueError(f'无效的日志级别：{value}，可选值为 {", ".join(levels)}')
+		return level
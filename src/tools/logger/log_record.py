@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from .log_level import LogLevel
+
+
+@dataclass(frozen=True, slots=True)
+class LogRecord:
+	"""单条日志记录（消息已完成延迟格式化，交给各输出目标按各自的格式写出）"""
+
+	# 日志级别
+	level: LogLevel
+
+	# 日志消息
+	message: str
+
+	# 自定义标签，None 表示使用级别标签
+	tag: str | None
+
+	# 账号名称（调用方传入的脱敏名称）
+	account_name: str | None
+
+	# 记录时的本地时间
+	wall_time: datetime
+
+	# 记录时的单调时钟读数（秒，同一台机器上的各进程可以比较）
+	monotonic: float
+
+	# 距离日志工具创建（进程启动）的秒数
+	elapsed: float
+
+	# 控制台输出时是否显示时间戳
+	show_timestamp: bool = False
+
+	# 异常堆栈文本（error 使用 exc_info 时）
+	exc_text: str | None = None
+
+	# 是否为原样输出的文本（横幅、多行提示等），只用于控制台展示
+	plain: bool = False
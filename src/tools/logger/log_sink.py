@@ -0,0 +1,29 @@
+from typing import Protocol
+
+from .log_record import LogRecord
+
+
+class LogSink(Protocol):
+	"""日志输出目标，Logger 会把每条通过级别过滤的日志交给所有输出目标"""
+
+	def emit(self, record: LogRecord):
+		"""
+		写入一条日志记录（可以先写入缓冲区）
+
+		Args:
+			record: 日志记录
+		"""
+		...
+
+	def emit_batch(self, records: list[LogRecord]):
+		"""
+		写入一批连续的日志记录（如一个账号的分组）并立即写出，保证它们在输出中连续
+
+		Args:
+			records: 日志记录
+		"""
+		...
+
+	def flush(self):
+		"""写出缓冲区中的日志"""
+		...
@@ -1,66 +1,191 @@
+import atexit
+import os
+import sys
+import time
 import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from pathlib import Path
 
+from .console_sink import ConsoleSink
+from .json_lines_sink import JsonLinesSink
 from .log_level import LogLevel
+from .log_record import LogRecord
+from .log_sink import LogSink
+
+# 日志消息：字符串，或返回字符串的函数（只在日志实际输出时才调用，避免为被过滤的日志拼接消息）
+LogMessage = str | Callable[[], str]
+
+# 当前上下文（协程）中正在收集的分组日志，None 表示未分组
+_current_group: ContextVar[list[LogRecord] | None] = ContextVar('log_group', default=None)
 
 
 class Logger:
-	"""日志工具类，用于统一格式化输出日志"""
+	"""
+	日志工具类，统一过滤日志级别并分发给各输出目标
+
+	低于最低级别的日志直接丢弃，不会格式化消息。通过过滤的日志生成一条 LogRecord，
+	交给所有输出目标（默认只有控制台，可同时写出 JSON Lines），各输出目标自行缓冲，
+	分组（账号）结束、输出错误日志、显式调用 flush 或程序退出时统一写出。
+	"""
+
+	# 最低日志级别的环境变量名
+	ENV_LOG_LEVEL = 'CHECKIN_LOG_LEVEL'
+
+	# JSON Lines 日志文件路径的环境变量名
+	ENV_LOG_JSON = 'CHECKIN_LOG_JSON'
+
+	# 分组中的错误日志是否立即输出的环境变量名（默认立即输出，设置为 false 时等待分组结束）
+	ENV_LOG_IMMEDIATE_ERRORS = 'CHECKIN_LOG_IMMEDIATE_ERRORS'
+
+	# 默认的最低日志级别
+	DEFAULT_LEVEL = LogLevel.INFO
+
+	def __init__(self, level: LogLevel | None = None, sinks: list[LogSink] | None = None):
+		"""
+		初始化日志工具
+
+		Args:
+			level: 最低日志级别，None 表示从环境变量读取（未设置时为 INFO）
+			sinks: 输出目标，None 表示使用控制台，并在设置了 CHECKIN_LOG_JSON 时同时写出 JSON Lines
+		"""
+		self._started = time.monotonic()
+		self.sinks: list[LogSink] = sinks if sinks is not None else self._default_sinks()
+
+		# 分组中的错误日志是否立即输出（不等待分组结束），默认开启，避免进程被终止时丢失错误日志
+		self.immediate_errors = os.getenv(self.ENV_LOG_IMMEDIATE_ERRORS, '').lower() != 'false'
+		# 在 GitHub Actions 中运行时使用 ::group:: 标记包裹分组，日志页面中可以折叠
+		self.github_actions = os.getenv('GITHUB_ACTIONS', '').lower() == 'true'
+
+		self.level = self.DEFAULT_LEVEL
+		if level is None:
+			self.load_level_from_env()
+		else:
+			self.level = level
+
+		# 程序退出时写出缓冲区中剩余的日志
+		atexit.register(self.flush)
+
+	def add_sink(self, sink: LogSink):
+		"""
+		添加输出目标
+
+		Args:
+			sink: 输出目标
+		"""
+		self.sinks.append(sink)
+
+	def remove_sink(self, sink: LogSink):
+		"""
+		写出并移除输出目标
+
+		Args:
+			sink: 输出目标
+		"""
+		sink.flush()
+		self.sinks.remove(sink)
+
+	@contextmanager
+	def group(self, title: str) -> Iterator[None]:
+		"""
+		收集 with 块内（包括其中的异步调用）输出的日志，结束时作为一个整体连续写出
+
+		多个账号并发处理时，每个账号的日志不会互相穿插。在 GitHub Actions 中运行时使用
+		::group:: 标记包裹，日志页面中可以按账号折叠。已经处于分组中时不再嵌套分组。
+
+		Args:
+			title: 分组标题（例如脱敏后的账号名称）
+		"""
+		if _current_group.get() is not None:
+			yield
+			return
+
+		records: list[LogRecord] = []
+		token = _current_group.set(records)
+		try:
+			yield
+		finally:
+			_current_group.reset(token)
+			self._emit_group(title, records)
+
+	def load_level_from_env(self):
+		"""从环境变量读取最低日志级别（无效值时使用默认级别并输出警告）"""
+		value = os.getenv(self.ENV_LOG_LEVEL, '').strip()
+		if not value:
+			self.level = self.DEFAULT_LEVEL
+			return
+
+		try:
+			self.level = LogLevel.parse(value)
+		except ValueError as e:
+			self.level = self.DEFAULT_LEVEL
+			self.warning(f'{self.ENV_LOG_LEVEL} {e}，使用默认级别 {self.DEFAULT_LEVEL.value}')
+
+	def is_enabled_for(self, level: LogLevel) -> bool:
+		"""
+		判断指定级别的日志是否会被输出
+
+		Args:
+			level: 日志级别
+
+		Returns:
+			不低于最低日志级别时返回 True
+		"""
+		return level.get_severity() >= self.level.get_severity()
 
 	def debug(
 		self,
-		message: str,
+		message: LogMessage,
 		tag: str | None = None,
 		account_name: str | None = None,
 		show_timestamp: bool = False,
 	):
 		"""输出调试级别日志"""
-		formatted_message = self._format_message(
+		self._log(
 			level=LogLevel.DEBUG,
 			message=message,
 			tag=tag,
 			account_name=account_name,
 			show_timestamp=show_timestamp,
 		)
-		self._print(formatted_message)
 
 	def info(
 		self,
-		message: str,
+		message: LogMessage,
 		tag: str | None = None,
 		account_name: str | None = None,
 		show_timestamp: bool = False,
 	):
 		"""输出信息级别日志"""
-		formatted_message = self._format_message(
+		self._log(
 			level=LogLevel.INFO,
 			message=message,
 			tag=tag,
 			account_name=account_name,
 			show_timestamp=show_timestamp,
 		)
-		self._print(formatted_message)
 
 	def warning(
 		self,
-		message: str,
+		message: LogMessage,
 		tag: str | None = None,
 		account_name: str | None = None,
 		show_timestamp: bool = False,
 	):
 		"""输出警告级别日志"""
-		formatted_message = self._format_message(
+		self._log(
 			level=LogLevel.WARNING,
 			message=message,
 			tag=tag,
 			account_name=account_name,
 			show_timestamp=show_timestamp,
 		)
-		self._print(formatted_message)
 
 	def error(
 		self,
-		message: str,
+		message: LogMessage,
 		tag: str | None = None,
 		account_name: str | None = None,
 		show_timestamp: bool = False,
@@ -70,25 +195,15 @@ class Logger:
 		输出错误级别日志
 
 		Args:
-			message: 错误消息
+			message: 错误消息（或返回消息的函数）
 			tag: 可选的自定义标签
 			account_name: 可选的账号名称
 			show_timestamp: 是否显示时间戳
 			exc_info: 是否输出异常堆栈信息（类似 Python logging 的 exc_info 参数）
 		"""
-		formatted_message = self._format_message(
-			level=LogLevel.ERROR,
-			message=message,
-			tag=tag,
-			account_name=account_name,
-			show_timestamp=show_timestamp,
-		)
-		self._print(formatted_message)
-
 		# 如果需要输出异常堆栈信息
+		exc_text = None
 		if exc_info:
-			import sys
-
 			exc_type, exc_value, exc_traceback = sys.exc_info()
 			if exc_type is not None:
 				trace_lines = traceback.format_exception(
@@ -96,10 +211,19 @@ class Logger:
 					exc_value,
 					exc_traceback,
 				)
-				# 输出堆栈信息（每行作为独立的日志输出）
-				for line in trace_lines:
-					# 移除末尾的换行符并输出
-					self._print(f'  {line.rstrip()}')
+				exc_text = ''.join(trace_lines).rstrip()
+
+		self._log(
+			level=LogLevel.ERROR,
+			message=message,
+			tag=tag,
+			account_name=account_name,
+			show_timestamp=show_timestamp,
+			exc_text=exc_text,
+		)
+
+		# 错误日志立即写出，避免程序异常退出时丢失
+		self.flush()
 
 	def success(self, message: str, account_name: str | None = None, show_timestamp: bool = False):
 		"""输出成功级别日志 - 便捷方法，使用 INFO 级别和成功标签"""
@@ -162,55 +286,160 @@ class Logger:
 		for message in messages:
 			self._print(message)
 
+	def flush(self):
+		"""写出所有输出目标缓冲区中的日志"""
+		for sink in self.sinks:
+			sink.flush()
+
+	def _default_sinks(self) -> list[LogSink]:
+		"""创建默认的输出目标"""
+		sinks: list[LogSink] = [ConsoleSink()]
+		json_path = os.getenv(self.ENV_LOG_JSON, '').strip()
+		if json_path:
+			sinks.append(JsonLinesSink(Path(json_path)))
+		return sinks
+
+	def _log(
+		self,
+		level: LogLevel,
+		message: LogMessage,
+		tag: str | None = None,
+		account_name: str | None = None,
+		show_timestamp: bool = False,
+		exc_text: str | None = None,
+	):
+		"""
+		按最低日志级别过滤后生成日志记录并交给各输出目标
+
+		Args:
+			level: 日志级别
+			message: 日志消息（或返回消息的函数）
+			tag: 可选的自定义标签
+			account_name: 可选的账号名称
+			show_timestamp: 是否显示时间戳
+			exc_text: 异常堆栈文本
+		"""
+		if not self.is_enabled_for(level):
+			return
+
+		self._emit(
+			level=level,
+			message=message() if callable(message) else message,
+			tag=tag,
+			account_name=account_name,
+			show_timestamp=show_timestamp,
+			exc_text=exc_text,
+		)
+
 	def _print(self, message: str):
 		"""
-		封装日志输出函数，便于未来统一替换日志基底
+		原样输出一行文本（横幅、多行提示等，只在控制台展示）
 
 		Args:
 			message: 要打印的消息
 		"""
-		print(message)
-
-	def _timestamp(self) -> str:
-		"""获取格式化的时间戳"""
-		return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+		self._emit(level=LogLevel.INFO, message=message, tag=None, account_name=None, plain=True)
 
-	def _format_message(
+	def _emit(
 		self,
 		level: LogLevel,
 		message: str,
-		tag: str | None = None,
-		account_name: str | None = None,
+		tag: str | None,
+		account_name: str | None,
 		show_timestamp: bool = False,
-	) -> str:
+		exc_text: str | None = None,
+		plain: bool = False,
+	):
 		"""
-		格式化日志消息
+		生成日志记录并交给各输出目标
 
 		Args:
 			level: 日志级别
 			message: 日志消息
+			tag: 可选的自定义标签
 			account_name: 可选的账号名称
 			show_timestamp: 是否显示时间戳
-			tag: 可选的自定义标签
+			exc_text: 异常堆栈文本
+			plain: 是否为原样输出的文本
+		"""
+		record = self._record(
+			level=level,
+			message=message,
+			tag=tag,
+			account_name=account_name,
+			show_timestamp=show_timestamp,
+			exc_text=exc_text,
+			plain=plain,
+		)
 
-		Returns:
-			格式化后的日志字符串
+		# 分组中的日志先收集起来，分组结束时统一写出（错误日志默认立即输出）
+		records = _current_group.get()
+		if records is not None and not (self.immediate_errors and level is LogLevel.ERROR):
+			records.append(record)
+			return
+
+		for sink in self.sinks:
+			sink.emit(record)
+
+	def _emit_group(self, title: str, records: list[LogRecord]):
 		"""
-		# 构建消息组件数组
-		message_parts = []
+		把一个分组的日志（包括 ::group:: 标记）作为一批交给各输出目标，一次写出
 
-		# 添加时间戳
-		if show_timestamp:
-			message_parts.append(f'[{self._timestamp()}]')
+		Args:
+			title: 分组标题
+			records: 分组中收集的日志记录
+		"""
+		if not records:
+			return
 
-		# 使用自定义标签或级别标签
-		display_tag = tag if tag else level.get_tag()
-		message_parts.append(f'[{display_tag}]')
+		if self.github_actions:
+			records = [
+				self._record(level=LogLevel.INFO, message=f'::group::{title}', plain=True),
+				*records,
+				self._record(level=LogLevel.INFO, message='::endgroup::', plain=True),
+			]
+		for sink in self.sinks:
+			sink.emit_batch(records)
+
+	def _record(
+		self,
+		level: LogLevel,
+		message: str,
+		tag: str | None = None,
+		account_name: str | None = None,
+		show_timestamp: bool = False,
+		exc_text: str | None = None,
+		plain: bool = False,
+	) -> LogRecord:
+		"""
+		生成带当前时间的日志记录
 
-		# 添加账号名称
-		if account_name:
-			message_parts.append(f'{account_name}:')
+		Args:
+			level: 日志级别
+			message: 日志消息
+			tag: 可选的自定义标签
+			account_name: 可选的账号名称
+			show_timestamp: 是否显示时间戳
+			exc_text: 异常堆栈文本
+			plain: 是否为原样输出的文本
 
-		message_parts.append(message)
+		Returns:
+			LogRecord: 日志记录
+		"""
+		now = time.monotonic()
+		return LogRecord(
+			level=level,
+			message=message,
+			tag=tag,
+			account_name=account_name,
+			wall_time=datetime.now(),
+			monotonic=now,
+			elapsed=now - self._started,
+			show_timestamp=show_timestamp,
+			exc_text=exc_text,
+			plain=plain,
+		)
 
-		return ' '.join(message_parts)
+	def _timestamp(self) -> str:
+		"""获取格式化的时间戳"""
+		return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -0,0 +1,6 @@
+from .run_profiler import ProfileMode, RunProfiler
+
+__all__ = [
+	'ProfileMode',
+	'RunProfiler',
+]
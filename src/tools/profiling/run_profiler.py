@@ -0,0 +1,220 @@
+import asyncio
+import logging
+import os
+from collections.abc import Coroutine
+from enum import Enum
+from pathlib import Path
+from typing import Any, TypeVar
+
+from tools.logger import logger
+
+T = TypeVar('T')
+
+
+class ProfileMode(Enum):
+	"""性能分析方式"""
+
+	CPROFILE = ('cprofile', 'cProfile 函数耗时')
+	TRACEMALLOC = ('tracemalloc', 'tracemalloc 内存分配')
+	ASYNCIO = ('asyncio', 'asyncio 慢回调')
+
+	def __init__(self, value: str, tag: str):
+		"""
+		初始化性能分析方式枚举
+
+		Args:
+			value: 分析方式的字符串值
+			tag: 分析方式的中文描述
+		"""
+		self._value_ = value
+		self._tag = tag
+
+	def get_tag(self) -> str:
+		"""获取分析方式的中文描述"""
+		return self._tag
+
+
+class RunProfiler:
+	"""
+	单次运行的性能分析
+
+	通过环境变量开启，未开启时 from_env 返回 None，不导入任何分析模块，也不增加运行开销。
+	分析结果写入输出目录，可作为 GitHub Actions 的 Artifact 上传：
+	- cprofile：profile.pstats（可用 snakeviz 等工具查看）与按累计耗时排序的 profile.txt
+	- tracemalloc：tracemalloc_top.txt（结束时占用最多的分配位置）、tracemalloc_diff.txt（相对开始时的增量）
+	- asyncio：开启 asyncio 调试模式，慢回调等警告写入 asyncio_debug.log
+	"""
+
+	# 开启性能分析的环境变量，值为逗号分隔的分析方式或 all
+	ENV_PROFILE = 'CHECKIN_PROFILE'
+
+	# 输出目录的环境变量
+	ENV_PROFILE_DIR = 'CHECKIN_PROFILE_DIR'
+
+	# asyncio 慢回调阈值的环境变量（秒）
+	ENV_SLOW_CALLBACK = 'CHECKIN_PROFILE_SLOW_CALLBACK'
+
+	# 默认输出目录
+	DEFAULT_OUTPUT_DIR = 'profile'
+
+	# 默认 asyncio 慢回调阈值（秒）
+	DEFAULT_SLOW_CALLBACK = 0.1
+
+	# 报告中列出的条目数
+	TOP_LIMIT = 30
+
+	def __init__(self, modes: set[ProfileMode], output_dir: Path, slow_callback: float = DEFAULT_SLOW_CALLBACK):
+		"""
+		初始化性能分析
+
+		Args:
+			modes: 开启的分析方式
+			output_dir: 输出目录
+			slow_callback: asyncio 慢回调阈值（秒）
+		"""
+		self.modes = modes
+		self.output_dir = output_dir
+		self.slow_callback = slow_callback
+		self._profile: Any = None
+		self._start_snapshot: Any = None
+		self._asyncio_handler: logging.Handler | None = None
+
+	@classmethod
+	def from_env(cls) -> 'RunProfiler | None':
+		"""
+		从环境变量创建性能分析
+
+		Returns:
+			RunProfiler | None: 未开启任何分析方式时返回 None
+		"""
+		raw = os.getenv(cls.ENV_PROFILE, '').strip().lower()
+		if not raw or raw in ('false', '0', 'off'):
+			return None
+
+		names = {name.strip() for name in raw.split(',') if name.strip()}
+		if names & {'all', 'true', '1', 'on'}:
+			modes = set(ProfileMode)
+		else:
+			known_modes = {mode.value: mode for mode in ProfileMode}
+			modes = set()
+			for name in names:
+				if name in known_modes:
+					modes.add(known_modes[name])
+				else:
+					logger.warning(f'未知的性能分析方式：{name}，已忽略', tag='性能分析')
+
+		if not modes:
+			return None
+
+		try:
+			slow_callback = float(os.getenv(cls.ENV_SLOW_CALLBACK) or cls.DEFAULT_SLOW_CALLBACK)
+		except ValueError:
+			slow_callback = cls.DEFAULT_SLOW_CALLBACK
+
+		return cls(
+			modes=modes,
+			output_dir=Path(os.getenv(cls.ENV_PROFILE_DIR) or cls.DEFAULT_OUTPUT_DIR),
+			slow_callback=slow_callback,
+		)
+
+	def __enter__(self) -> 'RunProfiler':
+		self.output_dir.mkdir(parents=True, exist_ok=True)
+		logger.info(
+			f'已开启性能分析：{"、".join(mode.get_tag() for mode in self._ordered_modes())}，结果写入 {self.output_dir}',
+			tag='性能分析',
+		)
+
+		if ProfileMode.ASYNCIO in self.modes:
+			self._asyncio_handler = logging.FileHandler(self.output_dir / 'asyncio_debug.log', encoding='utf-8')
+			self._asyncio_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+			asyncio_logger = logging.getLogger('asyncio')
+			asyncio_logger.addHandler(self._asyncio_handler)
+			asyncio_logger.setLevel(logging.DEBUG)
+
+		if ProfileMode.TRACEMALLOC in self.modes:
+			import tracemalloc
+
+			tracemalloc.start(25)
+			self._start_snapshot = tracemalloc.take_snapshot()
+
+		# cProfile 最后开启，避免把其他分析方式的初始化计入耗时
+		if ProfileMode.CPROFILE in self.modes:
+			import cProfile
+
+			self._profile = cProfile.Profile()
+			self._profile.enable()
+
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		# 程序通过 sys.exit 结束时同样写入分析结果
+		if self._profile is not None:
+			self._profile.disable()
+
+		# 先写入 tracemalloc 结果，避免把生成 cProfile 报告时的内存分配计入
+		if self._start_snapshot is not None:
+			self._write_tracemalloc()
+
+		if self._profile is not None:
+			self._write_cprofile()
+
+		if self._asyncio_handler is not None:
+			logging.getLogger('asyncio').removeHandler(self._asyncio_handler)
+			self._asyncio_handler.close()
+
+	def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+		"""
+		执行协程（开启 asyncio 分析时使用调试模式的事件循环）
+
+		Args:
+			coroutine: 要执行的协程
+
+		Returns:
+			协程的返回值
+		"""
+		if ProfileMode.ASYNCIO not in self.modes:
+			return asyncio.run(coroutine)
+		return asyncio.run(self._with_slow_callback(coroutine), debug=True)
+
+	async def _with_slow_callback(self, coroutine: Coroutine[Any, Any, T]) -> T:
+		"""设置慢回调阈值后执行协程"""
+		asyncio.get_running_loop().slow_callback_duration = self.slow_callback
+		return await coroutine
+
+	def _write_cprofile(self):
+		"""写入 cProfile 结果"""
+		import pstats
+
+		try:
+			self._profile.dump_stats(self.output_dir / 'profile.pstats')
+			with open(self.output_dir / 'profile.txt', 'w', encoding='utf-8') as f:
+				stats = pstats.Stats(self._profile, stream=f)
+				stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.TOP_LIMIT * 2)
+		except (OSError, IOError) as e:
+			logger.warning(f'写入 cProfile 结果失败：{e}', tag='性能分析')
+
+	def _write_tracemalloc(self):
+		"""写入 tracemalloc 结果"""
+		import tracemalloc
+
+		end_snapshot = tracemalloc.take_snapshot()
+		current, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+
+		try:
+			with open(self.output_dir / 'tracemalloc_top.txt', 'w', encoding='utf-8') as f:
+				f.write(f'当前占用 {current / 1024:.1f} KiB，峰值 {peak / 1024:.1f} KiB\n\n')
+				for stat in end_snapshot.statistics('lineno')[: self.TOP_LIMIT]:
+					f.write(f'{stat}\n')
+
+			with open(self.output_dir / 'tracemalloc_diff.txt', 'w', encoding='utf-8') as f:
+				for stat in end_snapshot.compare_to(self._start_snapshot, 'lineno')[: self.TOP_LIMIT]:
+					f.write(f'{stat}\n')
+
+			end_snapshot.dump(str(self.output_dir / 'tracemalloc.snapshot'))
+		except (OSError, IOError) as e:
+			logger.warning(f'写入 tracemalloc 结果失败：{e}', tag='性能分析')
+
+	def _ordered_modes(self) -> list[ProfileMode]:
+		"""按枚举定义顺序返回开启的分析方式"""
+		return [mode for mode in ProfileMode if mode in self.modes]
@@ -0,0 +1,7 @@
+from .token_bucket import HostRateLimiter, RateLimit, TokenBucket
+
+__all__ = [
+	'HostRateLimiter',
+	'RateLimit',
+	'TokenBucket',
+]
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from tools.logger import logger
+
+if TYPE_CHECKING:
+	import httpx
+
+
+@dataclass(frozen=True)
+class RateLimit:
+	"""单个目标主机的限流配置"""
+
+	# 平均速率（每秒允许的请求数）
+	rate: float
+
+	# 突发容量（短时间内最多连续发送的请求数）
+	burst: int
+
+
+class TokenBucket:
+	"""
+	令牌桶
+
+	按固定速率补充令牌，容量为突发上限。asyncio 单线程执行，申请时直接预扣令牌（允许为负数），
+	再等待欠下的令牌补齐，因此无需加锁，且等待中的请求按申请顺序依次放行。
+	"""
+
+	def __init__(self, limit: RateLimit):
+		"""
+		初始化令牌桶
+
+		Args:
+			limit: 限流配置
+		"""
+		self.limit = limit
+		self._tokens = float(limit.burst)
+		self._updated_at = time.monotonic()
+
+	def reserve(self) -> float:
+		"""
+		预扣一个令牌
+
+		Returns:
+			需要等待的时间（秒），0 表示可以立即发送
+		"""
+		now = time.monotonic()
+		self._tokens = min(
+			float(self.limit.burst),
+			self._tokens + (now - self._updated_at) * self.limit.rate,
+		)
+		self._updated_at = now
+		self._tokens -= 1
+
+		if self._tokens >= 0:
+			return 0.0
+		return -self._tokens / self.limit.rate
+
+	async def acquire(self):
+		"""申请一个令牌，令牌不足时等待"""
+		delay = self.reserve()
+		if delay > 0:
+			await self._sleep(delay)
+
+	@staticmethod
+	async def _sleep(delay: float):
+		"""等待指定时间（单独封装，便于测试中跳过等待）"""
+		await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+	"""
+	按主机划分的限流器
+
+	每个主机使用独立的令牌桶，未配置限流的主机不受限制。通过 httpx 的 request 事件钩子接入，
+	同一个客户端的所有请求（包括重试）都会先申请令牌。
+	"""
+
+	# 默认限流配置（按各平台公开的频率限制设置）
+	DEFAULT_LIMITS: dict[str, RateLimit] = {
+		# AnyRouter：签到请求过于密集容易触发 WAF
+		'anyrouter.top': RateLimit(rate=1.0, burst=3),
+		# 钉钉自定义机器人：每分钟最多 20 条
+		'oapi.dingtalk.com': RateLimit(rate=20 / 60, burst=20),
+		# 企业微信群机器人：每分钟最多 20 条
+		'qyapi.weixin.qq.com': RateLimit(rate=20 / 60, burst=20),
+		# 飞书自定义机器人：每分钟 100 条，每秒 5 条
+		'open.feishu.cn': RateLimit(rate=100 / 60, burst=5),
+		# Telegram：同一个 Bot 每秒最多 30 条（令牌桶按主机划分，多个会话共享该限制；
+		# 同一会话每秒 1 条的限制无需单独处理，每次运行向每个会话只发送一条通知）
+		'api.telegram.org': RateLimit(rate=30.0, burst=30),
+	}
+
+	def __init__(self, limits: dict[str, RateLimit] | None = None):
+		"""
+		初始化限流器
+
+		Args:
+			limits: 各主机的限流配置，会覆盖同名主机的默认配置
+		"""
+		self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+		self._buckets: dict[str, TokenBucket] = {}
+
+	def split(self, parts: int) -> 'HostRateLimiter':
+		"""
+		按份数平分各主机的限流配置（多进程签到时每个工作进程使用其中一份）
+
+		速率按份数相除；突发容量向下取整，且至少为 1
+
+		Args:
+			parts: 份数（工作进程数量）
+
+		Returns:
+			HostRateLimiter: 平分后的限流器，份数不大于 1 时返回自身
+		"""
+		if parts <= 1:
+			return self
+
+		return HostRateLimiter({
+			host: RateLimit(rate=limit.rate / parts, burst=max(limit.burst // parts, 1))
+			for host, limit in self.limits.items()
+		})
+
+	async def acquire(self, url: 'str | httpx.URL'):
+		"""
+		为目标地址申请一个令牌
+
+		Args:
+			url: 请求地址
+		"""
+		import httpx
+
+		bucket = self._get_bucket(httpx.URL(url).host)
+		if bucket is not None:
+			await bucket.acquire()
+
+	async def on_request(self, request: 'httpx.Request'):
+		"""httpx request 事件钩子"""
+		await self.acquire(request.url)
+
+	def event_hooks(self) -> dict[str, list[Any]]:
+		"""
+		获取 httpx 客户端的事件钩子配置
+
+		Returns:
+			可直接传给 httpx.AsyncClient(event_hooks=...) 的字典
+		"""
+		return {'request': [self.on_request]}
+
+	@classmethod
+	def parse_limits(cls, raw: str) -> dict[str, RateLimit]:
+		"""
+		解析 JSON 格式的限流配置
+
+		格式：{"主机名": {"rate": 每秒请求数, "burst": 突发容量}}，无效的条目会被忽略
+
+		Args:
+			raw: JSON 字符串
+
+		Returns:
+			dict[str, RateLimit]: 主机名 -> 限流配置
+		"""
+		try:
+			data = json.loads(raw)
+		except json.JSONDecodeError as e:
+			logger.warning(f'限流配置的 JSON 格式无效：{e}，使用默认配置')
+			return {}
+
+		if not isinstance(data, dict):
+			logger.warning('限流配置必须使用对象格式 {}，使用默认配置')
+			return {}
+
+		limits: dict[str, RateLimit] = {}
+		for host, config in data.items():
+			try:
+				rate = float(config['rate'])
+				burst = int(config.get('burst', 1))
+			except (TypeError, KeyError, ValueError):
+				logger.warning(f'主机 {host} 的限流配置无效，已忽略')
+				continue
+
+			if rate <= 0 or burst <= 0:
+				logger.warning(f'主机 {host} 的 rate 与 burst 必须大于 0，已忽略')
+				continue
+
+			limits[host.lower()] = RateLimit(rate=rate, burst=burst)
+
+		return limits
+
+	def _get_bucket(self, host: str) -> TokenBucket | None:
+		"""
+		获取主机对应的令牌桶（首次使用时创建）
+
+		Args:
+			host: 主机名
+
+		Returns:
+			TokenBucket | None: 令牌桶，未配置限流时返回 None
+		"""
+		bucket = self._buckets.get(host)
+		if bucket is None:
+			limit = self.limits.get(host)
+			if limit is None:
+				return None
+			bucket = self._buckets[host] = TokenBucket(limit)
+		return bucket
@@ -0,0 +1,10 @@
+from .retry_policy import RetryableError, RetryBudget, RetryPolicy, RetryReason, RetryScope, retry_scope
+
+__all__ = [
+	'RetryableError',
+	'RetryBudget',
+	'RetryPolicy',
+	'RetryReason',
+	'RetryScope',
+	'retry_scope',
+]
@@ -0,0 +1,352 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from tools.logger import logger
+
+T = TypeVar('T')
+
+
+class RetryReason(Enum):
+	"""可重试的失败类型"""
+
+	TIMEOUT = ('timeout', '请求超时')
+	CONNECT_ERROR = ('connect_error', '连接失败')
+	SERVER_ERROR = ('server_error', '服务端错误')
+	RATE_LIMITED = ('rate_limited', '请求过于频繁')
+	WAF_BLOCKED = ('waf_blocked', 'WAF 拦截')
+
+	def __init__(self, value: str, tag: str):
+		"""
+		初始化失败类型枚举
+
+		Args:
+			value: 失败类型的字符串值
+			tag: 失败类型的中文描述
+		"""
+		self._value_ = value
+		self._tag = tag
+
+	def get_tag(self) -> str:
+		"""获取失败类型的中文描述"""
+		return self._tag
+
+
+class RetryableError(Exception):
+	"""调用方主动标记为可重试的失败（如 WAF 拦截）"""
+
+	def __init__(self, reason: RetryReason, message: str, retry_after: float | None = None):
+		"""
+		初始化可重试异常
+
+		Args:
+			reason: 失败类型
+			message: 错误信息
+			retry_after: 服务端要求的最短等待时间（秒）
+		"""
+		super().__init__(message)
+		self.reason = reason
+		self.retry_after = retry_after
+
+
+class RetryBudget:
+	"""
+	整次运行共享的重试预算
+
+	站点整体故障时，每个请求都重试会成倍放大请求量，预算用尽后所有请求都只尝试一次。
+	"""
+
+	def __init__(self, max_retries: int):
+		"""
+		初始化重试预算
+
+		Args:
+			max_retries: 整次运行允许的最大重试次数
+		"""
+		self.max_retries = max_retries
+		self.used = 0
+
+	@property
+	def remaining(self) -> int:
+		"""剩余可用的重试次数"""
+		return max(self.max_retries - self.used, 0)
+
+	def try_acquire(self) -> bool:
+		"""
+		申请一次重试
+
+		Returns:
+			预算充足返回 True，已用尽返回 False
+		"""
+		if self.used >= self.max_retries:
+			return False
+
+		self.used += 1
+		if self.used == self.max_retries:
+			logger.warning(f'本次运行的重试预算（{self.max_retries} 次）已用尽，之后的请求将不再重试', tag='重试')
+		return True
+
+	def reset(self):
+		"""重置已用次数（开始新一次运行时调用）"""
+		self.used = 0
+
+
+class RetryScope:
+	"""统计一段处理过程（如单个账号）内发生的重试次数"""
+
+	def __init__(self):
+		"""初始化重试统计"""
+		self.count = 0
+
+
+_current_scope: ContextVar[RetryScope | None] = ContextVar('retry_scope', default=None)
+
+
+@contextmanager
+def retry_scope() -> Iterator[RetryScope]:
+	"""
+	开始统计重试次数，with 块内（包括其中的异步调用）发生的重试都会计入返回的 RetryScope
+
+	Yields:
+		RetryScope: 重试统计
+	"""
+	scope = RetryScope()
+	token = _current_scope.set(scope)
+	try:
+		yield scope
+	finally:
+		_current_scope.reset(token)
+
+
+class RetryPolicy:
+	"""
+	异步重试策略
+
+	对超时、连接失败、5xx、429 和 WAF 拦截进行重试，等待时间按指数退避并加入随机抖动，
+	429 响应优先遵循服务端返回的 Retry-After。
+
+	签到、推送等非幂等请求在服务端可能已经处理后才超时或返回 5xx，重试会导致重复签到或重复推送，
+	因此只在请求确定没有被处理（连接未建立、连接池等待超时、429）时重试。
+	"""
+
+	# 默认最大尝试次数（包括第一次请求）
+	DEFAULT_MAX_ATTEMPTS = 3
+
+	# 默认退避基数（秒）
+	DEFAULT_BASE_DELAY = 1.0
+
+	# 默认单次最长等待时间（秒）
+	DEFAULT_MAX_DELAY = 30.0
+
+	def __init__(
+		self,
+		max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+		base_delay: float = DEFAULT_BASE_DELAY,
+		max_delay: float = DEFAULT_MAX_DELAY,
+		budget: RetryBudget | None = None,
+	):
+		"""
+		初始化重试策略
+
+		Args:
+			max_attempts: 最大尝试次数（包括第一次请求），1 表示不重试
+			base_delay: 退避基数（秒），第 n 次重试的等待上限为 base_delay * 2^(n-1)
+			max_delay: 单次最长等待时间（秒），Retry-After 超过该值时不再重试
+			budget: 整次运行共享的重试预算，None 表示不限制
+		"""
+		self.max_attempts = max_attempts
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+		self.budget = budget
+
+	async def call(
+		self,
+		func: Callable[[], Awaitable[T]],
+		operation: str,
+		account_name: str | None = None,
+		idempotent: bool = True,
+	) -> T:
+		"""
+		执行异步操作，失败时按策略重试
+
+		返回值为 HTTP 响应时，5xx 和 429 同样会触发重试；重试次数用尽后返回最后一次的响应，
+		由调用方按原有逻辑处理。
+
+		Args:
+			func: 每次尝试时调用的异步函数
+			operation: 操作名称（用于日志）
+			account_name: 账号名称（用于日志）
+			idempotent: 操作是否幂等，False 时只重试确定没有被服务端处理的失败
+
+		Returns:
+			最后一次尝试的返回值
+
+		Raises:
+			Exception: 不可重试的异常，或重试次数用尽后最后一次的异常
+		"""
+		attempt = 1
+		while True:
+			try:
+				result = await func()
+			except Exception as e:
+				decision = self.classify_exception(e, idempotent)
+				if decision is None or not self._can_retry(attempt, decision[1]):
+					raise
+			else:
+				decision = self.classify_result(result, idempotent)
+				if decision is None or not self._can_retry(attempt, decision[1]):
+					return result
+
+			reason, retry_after = decision
+			delay = self._compute_delay(attempt, retry_after)
+			logger.warning(
+				message=f'{operation}失败（{reason.get_tag()}），{delay:.1f} 秒后进行第 {attempt} 次重试',
+				tag='重试',
+				account_name=account_name,
+			)
+
+			scope = _current_scope.get()
+			if scope is not None:
+				scope.count += 1
+
+			await self._sleep(delay)
+			attempt += 1
+
+	@classmethod
+	def classify_exception(cls, error: Exception, idempotent: bool = True) -> tuple[RetryReason, float | None] | None:
+		"""
+		判断异常是否可以重试
+
+		Args:
+			error: 异常
+			idempotent: 操作是否幂等，False 时只有连接未建立的异常可以重试
+
+		Returns:
+			(失败类型, Retry-After 秒数) 元组，不可重试时返回 None
+		"""
+		if isinstance(error, RetryableError):
+			return error.reason, error.retry_after
+
+		# httpx 导入较慢，只在判断异常类型时导入（出现 httpx 异常时它早已加载）
+		import httpx
+
+		# 非幂等请求只重试连接阶段的失败，读写超时与连接中断时服务端可能已经处理了请求
+		if not idempotent:
+			if isinstance(error, (httpx.ConnectTimeout, httpx.PoolTimeout)):
+				return RetryReason.TIMEOUT, None
+			if isinstance(error, (httpx.ConnectError, ConnectionRefusedError)):
+				return RetryReason.CONNECT_ERROR, None
+			return None
+
+		# httpx.ConnectTimeout 同时属于超时，优先按超时处理
+		if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+			return RetryReason.TIMEOUT, None
+
+		if isinstance(error, (httpx.ConnectError, ConnectionError)):
+			return RetryReason.CONNECT_ERROR, None
+
+		return None
+
+	@classmethod
+	def classify_result(cls, result: Any, idempotent: bool = True) -> tuple[RetryReason, float | None] | None:
+		"""
+		判断返回值是否可以重试（仅处理 HTTP 响应）
+
+		Args:
+			result: 返回值
+			idempotent: 操作是否幂等，False 时 5xx 不重试（服务端可能已经处理了请求）
+
+		Returns:
+			(失败类型, Retry-After 秒数) 元组，不可重试时返回 None
+		"""
+		status_code = getattr(result, 'status_code', None)
+		if not isinstance(status_code, int):
+			return None
+
+		if status_code == 429:
+			return RetryReason.RATE_LIMITED, cls._parse_retry_after(result.headers.get('Retry-After'))
+
+		if status_code >= 500 and idempotent:
+			return RetryReason.SERVER_ERROR, None
+
+		return None
+
+	def _can_retry(self, attempt: int, retry_after: float | None) -> bool:
+		"""
+		判断是否还可以继续重试
+
+		Args:
+			attempt: 当前已尝试的次数
+			retry_after: 服务端要求的最短等待时间（秒）
+
+		Returns:
+			可以重试返回 True
+		"""
+		if attempt >= self.max_attempts:
+			return False
+
+		# 服务端要求的等待时间过长，重试也无法在合理时间内完成
+		if retry_after is not None and retry_after > self.max_delay:
+			return False
+
+		return self.budget is None or self.budget.try_acquire()
+
+	def _compute_delay(self, attempt: int, retry_after: float | None) -> float:
+		"""
+		计算下一次重试前的等待时间
+
+		Args:
+			attempt: 当前已尝试的次数
+			retry_after: 服务端要求的最短等待时间（秒）
+
+		Returns:
+			等待时间（秒）
+		"""
+		# 指数退避 + 全抖动，避免多个请求在同一时刻重试
+		backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+		delay = random.uniform(0, backoff)
+
+		if retry_after is not None:
+			delay = max(delay, retry_after)
+
+		return delay
+
+	@staticmethod
+	def _parse_retry_after(value: Any) -> float | None:
+		"""
+		解析 Retry-After 响应头（秒数或 HTTP 日期）
+
+		Args:
+			value: 响应头的值
+
+		Returns:
+			等待时间（秒），无法解析时返回 None
+		"""
+		if not isinstance(value, str) or not value.strip():
+			return None
+
+		value = value.strip()
+		try:
+			return max(float(value), 0.0)
+		except ValueError:
+			pass
+
+		try:
+			retry_at = parsedate_to_datetime(value)
+		except (TypeError, ValueError):
+			return None
+
+		if retry_at.tzinfo is None:
+			retry_at = retry_at.replace(tzinfo=timezone.utc)
+		return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+	@staticmethod
+	async def _sleep(delay: float):
+		"""等待指定时间（单独封装，便于测试中跳过等待）"""
+		await asyncio.sleep(delay)
@@ -0,0 +1,44 @@
+"""
+基准测试
+
+运行（结果写入 JSON，并与基线对比）：
+    PYTHONPATH=src python -m tests.benchmark --output benchmark.json --compare baseline.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from tests.benchmark.cases import ALL_CASES
+from tests.benchmark.runner import compare, load_results, run_suite
+
+
+def main():
+	parser = argparse.ArgumentParser(prog='python -m tests.benchmark', description='热点路径基准测试')
+	parser.add_argument('--output', type=Path, default=Path('benchmark.json'), help='结果文件，默认为 benchmark.json')
+	parser.add_argument('--compare', type=Path, default=None, help='基线结果文件，提供时与本次结果对比')
+	parser.add_argument('--threshold', type=float, default=1.3, help='允许的变慢比例，默认为 1.3')
+	parser.add_argument('--min-time', type=float, default=0.2, help='每个用例的最短累计计时（秒），默认为 0.2')
+	parser.add_argument('-k', dest='pattern', default=None, help='只运行名称包含该字符串的用例')
+	args = parser.parse_args()
+
+	current = run_suite(ALL_CASES, min_time=args.min_time, pattern=args.pattern)
+	args.output.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding='utf-8')
+	print(f'\n结果已写入 {args.output}')
+
+	if args.compare is None:
+		return
+
+	if not args.compare.exists():
+		print(f'基线文件 {args.compare} 不存在，跳过对比')
+		return
+
+	regressions = compare(load_results(args.compare), current, threshold=args.threshold)
+	if regressions:
+		print(f'\n{len(regressions)} 个用例变慢超过阈值：{", ".join(regressions)}')
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from application import Application
+from core.account_override_index import AccountOverrideIndex
+from core.balance_manager import BalanceManager
+from core.checkin_service import CheckinService
+from core.models import AccountResult, NotificationData, NotificationStats
+from core.privacy_handler import PrivacyHandler
+from notif import NotificationKit
+from notif.models import NotificationTemplate
+from tests.benchmark.runner import BenchmarkCase
+from tests.tools.anyrouter_stub import AnyRouterStub
+
+# 配置类用例的数据规模
+CONFIG_SIZES = [10, 1_000, 10_000]
+
+# 完整运行用例的账号数量
+RUN_SIZES = [10, 100]
+
+
+def build_accounts(size: int, duplicates: bool = True) -> list[dict[str, Any]]:
+	"""构建账号配置（默认每 10 个账号中有 1 个重复账号，用于覆盖去重逻辑）"""
+	duplicate_count = size // 10 if duplicates else 0
+	accounts = [
+		{'name': f'账号{i}', 'cookies': {'session': f'session-{i}'}, 'api_user': f'user_{i}'}
+		for i in range(size - duplicate_count)
+	]  # fmt: skip
+	return accounts + accounts[:duplicate_count]
+
+
+def build_notification_data(size: int) -> NotificationData:
+	"""构建通知数据（成功、失败、余额变化的账号混合）"""
+	accounts = [
+		AccountResult(
+			name=f'账号{i}',
+			status='failed' if i % 7 == 0 else 'success',
+			quota=100.0 + i if i % 7 else None,
+			used=float(i) if i % 7 else None,
+			balance_changed=None if i % 7 == 0 else i % 3 == 0,
+			error='签到失败' if i % 7 == 0 else None,
+		)
+		for i in range(size)
+	]
+	failed_count = sum(1 for account in accounts if account.status != 'success')
+	return NotificationData(
+		accounts=accounts,
+		stats=NotificationStats(success_count=size - failed_count, failed_count=failed_count, total_count=size),
+		timestamp='2026-01-01 00:00:00',
+		timezone='Asia/Shanghai',
+	)
+
+
+def setup_load_accounts(size: int):
+	"""从环境变量加载账号配置并去重"""
+	env = patch.dict(os.environ, {'ANYROUTER_ACCOUNTS': json.dumps(build_accounts(size), ensure_ascii=False)})
+	env.start()
+	app = Application()
+	return app._load_accounts, env.stop
+
+
+def setup_render_template(size: int):
+	"""使用默认的钉钉模板渲染通知"""
+	kit = NotificationKit()
+	default_config = kit._load_default_config('dingtalk') or {}
+	template = NotificationTemplate.from_value(default_config.get('template'))
+	context_data = kit._build_context_data(build_notification_data(size))
+	return lambda: kit._render_template(template, context_data), None
+
+
+def setup_build_context(size: int):
+	"""构建模板渲染的上下文数据"""
+	kit = NotificationKit()
+	data = build_notification_data(size)
+	return lambda: kit._build_context_data(data), None
+
+
+def setup_safe_account_name(size: int):
+	"""生成脱敏的账号名称"""
+	handler = PrivacyHandler(show_sensitive_info=False)
+	accounts = build_accounts(size)
+
+	def run():
+		for index, account in enumerate(accounts):
+			handler.get_safe_account_name(account, index)
+
+	return run, None
+
+
+def setup_override_misses(size: int):
+	"""查找没有覆盖配置的账号（回退为子串匹配且全部未命中）"""
+	index = AccountOverrideIndex({f'USER{i:06d}_{i % 7}': {} for i in range(size)})
+
+	def run():
+		for i in range(size):
+			index.pop(f'9{i:06d}')
+
+	return run, None
+
+
+def setup_balance_state(size: int):
+	"""生成余额 hash、保存余额状态文件并重新加载"""
+	temp_dir = tempfile.TemporaryDirectory()
+	manager = BalanceManager(Path(temp_dir.name) / 'balance_hash.txt')
+	records = [(f'user_{i}', 100.0 + i, float(i)) for i in range(size)]
+
+	def run():
+		balance_hash_dict = {
+			manager.generate_account_key(api_user): manager.generate_balance_hash(quota=quota, used=used)
+			for api_user, quota, used in records
+		}
+		manager.save_balance_hash(balance_hash_dict=balance_hash_dict)
+		manager.load_balance_hash()
+
+	return run, temp_dir.cleanup
+
+
+def setup_full_run(size: int):
+	"""
+	针对本地模拟站点完整运行一次签到（跳过浏览器，HTTP 请求真实发送到模拟站点，不发送通知）
+
+	模拟站点运行在独立线程的事件循环中，每轮创建新的 Application，状态文件写入临时目录。
+	"""
+	temp_dir = tempfile.TemporaryDirectory()
+	stub = AnyRouterStub()
+	loop = asyncio.new_event_loop()
+	thread = threading.Thread(target=loop.run_forever, daemon=True)
+	thread.start()
+	base_url = asyncio.run_coroutine_threadsafe(stub.start(), loop).result()
+
+	stack = ExitStack()
+	stack.enter_context(
+		patch.dict(
+			os.environ,
+			{
+				'ANYROUTER_ACCOUNTS': json.dumps(build_accounts(size, duplicates=False)),
+				'ANYROUTER_BASE_URL': base_url,
+				'GITHUB_STEP_SUMMARY': os.devnull,
+			},
+		)
+	)
+	stack.enter_context(
+		patch.object(
+			CheckinService,
+			'_get_waf_cookies_with_playwright',
+			AsyncMock(return_value=dict(AnyRouterStub.WAF_COOKIES)),
+		)
+	)
+	stack.enter_context(patch.object(NotificationKit, 'push_message', AsyncMock()))
+
+	async def run():
+		app = Application()
+		app.balance_manager.balance_hash_file = Path(temp_dir.name) / 'balance_hash.txt'
+		app.run_journal.journal_file = Path(temp_dir.name) / 'run_journal.jsonl'
+		try:
+			await app.run()
+		except SystemExit:
+			pass
+
+	def cleanup():
+		stack.close()
+		asyncio.run_coroutine_threadsafe(stub.stop(), loop).result()
+		loop.call_soon_threadsafe(loop.stop)
+		thread.join()
+		loop.close()
+		temp_dir.cleanup()
+
+	return run, cleanup
+
+
+def _cases(name: str, sizes: list[int], setup: Callable, min_rounds: int = 3) -> list[BenchmarkCase]:
+	"""为每个规模生成一个用例"""
+	return [BenchmarkCase(name=name, size=size, setup=setup, min_rounds=min_rounds) for size in sizes]
+
+
+ALL_CASES: list[BenchmarkCase] = [
+	*_cases('load_accounts', CONFIG_SIZES, setup_load_accounts),
+	*_cases('render_template', CONFIG_SIZES, setup_render_template),
+	*_cases('build_context', CONFIG_SIZES, setup_build_context),
+	*_cases('safe_account_name', CONFIG_SIZES, setup_safe_account_name),
+	*_cases('balance_state', CONFIG_SIZES, setup_balance_state),
+	*_cases('override_misses', CONFIG_SIZES, setup_override_misses),
+	*_cases('full_run', RUN_SIZES, setup_full_run, min_rounds=2),
+]
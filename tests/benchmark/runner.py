@@ -0,0 +1,199 @@
+import asyncio
+import contextlib
+import inspect
+import io
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from tools.logger import logger
+
+# 基准结果文件格式版本
+FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchmarkCase:
+	"""单个基准用例"""
+
+	# 用例名称（同一用例的不同规模以 name/size 区分）
+	name: str
+
+	# 数据规模
+	size: int
+
+	# 准备函数：根据规模构建数据，返回被计时的函数（同步或异步）以及清理函数
+	setup: Callable[[int], tuple[Callable[[], Any | Awaitable[Any]], Callable[[], None] | None]]
+
+	# 每个用例最少的计时轮数
+	min_rounds: int = 3
+
+	@property
+	def key(self) -> str:
+		"""结果中的唯一标识"""
+		return f'{self.name}/{self.size}'
+
+
+@dataclass
+class BenchmarkResult:
+	"""单个基准用例的计时结果（秒）"""
+
+	median: float
+	min: float
+	rounds: int
+
+	# 每秒处理的数据条数（按中位数计算）
+	throughput: float
+
+
+def run_case(case: BenchmarkCase, min_time: float) -> BenchmarkResult:
+	"""
+	运行单个基准用例：至少运行 min_rounds 轮，并持续到累计时间超过 min_time
+
+	被测代码的日志输出会被丢弃，避免终端输出影响计时。
+
+	Args:
+		case: 基准用例
+		min_time: 最短累计计时（秒）
+
+	Returns:
+		BenchmarkResult: 计时结果
+	"""
+	with contextlib.redirect_stdout(io.StringIO()):
+		func, cleanup = case.setup(case.size)
+		try:
+			timings: list[float] = []
+			while len(timings) < case.min_rounds or sum(timings) < min_time:
+				started_at = time.perf_counter()
+				result = func()
+				if inspect.isawaitable(result):
+					asyncio.run(_await(result))
+				timings.append(time.perf_counter() - started_at)
+		finally:
+			if cleanup is not None:
+				cleanup()
+			# 控制台输出目标在写出时才读取 sys.stdout，需在恢复 stdout 前写出缓冲区
+			logger.flush()
+
+	median = statistics.median(timings)
+	return BenchmarkResult(
+		median=median,
+		min=min(timings),
+		rounds=len(timings),
+		throughput=case.size / median if median > 0 else 0.0,
+	)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+	"""在新的事件循环中等待协程"""
+	return await awaitable
+
+
+def run_suite(cases: list[BenchmarkCase], min_time: float, pattern: str | None = None) -> dict[str, Any]:
+	"""
+	运行基准用例并生成结果
+
+	Args:
+		cases: 基准用例列表
+		min_time: 每个用例的最短累计计时（秒）
+		pattern: 只运行名称包含该字符串的用例
+
+	Returns:
+		dict[str, Any]: 可直接写入 JSON 的基准结果
+	"""
+	results: dict[str, dict[str, Any]] = {}
+	for case in cases:
+		if pattern and pattern not in case.key:
+			continue
+
+		result = run_case(case, min_time)
+		results[case.key] = asdict(result)
+		print(f'{case.key:<40} 中位数 {_format_seconds(result.median):>10}  {result.throughput:>12,.0f} 条/秒')
+
+	return {
+		'version': FORMAT_VERSION,
+		'commit': _current_commit(),
+		'python': platform.python_version(),
+		'platform': platform.platform(),
+		'results': results,
+	}
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+	"""
+	对比两次基准结果，返回变慢超过阈值的用例
+
+	Args:
+		baseline: 基线结果
+		current: 本次结果
+		threshold: 允许的变慢比例，例如 1.3 表示中位数超过基线的 1.3 倍时视为退化
+
+	Returns:
+		list[str]: 退化的用例名称
+	"""
+	regressions: list[str] = []
+	baseline_results = baseline.get('results', {})
+
+	print(f'\n与基线对比（{baseline.get("commit") or "未知提交"}，阈值 {threshold:.2f}x）：')
+	for key, result in current.get('results', {}).items():
+		base = baseline_results.get(key)
+		if base is None or base.get('median', 0) <= 0:
+			print(f'{key:<40} 新增用例')
+			continue
+
+		ratio = result['median'] / base['median']
+		marker = '退化' if ratio > threshold else ''
+		print(
+			f'{key:<40} {_format_seconds(base["median"]):>10} -> {_format_seconds(result["median"]):>10}  {ratio:5.2f}x {marker}'
+		)
+		if ratio > threshold:
+			regressions.append(key)
+
+	return regressions
+
+
+def load_results(path: Path) -> dict[str, Any]:
+	"""
+	读取基准结果文件
+
+	Args:
+		path: 文件路径
+
+	Returns:
+		dict[str, Any]: 基准结果
+
+	Raises:
+		ValueError: 文件格式版本不匹配
+	"""
+	data = json.loads(path.read_text(encoding='utf-8'))
+	if data.get('version') != FORMAT_VERSION:
+		raise ValueError(f'不支持的基准结果格式版本：{data.get("version")}')
+	return data
+
+
+def _format_seconds(seconds: float) -> str:
+	"""格式化耗时"""
+	if seconds < 1e-3:
+		return f'{seconds * 1e6:.1f}µs'
+	if seconds < 1:
+		return f'{seconds * 1e3:.2f}ms'
+	return f'{seconds:.3f}s'
+
+
+def _current_commit() -> str | None:
+	"""获取当前 git 提交（不在 git 仓库中时返回 None）"""
+	try:
+		return subprocess.run(
+			['git', 'rev-parse', '--short', 'HEAD'],
+			capture_output=True,
+			text=True,
+			check=True,
+		).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
@@ -1,7 +1,9 @@
 import sys
 from pathlib import Path
 from typing import Any
+from unittest.mock import AsyncMock
 
+import pytest
 from dotenv import load_dotenv
 
 # 添加项目根目录到 PATH
@@ -23,6 +25,22 @@ from tests.fixtures.data import (
 from tests.fixtures.env import accounts_env, clean_notification_env, config_env_setter
 
 
+@pytest.fixture(autouse=True)
+def skip_retry_delay(monkeypatch: pytest.MonkeyPatch):
+	"""跳过重试前的退避等待与限流等待，避免拖慢测试"""
+	monkeypatch.setattr('tools.retry.retry_policy.RetryPolicy._sleep', AsyncMock())
+	monkeypatch.setattr('tools.rate_limiter.token_bucket.TokenBucket._sleep', AsyncMock())
+
+
+@pytest.fixture(autouse=True)
+def flush_logger():
+	"""每个测试结束时写出缓冲区中的日志，避免日志混入下一个测试的输出"""
+	yield
+	from tools.logger import logger
+
+	logger.flush()
+
+
 def assert_json_contains(actual: dict[str, Any], expected: dict[str, Any]) -> None:
 	"""
 	断言 JSON 包含预期的键值对（支持嵌套）
@@ -45,7 +45,7 @@ class MockPlaywright:
 
 		manager = MagicMock()
 		manager.__aenter__ = AsyncMock(return_value=mock_playwright)
-		manager.__aexit__ = AsyncMock()
+		manager.__aexit__ = AsyncMock(return_value=None)  # 返回 None 以避免抑制异常
 
 		stack.enter_context(patch('core.checkin_service.async_playwright', return_value=manager))
 
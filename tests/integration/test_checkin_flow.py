@@ -180,7 +180,7 @@ class TestCheckinFlow:
 						await app_partial.run()
 
 		assert mock_push.await_count == 1, '有失败账号应该发送通知'
-		assert call_count['post'] == 2, '应该尝试签到 2 个账号'
+		assert call_count['post'] == 2, '签到请求不是幂等的，返回 5xx 时不应该重试'
 
 		# 测试全部失败
 		app_all_fail = Application()
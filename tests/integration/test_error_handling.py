@@ -7,8 +7,10 @@ import httpx
 import pytest
 
 from application import Application
+from core.checkin_service import CheckinService
 from tests.fixtures.data import SINGLE_ACCOUNT
 from tests.fixtures.mock_dependencies import MockHttpClient, MockPlaywright
+from tools.retry import RetryableError, RetryPolicy, RetryReason
 
 
 class TestErrorHandling:
@@ -42,7 +44,7 @@ class TestErrorHandling:
 				with pytest.raises(SystemExit):
 					await app_http.run()
 
-		assert call_count['get'] == 2, '应该尝试获取 2 个账号的余额'
+		assert call_count['get'] == 1 + RetryPolicy.DEFAULT_MAX_ATTEMPTS, '401 不重试，5xx 按重试策略重试'
 
 		# 测试超时异常
 		accounts_env(SINGLE_ACCOUNT)
@@ -120,6 +122,49 @@ class TestErrorHandling:
 				with pytest.raises(SystemExit):
 					await app2.run()
 
+	@pytest.mark.asyncio
+	async def test_waf_timeout_classification(self):
+		"""测试只有 Playwright 的超时异常会被标记为可重试的超时"""
+		from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+		with ExitStack() as stack:
+			MockPlaywright.setup_failure(stack, PlaywrightTimeoutError('Timeout 30000ms exceeded'))
+
+			with pytest.raises(RetryableError) as exc_info:
+				await CheckinService()._collect_waf_cookies('测试账号')
+
+		assert exc_info.value.reason is RetryReason.TIMEOUT
+
+		# 类名中带 Timeout 的其他异常不应被当作超时
+		class LockTimeoutFlag(Exception):
+			pass
+
+		with ExitStack() as stack:
+			MockPlaywright.setup_failure(stack, LockTimeoutFlag('unrelated'))
+
+			with pytest.raises(LockTimeoutFlag):
+				await CheckinService()._collect_waf_cookies('测试账号')
+
+	@pytest.mark.asyncio
+	async def test_circuit_breaker_fast_fails_remaining_accounts(self, accounts_env, tmp_path):
+		"""测试 WAF 持续拦截时触发熔断，其余账号直接失败"""
+		accounts_env([{'name': f'账号{i}', 'cookies': f'session={i}', 'api_user': f'user_{i}'} for i in range(5)])
+		app = Application()
+		app.balance_manager.balance_hash_file = tmp_path / 'hash_breaker.txt'
+
+		with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': '/dev/null'}):
+			with ExitStack() as stack:
+				MockPlaywright.setup_success(stack, cookies=[{'name': 'acw_tc', 'value': 'value1'}])
+
+				with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+					with pytest.raises(SystemExit) as exc_info:
+						await app.run()
+
+		assert exc_info.value.code == 1
+		errors = [account.error for account in mock_push.await_args.args[0].accounts]
+		assert errors[:3] == [None, None, None], '前 3 个账号正常尝试获取 WAF cookies'
+		assert all('熔断' in error for error in errors[3:]), '熔断后的账号应直接失败并说明原因'
+
 	@pytest.mark.asyncio
 	@pytest.mark.parametrize(
 		'payload,description',
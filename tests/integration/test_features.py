@@ -1,14 +1,17 @@
+import gzip
 import json
 import os
 from contextlib import ExitStack
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from application import Application
+from core.models import ShardSpec
 from tests.conftest import assert_file_content_contains
 from tests.fixtures.data import MIXED_ACCOUNTS
-from tests.fixtures.mock_dependencies import MockHttpClient, MockPlaywright, MockSMTP
+from tests.fixtures.mock_dependencies import HttpRequestTracker, MockHttpClient, MockPlaywright, MockSMTP
+from tools.logger import logger
 
 
 class TestFeatures:
@@ -47,6 +50,174 @@ class TestFeatures:
 		assert summary_file.exists()
 		assert_file_content_contains(summary_file, expected_in_content)
 
+	@pytest.mark.asyncio
+	async def test_skip_checked_in_accounts(self, accounts_env, tmp_path, monkeypatch):
+		"""测试今日已签到的账号跳过 WAF 与签到步骤"""
+		accounts_env(MIXED_ACCOUNTS)
+		monkeypatch.setenv('SKIP_CHECKED_IN', 'true')
+
+		trackers = []
+		for _ in range(2):
+			app = Application()
+			app.balance_manager.balance_hash_file = tmp_path / 'balance_hash.txt'
+			app.checkin_ledger.ledger_file = tmp_path / 'checkin_ledger.json'
+
+			with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': '/dev/null'}):
+				with ExitStack() as stack:
+					MockPlaywright.setup_success(stack)
+					tracker = HttpRequestTracker()
+					MockHttpClient.setup(stack, tracker.get_handler, tracker.post_handler)
+
+					with pytest.raises(SystemExit) as exc_info:
+						await app.run()
+
+			assert exc_info.value.code == 0
+			trackers.append(tracker)
+
+		# 第一次运行正常签到并写入台账
+		assert trackers[0].checkin_count == 2
+		assert (tmp_path / 'checkin_ledger.json').exists()
+
+		# 第二次运行不再签到，只刷新余额
+		assert trackers[1].checkin_count == 0
+		assert trackers[1].get_count == 2
+
+	@pytest.mark.asyncio
+	async def test_run_deadline_marks_unreached_accounts(self, accounts_env, tmp_path, monkeypatch):
+		"""测试全局时间预算不足时，未处理的账号被标记为跳过"""
+		accounts_env(MIXED_ACCOUNTS)
+		monkeypatch.setenv('CHECKIN_RUN_DEADLINE', '1')
+
+		app = Application()
+		app.balance_manager.balance_hash_file = tmp_path / 'balance_hash.txt'
+		app.checkin_ledger.ledger_file = tmp_path / 'checkin_ledger.json'
+		summary_file = tmp_path / 'summary.md'
+
+		with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': str(summary_file), 'REPO_VISIBILITY': 'public'}):
+			with ExitStack() as stack:
+				MockPlaywright.setup_success(stack)
+				tracker = HttpRequestTracker()
+				MockHttpClient.setup(stack, tracker.get_handler, tracker.post_handler)
+
+				with pytest.raises(SystemExit) as exc_info:
+					await app.run()
+
+		assert exc_info.value.code == 1
+		assert tracker.checkin_count == 0
+		assert_file_content_contains(summary_file, '未执行')
+
+	@pytest.mark.asyncio
+	async def test_timeout_without_deadline(self, accounts_env, tmp_path, monkeypatch):
+		"""测试未设置全局时间预算时，签到过程中的超时按失败处理而不是中断运行"""
+		accounts_env(MIXED_ACCOUNTS)
+		monkeypatch.delenv('CHECKIN_RUN_DEADLINE', raising=False)
+
+		app = Application()
+		app.balance_manager.balance_hash_file = tmp_path / 'balance_hash.txt'
+		app.checkin_ledger.ledger_file = tmp_path / 'checkin_ledger.json'
+		summary_file = tmp_path / 'summary.md'
+
+		with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': str(summary_file), 'REPO_VISIBILITY': 'public'}):
+			with patch.object(app.checkin_service, 'check_in_account', AsyncMock(side_effect=TimeoutError())):
+				with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+					with pytest.raises(SystemExit) as exc_info:
+						await app.run()
+
+		assert exc_info.value.code == 1
+		assert_file_content_contains(summary_file, '处理超时')
+		notif_data = mock_push.call_args.args[0]
+		assert all(account.error == '处理超时' for account in notif_data.accounts)
+
+	@pytest.mark.asyncio
+	async def test_shard_and_merge(self, accounts_env, tmp_path):
+		"""测试分片运行与合并：每个账号只在一个分片中处理，合并后只发送一次通知"""
+		accounts = [{'name': f'账号{i}', 'cookies': f'session={i}', 'api_user': f'user_{i}'} for i in range(6)]
+		accounts_env(accounts)
+		shard_dir = tmp_path / 'shards'
+		balance_file = tmp_path / 'balance_hash.txt'
+
+		checkin_count = 0
+		for index in (1, 2, 3):
+			app = Application(shard=ShardSpec(index=index, count=3), shard_dir=shard_dir)
+			app.balance_manager.balance_hash_file = balance_file
+
+			with ExitStack() as stack:
+				MockPlaywright.setup_success(stack)
+				tracker = HttpRequestTracker()
+				MockHttpClient.setup(stack, tracker.get_handler, tracker.post_handler)
+
+				with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+					with pytest.raises(SystemExit):
+						await app.run()
+
+			assert mock_push.await_count == 0, '分片运行时不发送通知'
+			checkin_count += tracker.checkin_count
+
+		assert checkin_count == len(accounts), '每个账号只在一个分片中签到'
+		assert not balance_file.exists(), '分片运行时只写入余额状态片段'
+
+		app = Application(shard_dir=shard_dir)
+		app.balance_manager.balance_hash_file = balance_file
+		summary_file = tmp_path / 'summary.md'
+
+		with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': str(summary_file), 'REPO_VISIBILITY': 'private'}):
+			with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+				with pytest.raises(SystemExit) as exc_info:
+					await app.merge()
+
+		assert exc_info.value.code == 0
+		assert mock_push.await_count == 1
+		notification_data = mock_push.await_args.args[0]
+		assert [account.name for account in notification_data.accounts] == [account['name'] for account in accounts]
+		assert notification_data.stats.success_count == len(accounts)
+		assert len(app.balance_manager.load_balance_hash() or []) == len(accounts)
+		assert_file_content_contains(summary_file, '账号5')
+
+	@pytest.mark.asyncio
+	async def test_resume_from_run_journal(self, accounts_env, tmp_path):
+		"""测试运行中途被终止后，恢复模式跳过已完成的账号并在通知中包含其结果"""
+
+		class RunnerKilled(BaseException):
+			"""模拟 Runner 被强制终止"""
+
+		accounts = [{'name': f'账号{i}', 'cookies': f'session={i}', 'api_user': f'user_{i}'} for i in range(3)]
+		accounts_env(accounts)
+
+		async def check_in(account, index):
+			if account.api_user == 'user_2':
+				raise RunnerKilled()
+			return True, {'success': True, 'quota': 100.0 + index, 'used_quota': 1.0}
+
+		app = Application()
+		app.balance_manager.balance_hash_file = tmp_path / 'balance_hash.txt'
+		app.run_journal.journal_file = tmp_path / 'run_journal.jsonl'
+
+		with patch.object(app.checkin_service, 'check_in_account', AsyncMock(side_effect=check_in)):
+			with pytest.raises(RunnerKilled):
+				await app.run()
+
+		assert not app.balance_manager.balance_hash_file.exists(), '中途终止时来不及保存余额状态'
+		assert len(app.run_journal.journal_file.read_text().splitlines()) == 2
+
+		resumed = Application(resume=True)
+		resumed.balance_manager.balance_hash_file = app.balance_manager.balance_hash_file
+		resumed.run_journal.journal_file = app.run_journal.journal_file
+		resumed_checkin = AsyncMock(return_value=(True, {'success': True, 'quota': 102.0, 'used_quota': 1.0}))
+
+		with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': '/dev/null'}):
+			with patch.object(resumed.checkin_service, 'check_in_account', resumed_checkin):
+				with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+					with pytest.raises(SystemExit) as exc_info:
+						await resumed.run()
+
+		assert exc_info.value.code == 0
+		assert resumed_checkin.await_count == 1, '只处理上次未完成的账号'
+		notification_data = mock_push.await_args.args[0]
+		assert [account.name for account in notification_data.accounts] == [account['name'] for account in accounts]
+		assert [account.quota for account in notification_data.accounts] == [100.0, 101.0, 102.0]
+		assert len(resumed.balance_manager.load_balance_hash() or []) == len(accounts)
+		assert not resumed.run_journal.journal_file.exists(), '状态保存后清空运行日志'
+
 	@pytest.mark.asyncio
 	async def test_notification_template_rendering(
 		self,
@@ -103,6 +274,7 @@ class TestFeatures:
 			('merge', 3, None),  # ANYROUTER_ACCOUNTS(1) + ANYROUTER_ACCOUNT_*(2) = 3 个账号
 			('override_by_api_user', 2, 'session=new'),  # 覆盖场景：通过 api_user 匹配
 			('override_with_suffix', 1, 'session=new'),  # 覆盖场景：api_user + 可读后缀
+			('override_exact_match', 2, 'session=new'),  # 覆盖场景：api_user 互为子串时精确匹配
 			('invalid_prefix', 1, None),  # 无效的 prefix 配置（缺少必要字段）被忽略
 		],
 	)
@@ -151,6 +323,14 @@ class TestFeatures:
 			# 后缀包含 api_user "12427" 加上可读标识
 			monkeypatch.setenv('ANYROUTER_ACCOUNT_12427_ALICE', json.dumps({'cookies': 'session=new'}))
 
+		elif setup_type == 'override_exact_match':
+			# 覆盖场景：api_user 互为子串时按精确匹配，不受环境变量顺序影响
+			account_with_short_api_user = {'name': 'Short', 'cookies': 'session=short', 'api_user': '124'}
+			account_with_api_user = {'name': 'Alice', 'cookies': 'session=old', 'api_user': '12427'}
+			monkeypatch.setenv('ANYROUTER_ACCOUNTS', json.dumps([account_with_short_api_user, account_with_api_user]))
+			monkeypatch.setenv('ANYROUTER_ACCOUNT_12427', json.dumps({'cookies': 'session=new'}))
+			monkeypatch.setenv('ANYROUTER_ACCOUNT_124', json.dumps({'cookies': 'session=short_new'}))
+
 		elif setup_type == 'invalid_prefix':
 			# 无效的 prefix 配置（缺少必要字段）被忽略
 			monkeypatch.setenv('ANYROUTER_ACCOUNTS', json.dumps([account_alice]))
@@ -168,8 +348,87 @@ class TestFeatures:
 		# 验证覆盖是否生效
 		if expected_cookies:
 			# 查找被覆盖的账号
-			target_account = next((a for a in accounts if a.get('name') == 'Alice'), None)
+			target_account = next((a for a in accounts if a.full_name == 'Alice'), None)
 			assert target_account is not None, f'{setup_type}: 应该存在 "Alice" 账号'
-			assert target_account['cookies'] == expected_cookies, (
-				f'{setup_type}: cookies 应该被覆盖为 {expected_cookies}'
-			)
+			assert target_account.cookies == expected_cookies, f'{setup_type}: cookies 应该被覆盖为 {expected_cookies}'
+
+	def test_load_accounts_from_file(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试从 JSON Lines 账号文件加载账号，与环境变量配置一起覆盖、去重和验证"""
+		for key in list(os.environ.keys()):
+			if key.startswith('ANYROUTER_ACCOUNT_'):
+				monkeypatch.delenv(key, raising=False)
+
+		accounts_file = tmp_path / 'accounts.jsonl.gz'
+		with gzip.open(accounts_file, 'wt', encoding='utf-8') as f:
+			f.write(json.dumps({'name': 'Alice', 'cookies': 'session=old', 'api_user': '12427'}) + '\n')
+			f.write(json.dumps({'name': 'Main', 'cookies': 'session=main', 'api_user': 'user_main'}) + '\n')
+			f.write(json.dumps({'name': 'Invalid', 'cookies': 'session=invalid'}) + '\n')
+
+		monkeypatch.setenv(
+			'ANYROUTER_ACCOUNTS',
+			json.dumps([{'name': 'Main', 'cookies': 'session=main', 'api_user': 'user_main'}]),
+		)
+		monkeypatch.setenv('ANYROUTER_ACCOUNTS_FILE', str(accounts_file))
+		monkeypatch.setenv('ANYROUTER_ACCOUNT_12427', json.dumps({'cookies': 'session=new'}))
+		monkeypatch.setenv(
+			'ANYROUTER_ACCOUNT_BOB',
+			json.dumps({'name': 'Bob', 'cookies': 'session=bob', 'api_user': 'user_bob'}),
+		)
+
+		accounts = Application()._load_accounts()
+
+		assert [account.full_name for account in accounts] == ['Main', 'Alice', 'Bob'], (
+			'数组账号在前，文件账号随后，未匹配的前缀配置最后；重复与无效的账号被移除'
+		)
+		assert accounts[1].cookies == 'session=new', '文件中的账号同样可以被前缀配置覆盖'
+
+		monkeypatch.delenv('ANYROUTER_ACCOUNTS')
+		monkeypatch.delenv('ANYROUTER_ACCOUNT_12427')
+		monkeypatch.delenv('ANYROUTER_ACCOUNT_BOB')
+		monkeypatch.setenv('ANYROUTER_ACCOUNTS_FILE', str(tmp_path / 'missing.jsonl'))
+		assert Application()._load_accounts() == [], '账号文件不存在时没有账号'
+
+	def test_deduplicate_accounts(self, accounts_env, capsys):
+		"""测试去重使用规范化的 cookies 摘要（字符串与字典格式等价），并输出被合并的账号"""
+		accounts_env([
+			{'name': 'Alice', 'cookies': 'session=a; token=t', 'api_user': '1'},
+			{'name': 'Alice', 'cookies': {'token': 't', 'session': 'a'}, 'api_user': '1'},
+			{'name': 'Alice', 'cookies': 'token=t;session=a', 'api_user': '1'},
+			{'name': 'Alice', 'cookies': 'session=b; token=t', 'api_user': '1'},
+			{'name': 'Bob', 'cookies': 'session=a; token=t', 'api_user': '1'},
+		])
+
+		accounts = Application()._load_accounts()
+
+		assert [account.cookies for account in accounts] == [
+			'session=a; token=t',
+			'session=b; token=t',
+			'session=a; token=t',
+		]
+		assert len(Application._generate_account_key({'cookies': 'x' * 4096, 'api_user': '1'})) == 16
+		assert Application._generate_account_key({'cookies': 'a=1', 'api_user': 123}) != (
+			Application._generate_account_key({'cookies': 'a=1', 'api_user': '123'})
+		), 'api_user 的类型不同时不应合并'
+		logger.flush()
+		output = capsys.readouterr().out
+		assert output.count('与第 1 个账号的配置完全一致，已合并') == 2
+		assert '去重后移除了 2 个重复账号' in output
+
+	def test_account_names_precomputed(self, accounts_env, monkeypatch: pytest.MonkeyPatch):
+		"""测试账号名称在加载时按有效账号的索引计算一次，公开仓库下同时保存脱敏名称"""
+		monkeypatch.setenv('REPO_VISIBILITY', 'public')
+		monkeypatch.delenv('SHOW_SENSITIVE_INFO', raising=False)
+		monkeypatch.delenv('ACTIONS_RUNNER_DEBUG', raising=False)
+		accounts_env([
+			{'name': 'Alice', 'cookies': 'session=a', 'api_user': '1'},
+			{'name': 'Invalid', 'api_user': '2'},
+			{'cookies': 'session=c', 'api_user': '3'},
+		])
+
+		app = Application()
+		accounts = app._load_accounts()
+
+		assert [account.full_name for account in accounts] == ['Alice', '账号 2']
+		assert [account.safe_name for account in accounts] == [app.privacy_handler.mask_account_name('Alice'), '账号 2']
+		assert accounts[0].safe_name != 'Alice'
+		assert app.checkin_service.privacy_handler is app.privacy_handler
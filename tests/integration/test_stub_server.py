@@ -0,0 +1,75 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from application import Application
+from core.checkin_service import CheckinService
+from core.models import AccountConfig
+from tests.tools.anyrouter_stub import AnyRouterStub, StubConfig
+from tools.retry import RetryPolicy
+
+ACCOUNT_CONFIG = {'name': '模拟账号', 'cookies': 'session=stub', 'api_user': 'stub_user'}
+ACCOUNT = AccountConfig.from_dict(ACCOUNT_CONFIG, full_name='模拟账号', safe_name='模拟账号')
+
+
+@pytest.fixture
+def stub_waf_cookies():
+	"""跳过浏览器，直接使用模拟站点下发的 WAF cookies（其余请求都真实发送到模拟站点）"""
+	with patch.object(
+		CheckinService,
+		'_get_waf_cookies_with_playwright',
+		AsyncMock(return_value=dict(AnyRouterStub.WAF_COOKIES)),
+	):
+		yield
+
+
+class TestStubServer:
+	"""使用本地模拟站点测试真实的 HTTP 请求路径"""
+
+	@pytest.mark.asyncio
+	async def test_checkin_against_stub(self, accounts_env, tmp_path, monkeypatch, stub_waf_cookies):
+		"""测试完整签到流程：真实发送 HTTP 请求，签到后余额增加"""
+		accounts_env([ACCOUNT_CONFIG, {**ACCOUNT_CONFIG, 'name': '模拟账号2', 'api_user': 'stub_user_2'}])
+
+		async with AnyRouterStub() as stub:
+			monkeypatch.setenv('ANYROUTER_BASE_URL', stub.base_url)
+			app = Application()
+			app.balance_manager.balance_hash_file = tmp_path / 'balance_hash.txt'
+			app.run_journal.journal_file = tmp_path / 'run_journal.jsonl'
+
+			with patch.dict(os.environ, {'GITHUB_STEP_SUMMARY': '/dev/null'}):
+				with patch('notif.notification_kit.NotificationKit.push_message', new=AsyncMock()) as mock_push:
+					with pytest.raises(SystemExit) as exc_info:
+						await app.run()
+
+		assert exc_info.value.code == 0
+		assert stub.stats.checkins == 2
+		assert [account.quota for account in mock_push.await_args.args[0].accounts] == [25.0, 25.0]
+
+	@pytest.mark.asyncio
+	async def test_server_errors_are_retried(self, monkeypatch, stub_waf_cookies):
+		"""测试模拟站点持续返回 500 时余额查询按重试策略重试，非幂等的签到请求不重试"""
+		async with AnyRouterStub(StubConfig(error_rate=1.0)) as stub:
+			monkeypatch.setenv('ANYROUTER_BASE_URL', stub.base_url)
+			success, user_info = await CheckinService().check_in_account(ACCOUNT, 0)
+
+		assert success is False
+		assert user_info == {'success': False, 'error': '获取用户信息失败：HTTP 500'}
+		assert stub.stats.requests['/api/user/self'] == RetryPolicy.DEFAULT_MAX_ATTEMPTS
+		assert stub.stats.requests['/api/user/sign_in'] == 1
+
+	@pytest.mark.asyncio
+	async def test_waf_block_and_throttling(self, monkeypatch):
+		"""测试缺少 WAF cookies 时被拦截，超出限流时返回 429 并按重试策略重试"""
+		# 固定模拟站点的时钟，所有请求落在同一个限流窗口内
+		monkeypatch.setattr('tests.tools.anyrouter_stub.time.monotonic', lambda: 1000.0)
+
+		async with AnyRouterStub(StubConfig(rate_limit=1)) as stub:
+			monkeypatch.setenv('ANYROUTER_BASE_URL', stub.base_url)
+			user_info = await CheckinService().refresh_balance(ACCOUNT, 0)
+			throttled = await CheckinService().refresh_balance(ACCOUNT, 0)
+
+		assert user_info == {'success': False, 'error': '获取用户信息失败：HTTP 405'}
+		assert throttled == {'success': False, 'error': '获取用户信息失败：HTTP 429'}
+		assert stub.stats.throttled == RetryPolicy.DEFAULT_MAX_ATTEMPTS
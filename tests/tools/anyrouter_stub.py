@@ -0,0 +1,308 @@
+"""
+AnyRouter 与 WAF 的本地模拟站点
+
+模拟签到流程中访问的三个地址，用于在没有网络的环境下测试真实的 I/O 路径或进行压测：
+- GET /login：WAF 质询页面，通过 Set-Cookie 下发 acw_tc、cdn_sec_tc，并由页面中的脚本设置 acw_sc__v2
+- GET /api/user/self：返回账号余额，缺少 WAF cookies 时返回 WAF 拦截页面
+- POST /api/user/sign_in：签到，成功后增加余额
+
+延迟、错误率、WAF 拦截率与限流均可配置。仅依赖 httpx 自带的 h11，不需要额外安装 Web 框架。
+
+单独运行（将 ANYROUTER_BASE_URL 指向输出的地址即可）：
+    PYTHONPATH=src python -m tests.tools.anyrouter_stub --port 8765 --latency 0.05 --error-rate 0.05 --rate-limit 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import h11
+
+
+@dataclass
+class StubConfig:
+	"""模拟站点配置"""
+
+	# 每个请求的固定延迟（秒）
+	latency: float = 0.0
+
+	# 在固定延迟上额外增加的随机延迟上限（秒）
+	latency_jitter: float = 0.0
+
+	# API 请求返回 500 的概率
+	error_rate: float = 0.0
+
+	# 登录页面不下发 WAF cookies（模拟被 WAF 拦截）的概率
+	waf_block_rate: float = 0.0
+
+	# 每个客户端每秒允许的 API 请求数，超出时返回 429，None 表示不限流
+	rate_limit: float | None = None
+
+
+@dataclass
+class StubStats:
+	"""模拟站点的请求统计"""
+
+	# 各路径的请求次数
+	requests: dict[str, int] = field(default_factory=dict)
+
+	# 返回 500 的次数
+	errors: int = 0
+
+	# 返回 429 的次数
+	throttled: int = 0
+
+	# 成功签到的次数
+	checkins: int = 0
+
+
+class AnyRouterStub:
+	"""AnyRouter 与 WAF 的本地模拟站点"""
+
+	# 模拟站点下发的 WAF cookies
+	WAF_COOKIES = {'acw_tc': 'stub-acw-tc', 'cdn_sec_tc': 'stub-cdn-sec-tc', 'acw_sc__v2': 'stub-acw-sc-v2'}
+
+	# 新账号的初始额度（与站点一致，500000 为 1 美元）
+	INITIAL_QUOTA = 25 * 500000
+
+	# 每次签到增加的额度
+	CHECKIN_REWARD = 25 * 500000
+
+	def __init__(self, config: StubConfig | None = None):
+		"""
+		初始化模拟站点
+
+		Args:
+			config: 模拟站点配置，None 表示不注入延迟与错误
+		"""
+		self.config = config or StubConfig()
+		self.stats = StubStats()
+		self._quotas: dict[str, int] = {}
+		self._windows: dict[str, tuple[int, int]] = {}
+		self._server: asyncio.Server | None = None
+		self.base_url: str | None = None
+
+	async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+		"""
+		启动模拟站点
+
+		Args:
+			host: 监听地址
+			port: 监听端口，0 表示随机端口
+
+		Returns:
+			str: 站点地址（可直接设置为 ANYROUTER_BASE_URL）
+		"""
+		self._server = await asyncio.start_server(self._handle_connection, host, port)
+		bound_host, bound_port = self._server.sockets[0].getsockname()[:2]
+		self.base_url = f'http://{bound_host}:{bound_port}'
+		return self.base_url
+
+	async def stop(self):
+		"""停止模拟站点"""
+		if self._server is not None:
+			self._server.close()
+			await self._server.wait_closed()
+			self._server = None
+
+	async def __aenter__(self) -> 'AnyRouterStub':
+		await self.start()
+		return self
+
+	async def __aexit__(self, *exc_info):
+		await self.stop()
+
+	async def handle(
+		self,
+		method: str,
+		path: str,
+		headers: dict[str, str],
+		client: str,
+	) -> tuple[int, list[tuple[str, str]], bytes]:
+		"""
+		处理单个请求
+
+		Args:
+			method: 请求方法
+			path: 请求路径（不含查询参数）
+			headers: 请求头（名称为小写）
+			client: 客户端地址（用于限流）
+
+		Returns:
+			(状态码, 响应头, 响应体) 元组
+		"""
+		self.stats.requests[path] = self.stats.requests.get(path, 0) + 1
+
+		delay = self.config.latency + random.uniform(0, self.config.latency_jitter)
+		if delay > 0:
+			await asyncio.sleep(delay)
+
+		if path == '/login' and method == 'GET':
+			return self._login()
+
+		if path in ('/api/user/self', '/api/user/sign_in'):
+			if self._is_throttled(client):
+				self.stats.throttled += 1
+				return self._json(429, {'success': False, 'message': '请求过于频繁'}, [('Retry-After', '1')])
+
+			if random.random() < self.config.error_rate:
+				self.stats.errors += 1
+				return 500, [('Content-Type', 'text/plain')], b'Internal Server Error'
+
+			cookies = self._parse_cookies(headers.get('cookie', ''))
+			if any(cookies.get(name) != value for name, value in self.WAF_COOKIES.items()):
+				return 405, [('Content-Type', 'text/html')], b'<html><body>WAF blocked</body></html>'
+
+			api_user = headers.get('new-api-user', '')
+			if not api_user or not cookies.get('session'):
+				return self._json(401, {'success': False, 'message': '未登录'})
+
+			if path == '/api/user/self' and method == 'GET':
+				return self._json(200, {'success': True, 'data': self._user_data(api_user)})
+
+			if path == '/api/user/sign_in' and method == 'POST':
+				self._quotas[api_user] = self._user_data(api_user)['quota'] + self.CHECKIN_REWARD
+				self.stats.checkins += 1
+				return self._json(200, {'success': True, 'ret': 1, 'message': '签到成功'})
+
+		return 404, [('Content-Type', 'text/plain')], b'Not Found'
+
+	def _login(self) -> tuple[int, list[tuple[str, str]], bytes]:
+		"""WAF 质询页面：两个 cookie 通过响应头下发，acw_sc__v2 由页面脚本设置"""
+		if random.random() < self.config.waf_block_rate:
+			return 200, [('Content-Type', 'text/html')], b'<html><body>challenge failed</body></html>'
+
+		headers = [('Content-Type', 'text/html; charset=utf-8')]
+		for name in ('acw_tc', 'cdn_sec_tc'):
+			headers.append(('Set-Cookie', f'{name}={self.WAF_COOKIES[name]}; Path=/'))
+
+		body = (
+			'<html><head><script>'
+			f'document.cookie = "acw_sc__v2={self.WAF_COOKIES["acw_sc__v2"]}; path=/";'
+			'</script></head><body>login</body></html>'
+		)
+		return 200, headers, body.encode()
+
+	def _user_data(self, api_user: str) -> dict[str, Any]:
+		"""获取账号的余额数据"""
+		quota = self._quotas.setdefault(api_user, self.INITIAL_QUOTA)
+		return {'quota': quota, 'used_quota': 0}
+
+	def _is_throttled(self, client: str) -> bool:
+		"""按客户端统计每秒的请求数，超出限流时返回 True"""
+		if self.config.rate_limit is None:
+			return False
+
+		second = int(time.monotonic())
+		window, count = self._windows.get(client, (second, 0))
+		if window != second:
+			window, count = second, 0
+		self._windows[client] = (window, count + 1)
+		return count + 1 > self.config.rate_limit
+
+	@staticmethod
+	def _json(
+		status: int,
+		data: dict[str, Any],
+		extra_headers: list[tuple[str, str]] | None = None,
+	) -> tuple[int, list[tuple[str, str]], bytes]:
+		"""构建 JSON 响应"""
+		headers = [('Content-Type', 'application/json'), *(extra_headers or [])]
+		return status, headers, json.dumps(data, ensure_ascii=False).encode()
+
+	@staticmethod
+	def _parse_cookies(header: str) -> dict[str, str]:
+		"""解析 Cookie 请求头"""
+		cookies = {}
+		for part in header.split(';'):
+			name, sep, value = part.strip().partition('=')
+			if sep:
+				cookies[name] = value
+		return cookies
+
+	async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+		"""处理单个连接（支持 keep-alive）"""
+		connection = h11.Connection(h11.SERVER)
+		peer = writer.get_extra_info('peername')
+		client = peer[0] if peer else 'unknown'
+
+		try:
+			while True:
+				request = await self._read_request(connection, reader)
+				if request is None:
+					break
+
+				headers = {name.decode().lower(): value.decode() for name, value in request.headers}
+				path = request.target.decode().split('?', 1)[0]
+				status, response_headers, body = await self.handle(request.method.decode(), path, headers, client)
+
+				response_headers = [*response_headers, ('Content-Length', str(len(body)))]
+				writer.write(connection.send(h11.Response(status_code=status, headers=response_headers)))
+				writer.write(connection.send(h11.Data(data=body)))
+				writer.write(connection.send(h11.EndOfMessage()))
+				await writer.drain()
+
+				if connection.our_state is h11.MUST_CLOSE:
+					break
+				connection.start_next_cycle()
+
+		except (h11.ProtocolError, ConnectionError):
+			pass
+
+		finally:
+			writer.close()
+
+	@staticmethod
+	async def _read_request(connection: h11.Connection, reader: asyncio.StreamReader) -> h11.Request | None:
+		"""读取一个完整的请求（请求体会被丢弃），连接关闭时返回 None"""
+		request = None
+		while True:
+			event = connection.next_event()
+			if event is h11.NEED_DATA:
+				connection.receive_data(await reader.read(65536))
+			elif isinstance(event, h11.Request):
+				request = event
+			elif isinstance(event, h11.EndOfMessage):
+				return request
+			elif isinstance(event, h11.ConnectionClosed):
+				return None
+
+
+async def _serve(args: argparse.Namespace):
+	"""以命令行参数启动模拟站点并持续运行"""
+	stub = AnyRouterStub(
+		StubConfig(
+			latency=args.latency,
+			latency_jitter=args.latency_jitter,
+			error_rate=args.error_rate,
+			waf_block_rate=args.waf_block_rate,
+			rate_limit=args.rate_limit,
+		)
+	)
+	base_url = await stub.start(args.host, args.port)
+	print(f'AnyRouter 模拟站点已启动：ANYROUTER_BASE_URL={base_url}')
+	try:
+		await asyncio.Event().wait()
+	finally:
+		await stub.stop()
+		print(f'请求统计：{stub.stats}')
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='AnyRouter 与 WAF 的本地模拟站点')
+	parser.add_argument('--host', default='127.0.0.1')
+	parser.add_argument('--port', type=int, default=8765)
+	parser.add_argument('--latency', type=float, default=0.0, help='每个请求的固定延迟（秒）')
+	parser.add_argument('--latency-jitter', type=float, default=0.0, help='额外的随机延迟上限（秒）')
+	parser.add_argument('--error-rate', type=float, default=0.0, help='API 请求返回 500 的概率')
+	parser.add_argument('--waf-block-rate', type=float, default=0.0, help='登录页面不下发 WAF cookies 的概率')
+	parser.add_argument('--rate-limit', type=float, default=None, help='每个客户端每秒允许的 API 请求数')
+
+	try:
+		asyncio.run(_serve(parser.parse_args()))
+	except KeyboardInterrupt:
+		pass
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from core.account_override_index import AccountOverrideIndex
+
+
+class TestAccountOverrideIndex:
+	"""测试 AccountOverrideIndex 类"""
+
+	@pytest.mark.parametrize('suffixes', [['12427', '124'], ['124', '12427']])
+	def test_exact_token_wins_over_substring(self, suffixes: list[str]):
+		"""测试 api_user 互为子串时按精确匹配，与环境变量顺序无关"""
+		index = AccountOverrideIndex({suffix: {'cookies': f'session={suffix}'} for suffix in suffixes})
+
+		assert index.pop('124') == ('124', {'cookies': 'session=124'})
+		assert index.pop('12427') == ('12427', {'cookies': 'session=12427'})
+		assert len(index) == 0
+
+	def test_readable_suffix_and_substring_fallback(self):
+		"""测试可读后缀按分段精确匹配，没有精确匹配时回退为子串匹配"""
+		index = AccountOverrideIndex({
+			'12427_ALICE': {'cookies': 'session=alice'},
+			'USER67890': {'cookies': 'session=bob'},
+			'CAROL': {'name': 'Carol', 'cookies': 'session=carol', 'api_user': '1'},
+		})
+
+		assert index.pop(12427) == ('12427_ALICE', {'cookies': 'session=alice'})
+		assert index.pop('67890') == ('USER67890', {'cookies': 'session=bob'})
+		assert index.pop('67890') is None, '已被匹配的配置不会再次匹配'
+		assert list(index.remaining()) == [{'name': 'Carol', 'cookies': 'session=carol', 'api_user': '1'}]
+
+	def test_fallback_prefers_shortest_suffix(self):
+		"""测试多个后缀都包含 api_user 时选择最短、字典序最小的后缀"""
+		index = AccountOverrideIndex({'B12427X': {}, 'A12427X': {}, 'U12427': {}})
+
+		assert [index.pop('12427')[0] for _ in range(3)] == ['U12427', 'A12427X', 'B12427X']
+
+	def test_miss_examines_logarithmic_tails(self):
+		"""测试没有覆盖配置的账号只检查对数级数量的后缀尾部，与覆盖配置数量基本无关"""
+
+		class CountingList(list):
+			"""记录按下标读取次数的列表"""
+
+			reads = 0
+
+			def __getitem__(self, position):
+				CountingList.reads += 1
+				return super().__getitem__(position)
+
+		def reads_per_miss(count: int) -> float:
+			index = AccountOverrideIndex({f'USER{i:06d}_{i % 7}': {} for i in range(count)})
+			index._tails = CountingList(index._tails)
+			CountingList.reads = 0
+			for i in range(100):
+				assert index.pop(f'9{i:06d}') is None
+			return CountingList.reads / 100
+
+		small, large = reads_per_miss(100), reads_per_miss(1600)
+		# 尾部数量增加 16 倍时，二分查找只多约 4 次比较；逐个遍历后缀时会多出上万次
+		assert large - small <= 6
+		assert large <= 2 * math.log2(1600 * 12) + 2
@@ -0,0 +1,45 @@
+import gzip
+import json
+
+from core.account_source import AccountFileSource
+
+
+class TestAccountFileSource:
+	"""测试 AccountFileSource 类"""
+
+	def test_reads_json_lines_and_skips_invalid_lines(self, tmp_path):
+		"""测试逐行读取账号，空行、注释与无效的行被跳过"""
+		accounts_file = tmp_path / 'accounts.jsonl'
+		accounts_file.write_text(
+			'\n'.join([
+				'# 账号列表',
+				json.dumps({'name': 'Alice', 'cookies': 'session=a', 'api_user': '1'}),
+				'',
+				'{"name": "broken"',
+				'["not", "an", "object"]',
+				json.dumps({'name': 'Bob', 'cookies': 'session=b', 'api_user': '2'}),
+			]),
+			encoding='utf-8',
+		)
+
+		accounts = list(AccountFileSource(accounts_file))
+		assert [account['name'] for account in accounts] == ['Alice', 'Bob']
+
+	def test_reads_gzip_file_incrementally(self, tmp_path):
+		"""测试读取 gzip 压缩的账号文件，账号逐个返回"""
+		accounts_file = tmp_path / 'accounts.jsonl.gz'
+		with gzip.open(accounts_file, 'wt', encoding='utf-8') as f:
+			for i in range(1000):
+				f.write(json.dumps({'cookies': f'session={i}', 'api_user': str(i)}) + '\n')
+
+		source = iter(AccountFileSource(accounts_file))
+		assert next(source)['api_user'] == '0'
+		assert sum(1 for _ in source) == 999
+
+	def test_unreadable_file_yields_nothing(self, tmp_path):
+		"""测试文件不存在或不是有效的 gzip 时不返回账号"""
+		assert list(AccountFileSource(tmp_path / 'missing.jsonl')) == []
+
+		broken_file = tmp_path / 'broken.jsonl.gz'
+		broken_file.write_bytes(b'not gzip')
+		assert list(AccountFileSource(broken_file)) == []
@@ -1,7 +1,9 @@
 import hashlib
+import json
 from pathlib import Path
 
 from core.balance_manager import BalanceManager
+from core.models import BalanceHashState
 
 
 class TestBalanceManager:
@@ -48,9 +50,15 @@ class TestBalanceManager:
 		}
 		manager.save_balance_hash(test_data)
 		assert balance_file.exists()
+		assert balance_file.read_bytes().startswith(BalanceHashState.MAGIC)
 
 		loaded_data = manager.load_balance_hash()
-		assert loaded_data == test_data
+		assert loaded_data is not None
+		assert len(loaded_data) == 2
+		assert 'user1_hash' in loaded_data
+		assert loaded_data.is_changed('user1_hash', 'balance1_hash') is False
+		assert loaded_data.is_changed('user2_hash', 'balance_new_hash') is True
+		assert loaded_data.is_changed('user3_hash', 'balance3_hash') is None
 
 		# 测试父目录自动创建
 		nested_file = tmp_path / 'nested' / 'dir' / 'balance.txt'
@@ -62,10 +70,35 @@ class TestBalanceManager:
 		new_data = {'user3_hash': 'balance3_hash'}
 		manager.save_balance_hash(new_data)
 		loaded_new_data = manager.load_balance_hash()
-		assert loaded_new_data == new_data
 		assert loaded_new_data is not None
+		assert len(loaded_new_data) == 1
 		assert 'user1_hash' not in loaded_new_data  # 旧数据被覆盖
 
+	def test_legacy_json_migration(self, tmp_path: Path):
+		"""测试旧版 JSON 文件的透明迁移"""
+		balance_file = tmp_path / 'balance_hash.txt'
+		manager = BalanceManager(balance_hash_file=balance_file)
+
+		account_key = BalanceManager.generate_account_key('user_a')
+		balance_hash = BalanceManager.generate_balance_hash(quota=25.0, used=5.0)
+		legacy_data = {account_key: balance_hash}
+		balance_file.write_text(json.dumps(legacy_data, indent=2), encoding='utf-8')
+
+		# 旧版文件可以直接读取
+		state = manager.load_balance_hash()
+		assert state is not None
+		assert state.is_changed(account_key, balance_hash) is False
+
+		# 保存后转换为紧凑格式，且体积明显缩小
+		manager.save_balance_state(state)
+		content = balance_file.read_bytes()
+		assert content.startswith(BalanceHashState.MAGIC)
+		assert len(content) < len(json.dumps(legacy_data, indent=2))
+
+		migrated = manager.load_balance_hash()
+		assert migrated is not None
+		assert migrated.is_changed(account_key, balance_hash) is False
+
 	def test_file_error_handling(self, tmp_path: Path):
 		"""测试文件读写异常处理"""
 		balance_file = tmp_path / 'balance_hash.txt'
@@ -81,16 +114,25 @@ class TestBalanceManager:
 		result = manager.load_balance_hash()
 		assert result is None
 
+		# 测试损坏的紧凑格式（记录区被截断）
+		manager.save_balance_hash({'user_hash': 'balance_hash'})
+		balance_file.write_bytes(balance_file.read_bytes()[:-1])
+		result = manager.load_balance_hash()
+		assert result is None
+
 		# 测试加载后文件仍然存在（没有被破坏）
 		assert balance_file.exists()
 
-		# 测试超大 JSON（边界测试）
+		# 测试大量账号（边界测试）
 		large_data = {f'user_{i}': f'hash_{i}' * 100 for i in range(1000)}
 		manager.save_balance_hash(large_data)
 		loaded_large = manager.load_balance_hash()
-		assert loaded_large == large_data
+		assert loaded_large is not None
+		assert len(loaded_large) == 1000
+		assert all(loaded_large.is_changed(key, value) is False for key, value in large_data.items())
 
 		# 测试空字典
 		manager.save_balance_hash({})
 		loaded_empty = manager.load_balance_hash()
-		assert loaded_empty == {}
+		assert loaded_empty is not None
+		assert len(loaded_empty) == 0
@@ -0,0 +1,51 @@
+from tests.benchmark.runner import BenchmarkCase, compare, run_case
+from tools.logger import logger
+
+
+def build_results(**medians: float) -> dict:
+	"""构建基准结果"""
+	return {
+		'version': 1,
+		'commit': 'abc1234',
+		'results': {
+			key: {'median': median, 'min': median, 'rounds': 3, 'throughput': 0} for key, median in medians.items()
+		},
+	}
+
+
+class TestBenchmarkRunner:
+	"""测试基准测试的计时与对比"""
+
+	def test_run_case_supports_async_and_cleanup(self):
+		"""测试异步用例与清理函数"""
+		calls = {'run': 0, 'cleanup': 0}
+
+		async def run():
+			calls['run'] += 1
+
+		def setup(size: int):
+			return run, lambda: calls.__setitem__('cleanup', calls['cleanup'] + 1)
+
+		result = run_case(BenchmarkCase(name='async', size=10, setup=setup, min_rounds=4), min_time=0)
+
+		assert result.rounds == calls['run'] == 4
+		assert calls['cleanup'] == 1
+		assert result.min <= result.median
+
+	def test_run_case_discards_buffered_logs(self, capsys):
+		"""测试被测代码的缓冲日志在恢复 stdout 前写出并被丢弃"""
+
+		def setup(size: int):
+			return lambda: logger.info('基准用例日志'), None
+
+		run_case(BenchmarkCase(name='logs', size=1, setup=setup, min_rounds=2), min_time=0)
+		logger.flush()
+
+		assert '基准用例日志' not in capsys.readouterr().out
+
+	def test_compare_reports_regressions(self):
+		"""测试只有变慢超过阈值的用例被视为退化，新增用例不参与对比"""
+		baseline = build_results(**{'a/10': 1.0, 'b/10': 1.0})
+		current = build_results(**{'a/10': 1.2, 'b/10': 1.5, 'c/10': 9.0})
+
+		assert compare(baseline, current, threshold=1.3) == ['b/10']
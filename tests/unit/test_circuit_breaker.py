@@ -0,0 +1,78 @@
+import pytest
+
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, FailureKind
+
+
+class TestCircuitBreaker:
+	"""测试 CircuitBreaker 类"""
+
+	@staticmethod
+	def fail(breaker: CircuitBreaker, kind: FailureKind):
+		"""模拟一次站点级失败"""
+		with breaker.attempt() as attempt:
+			attempt.record_failure(kind)
+
+	@staticmethod
+	def succeed(breaker: CircuitBreaker):
+		"""模拟一次站点正常响应"""
+		with breaker.attempt() as attempt:
+			attempt.record_success()
+
+	def test_trip_and_recover(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试连续同类失败触发熔断，冷却后通过探测请求恢复"""
+		now = {'value': 0.0}
+		monkeypatch.setattr('core.circuit_breaker.time.monotonic', lambda: now['value'])
+		breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+
+		# 失败类型变化时重新计数
+		self.fail(breaker, FailureKind.TIMEOUT)
+		self.fail(breaker, FailureKind.TIMEOUT)
+		self.fail(breaker, FailureKind.WAF_BLOCKED)
+		assert breaker.state == CircuitState.CLOSED
+
+		# 连续 3 次同类失败后熔断
+		self.fail(breaker, FailureKind.WAF_BLOCKED)
+		self.fail(breaker, FailureKind.WAF_BLOCKED)
+		assert breaker.state == CircuitState.OPEN
+
+		# 冷却期间直接失败，并给出明确原因
+		with pytest.raises(CircuitOpenError, match='WAF 拦截'):
+			breaker.attempt()
+
+		# 冷却结束后只放行一个探测请求
+		now['value'] = 61
+		probe = breaker.attempt()
+		assert breaker.state == CircuitState.HALF_OPEN
+		with pytest.raises(CircuitOpenError):
+			breaker.attempt()
+
+		# 探测成功后恢复
+		with probe as attempt:
+			attempt.record_success()
+		assert breaker.state == CircuitState.CLOSED
+
+	def test_probe_failure_reopens(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试探测请求失败后重新熔断，未访问站点的处理不影响状态"""
+		now = {'value': 0.0}
+		monkeypatch.setattr('core.circuit_breaker.time.monotonic', lambda: now['value'])
+		breaker = CircuitBreaker(failure_threshold=1, cooldown=10)
+
+		self.fail(breaker, FailureKind.SERVER_ERROR)
+		assert breaker.state == CircuitState.OPEN
+
+		# 探测请求未访问站点（如账号配置无效），释放探测名额
+		now['value'] = 11
+		with breaker.attempt():
+			pass
+		assert breaker.state == CircuitState.HALF_OPEN
+
+		# 探测失败，重新熔断
+		self.fail(breaker, FailureKind.SERVER_ERROR)
+		assert breaker.state == CircuitState.OPEN
+		with pytest.raises(CircuitOpenError):
+			breaker.attempt()
+
+		# 正常响应会清零连续失败计数
+		now['value'] = 30
+		self.succeed(breaker)
+		assert breaker.state == CircuitState.CLOSED
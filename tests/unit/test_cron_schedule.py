@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import pytest
+
+from tools.cron import CronSchedule
+
+
+class TestCronSchedule:
+	"""测试 CronSchedule 类"""
+
+	@pytest.mark.parametrize(
+		'expression,after,expected',
+		[
+			('0 */6 * * *', datetime(2026, 10, 19, 13, 5), datetime(2026, 10, 19, 18, 0)),
+			('0 */6 * * *', datetime(2026, 10, 19, 18, 0), datetime(2026, 10, 20, 0, 0)),
+			('30 9 * * 1-5', datetime(2026, 10, 24, 10, 0), datetime(2026, 10, 26, 9, 30)),
+			('0 8 1 * 0', datetime(2026, 10, 19, 9, 0), datetime(2026, 10, 25, 8, 0)),
+			('5,35 0 29 2 *', datetime(2026, 3, 1), datetime(2028, 2, 29, 0, 5)),
+		],
+	)
+	def test_next_after(self, expression: str, after: datetime, expected: datetime):
+		"""测试下一次触发时间（包括步长、范围、日与周任一满足、闰年）"""
+		assert CronSchedule(expression).next_after(after) == expected
+
+	@pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '*/0 * * * *', 'a * * * *', '0 0 0 * *'])
+	def test_invalid_expression(self, expression: str):
+		"""测试无效的表达式"""
+		with pytest.raises(ValueError):
+			CronSchedule(expression)
+
+	def test_never_fires(self):
+		"""测试永远不会触发的表达式"""
+		with pytest.raises(ValueError):
+			CronSchedule('0 0 30 2 *').next_after(datetime(2026, 1, 1))
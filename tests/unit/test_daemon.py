@@ -0,0 +1,99 @@
+import os
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import main
+from core.models import ShardSpec
+from daemon import Daemon
+from tools.cron import CronSchedule
+
+
+def create_fake_app(run: AsyncMock) -> MagicMock:
+	"""创建只记录调用的应用实例"""
+	app = MagicMock()
+	app.run = run
+	app.checkin_service.start_browser = AsyncMock()
+	app.checkin_service.stop_browser = AsyncMock()
+	return app
+
+
+class TestDaemon:
+	"""测试 Daemon 类"""
+
+	@pytest.mark.asyncio
+	async def test_runs_on_schedule_and_keeps_browser_warm(self):
+		"""测试按计划多次签到，签到之间复用同一个应用实例与浏览器"""
+		daemon = Daemon(schedule=CronSchedule('* * * * *'))
+		runs = 0
+
+		async def run():
+			nonlocal runs
+			runs += 1
+			if runs == 3:
+				daemon.stop()
+			raise SystemExit(1)
+
+		app = create_fake_app(AsyncMock(side_effect=run))
+		factory = MagicMock(return_value=app)
+		daemon.app_factory = factory
+
+		with patch.object(Daemon, '_next_run_at', side_effect=lambda now: now):
+			await daemon.serve()
+
+		assert runs == 3, 'Application.run 的 SystemExit 不应结束常驻'
+		assert factory.call_count == 1
+		assert app.checkin_service.start_browser.await_count == 1
+		assert app.checkin_service.stop_browser.await_count == 1
+
+	@pytest.mark.asyncio
+	async def test_reload_rebuilds_app_from_env_file(self, tmp_path, monkeypatch):
+		"""测试重新加载时读取配置文件并重新创建应用实例"""
+		env_file = tmp_path / '.env'
+		env_file.write_text('CHECKIN_DAEMON_TEST=first\n')
+		monkeypatch.setenv('CHECKIN_DAEMON_TEST', '')
+
+		daemon = Daemon(schedule=CronSchedule('* * * * *'), env_file=env_file)
+		seen: list[str] = []
+
+		async def run():
+			seen.append(os.environ['CHECKIN_DAEMON_TEST'])
+			if len(seen) == 1:
+				env_file.write_text('CHECKIN_DAEMON_TEST=second\n')
+				daemon.reload()
+			else:
+				daemon.stop()
+
+		apps = [create_fake_app(AsyncMock(side_effect=run)) for _ in range(2)]
+		daemon.app_factory = MagicMock(side_effect=apps)
+
+		with patch.object(Daemon, '_next_run_at', side_effect=lambda now: now):
+			await daemon.serve()
+
+		assert seen == ['first', 'second']
+		assert daemon.app is apps[1]
+		assert apps[0].checkin_service.stop_browser.await_count == 1, '重新加载时关闭旧的浏览器'
+
+	def test_next_run_at_adds_jitter(self):
+		"""测试随机抖动只会推迟签到时间"""
+		daemon = Daemon(schedule=CronSchedule('0 * * * *'), jitter=60)
+		now = datetime(2026, 10, 19, 13, 5)
+		for _ in range(20):
+			run_at = daemon._next_run_at(now)
+			assert datetime(2026, 10, 19, 14, 0) <= run_at <= datetime(2026, 10, 19, 14, 1)
+
+	def test_main_passes_shard_and_resume(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试 daemon 子命令把 --shard 与 --resume 传给每一次签到使用的应用实例"""
+		monkeypatch.setattr(sys, 'argv', ['autocheck-anyrouter', 'daemon', '--shard', '2/4', '--resume'])
+		apps = []
+
+		async def serve(daemon: Daemon):
+			apps.append(daemon.app_factory())
+
+		with patch.object(Daemon, 'serve', serve):
+			main.run_main()
+
+		assert apps[0].shard == ShardSpec.parse('2/4')
+		assert apps[0].resume is True
@@ -0,0 +1,89 @@
+import pytest
+
+from core.github_reporter import GitHubReporter
+from core.privacy_handler import PrivacyHandler
+from tests.tools.data_builders import build_account_result
+
+
+def build_results(count: int) -> list:
+	"""构建 count 个账号结果（每 4 个中有 1 个失败）"""
+	return [
+		build_account_result(name=f'账号{i}', status='failed', error='HTTP 401')
+		if i % 4 == 0
+		else build_account_result(name=f'账号{i}')
+		for i in range(count)
+	]
+
+
+class TestGitHubReporter:
+	"""测试 GitHubReporter 类"""
+
+	def test_small_summary_writes_full_tables(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试空间充足时完整写入账号表格，不生成单独的完整列表文件"""
+		summary_file = tmp_path / 'summary.md'
+		full_file = tmp_path / 'full.md'
+		monkeypatch.setenv(GitHubReporter.ENV_GITHUB_STEP_SUMMARY, str(summary_file))
+		reporter = GitHubReporter(PrivacyHandler(show_sensitive_info=True), full_file)
+
+		results = build_results(8)
+		reporter.generate_summary(success_count=6, total_count=8, account_results=results)
+
+		content = summary_file.read_text(encoding='utf-8')
+		assert all(f'|账号{i}|' in content for i in range(8))
+		assert '### 汇总' not in content
+		assert not full_file.exists()
+
+	def test_large_summary_switches_to_compact_view(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试即将超过大小上限时改为汇总视图，完整列表写入单独的文件"""
+		summary_file = tmp_path / 'summary.md'
+		full_file = tmp_path / 'artifacts' / 'full.md'
+		summary_file.write_text('前一个步骤的内容\n' * 100, encoding='utf-8')
+		monkeypatch.setenv(GitHubReporter.ENV_GITHUB_STEP_SUMMARY, str(summary_file))
+		monkeypatch.setattr(GitHubReporter, 'COMPACT_RESERVE_BYTES', 1024)
+		max_bytes = 8 * 1024
+		reporter = GitHubReporter(PrivacyHandler(show_sensitive_info=True), full_file, max_bytes=max_bytes)
+
+		results = build_results(2000)
+		reporter.generate_summary(success_count=1500, total_count=2000, account_results=results)
+
+		content = summary_file.read_text(encoding='utf-8')
+		assert len(content.encode('utf-8')) <= max_bytes
+		assert '### 汇总' in content
+		assert '|✅ 签到成功|1500|' in content
+		assert '|❌ 签到失败|500|' in content
+		assert '|HTTP 401|500|' in content
+		assert '`full.md`' in content
+
+		full_content = full_file.read_text(encoding='utf-8')
+		assert all(f'|账号{i}|' in full_content for i in range(2000))
+
+	def test_compact_view_hides_errors_when_masked(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试脱敏模式下汇总视图不展示失败原因"""
+		summary_file = tmp_path / 'summary.md'
+		monkeypatch.setenv(GitHubReporter.ENV_GITHUB_STEP_SUMMARY, str(summary_file))
+		monkeypatch.setattr(GitHubReporter, 'COMPACT_RESERVE_BYTES', 1024)
+		reporter = GitHubReporter(PrivacyHandler(show_sensitive_info=False), tmp_path / 'full.md', max_bytes=4096)
+
+		reporter.generate_summary(success_count=150, total_count=200, account_results=build_results(200))
+
+		content = summary_file.read_text(encoding='utf-8')
+		assert '### 汇总' in content
+		assert 'HTTP 401' not in content
+
+	@pytest.mark.parametrize('remaining_bytes', [600, 100])
+	def test_header_counts_toward_budget(self, monkeypatch: pytest.MonkeyPatch, tmp_path, remaining_bytes: int):
+		"""测试剩余空间放不下标题时直接写入汇总视图，空间再小也不会超过大小上限"""
+		summary_file = tmp_path / 'summary.md'
+		existing = '前一个步骤的内容\n' * 100
+		summary_file.write_text(existing, encoding='utf-8')
+		monkeypatch.setenv(GitHubReporter.ENV_GITHUB_STEP_SUMMARY, str(summary_file))
+		monkeypatch.setattr(GitHubReporter, 'COMPACT_RESERVE_BYTES', 1024)
+		max_bytes = len(existing.encode('utf-8')) + remaining_bytes
+		reporter = GitHubReporter(PrivacyHandler(show_sensitive_info=False), tmp_path / 'full.md', max_bytes=max_bytes)
+
+		reporter.generate_summary(success_count=3, total_count=4, account_results=build_results(4))
+
+		content = summary_file.read_text(encoding='utf-8')
+		assert len(content.encode('utf-8')) <= max_bytes
+		assert 'AnyRouter 签到任务完成' not in content
+		assert ('### 汇总' in content) is (remaining_bytes == 600)
@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / 'src'
+
+# 只在访问站点、发送通知、多进程执行或常驻模式时才需要的模块，提前退出的路径不应导入
+LAZY_MODULES = (
+	'httpx',
+	'playwright',
+	'stencil',
+	'json5',
+	'notif.notification_kit',
+	'notif.senders',
+	'multiprocessing',
+	'dotenv',
+)
+
+# 导入 main 的进程耗时相对空进程（python -c pass）的倍数上限：当前约为 3.5 倍，未延迟导入时约为 7 倍
+# 与同一台机器上的空进程比较，避免机器性能与负载影响判断；较慢的环境可以通过环境变量放宽
+IMPORT_BUDGET_RATIO = float(os.getenv('IMPORT_TIME_BUDGET_RATIO', '6'))
+
+
+def run_with_importtime(code: str, cwd: Path) -> tuple[subprocess.CompletedProcess, dict[str, int]]:
+	"""
+	使用 -X importtime 在子进程中执行代码
+
+	Args:
+		code: 要执行的代码
+		cwd: 工作目录
+
+	Returns:
+		(子进程结果, 模块名 -> 累计导入耗时（微秒）) 元组
+	"""
+	env = {
+		key: value
+		for key, value in os.environ.items()
+		if not key.startswith('ANYROUTER_ACCOUNT') and not key.startswith('CHECKIN_')
+	}
+	env['PYTHONPATH'] = str(SRC_DIR)
+
+	result = subprocess.run(
+		[sys.executable, '-X', 'importtime', '-c', code],
+		cwd=cwd,
+		env=env,
+		capture_output=True,
+		text=True,
+		timeout=60,
+	)
+
+	modules: dict[str, int] = {}
+	for line in result.stderr.splitlines():
+		if not line.startswith('import time:') or 'cumulative' in line:
+			continue
+		_, cumulative, name = line.removeprefix('import time:').split('|')
+		modules.setdefault(name.strip(), int(cumulative))
+
+	return result, modules
+
+
+def measure_process(code: str, cwd: Path, rounds: int = 5) -> float:
+	"""
+	测量在子进程中执行代码的耗时（取多次运行的最小值，排除首次编译与机器波动）
+
+	Args:
+		code: 要执行的代码
+		cwd: 工作目录
+		rounds: 运行次数
+
+	Returns:
+		最短耗时（秒）
+	"""
+	env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+	timings = []
+	for _ in range(rounds):
+		started_at = time.perf_counter()
+		subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True, capture_output=True, timeout=60)
+		timings.append(time.perf_counter() - started_at)
+	return min(timings)
+
+
+def find_lazy_modules(modules: dict[str, int]) -> list[str]:
+	"""找出被提前导入的延迟加载模块"""
+	return sorted(
+		name
+		for name in modules
+		if any(name == lazy or name.startswith(f'{lazy}.') for lazy in LAZY_MODULES)
+	)  # fmt: skip
+
+
+class TestImportTime:
+	"""测试启动时的导入耗时"""
+
+	def test_import_main_skips_heavy_dependencies(self, tmp_path):
+		"""测试导入入口模块时不加载较慢的依赖"""
+		result, modules = run_with_importtime('import main', tmp_path)
+
+		assert result.returncode == 0, result.stderr
+		assert 'main' in modules
+		assert find_lazy_modules(modules) == []
+
+	def test_no_accounts_exit_skips_heavy_dependencies(self, tmp_path):
+		"""测试未配置账号时提前退出，不加载浏览器、HTTP 客户端与通知模块"""
+		result, modules = run_with_importtime('import main; main.run_main()', tmp_path)
+
+		assert result.returncode == 0, result.stderr
+		assert find_lazy_modules(modules) == []
+
+	def test_import_time_budget(self, tmp_path):
+		"""测试导入入口模块的进程耗时相对空进程不超过预算倍数"""
+		baseline = measure_process('pass', tmp_path)
+		elapsed = measure_process('import main', tmp_path)
+
+		assert elapsed < baseline * IMPORT_BUDGET_RATIO, (
+			f'导入 main 耗时 {elapsed * 1000:.1f}ms，是空进程（{baseline * 1000:.1f}ms）的 {elapsed / baseline:.1f} 倍，超过预算'
+		)
+
+	def test_notification_kit_loaded_on_demand(self, tmp_path):
+		"""测试延迟导出的 NotificationKit 在使用时正常加载"""
+		result, modules = run_with_importtime('from notif import NotificationKit; NotificationKit()', tmp_path)
+
+		assert result.returncode == 0, result.stderr
+		assert 'notif.senders' in modules
@@ -0,0 +1,169 @@
+import asyncio
+import io
+import json
+import sys
+
+import pytest
+
+from tools.logger import ConsoleSink, JsonLinesSink, Logger, LogLevel
+
+
+class TestLogger:
+	"""测试 Logger 类"""
+
+	def test_level_filtering_skips_formatting(self, capsys: pytest.CaptureFixture[str]):
+		"""测试低于最低级别的日志被丢弃，延迟格式化的消息不会被调用"""
+		log = Logger(level=LogLevel.INFO, sinks=[ConsoleSink(buffer_lines=1)])
+		calls: list[str] = []
+
+		def build_message() -> str:
+			calls.append('called')
+			return '调试消息'
+
+		log.debug(build_message)
+		log.info(lambda: '信息消息', tag='测试')
+
+		assert calls == []
+		assert capsys.readouterr().out == '[测试] 信息消息\n'
+
+	def test_buffered_output(self, capsys: pytest.CaptureFixture[str]):
+		"""测试日志写入缓冲区，缓冲区写满、输出错误或显式 flush 时才写出"""
+		log = Logger(level=LogLevel.DEBUG, sinks=[ConsoleSink(buffer_lines=3)])
+
+		log.debug('第一行')
+		log.info('第二行', account_name='账号 1')
+		assert capsys.readouterr().out == ''
+
+		log.warning('第三行')
+		assert capsys.readouterr().out == '[调试] 第一行\n[信息] 账号 1: 第二行\n[警告] 第三行\n'
+
+		log.info('第四行')
+		log.error('出错了')
+		assert capsys.readouterr().out == '[信息] 第四行\n[错误] 出错了\n'
+
+		log.print_multiline(['多行'])
+		log.flush()
+		log.flush()
+		assert capsys.readouterr().out == '多行\n'
+
+	@pytest.mark.parametrize(
+		'env_value,expected_level',
+		[
+			(None, LogLevel.INFO),
+			('debug', LogLevel.DEBUG),
+			(' Warning ', LogLevel.WARNING),
+			('verbose', LogLevel.INFO),
+		],
+	)
+	def test_level_from_env(
+		self,
+		monkeypatch: pytest.MonkeyPatch,
+		env_value: str | None,
+		expected_level: LogLevel,
+	):
+		"""测试从环境变量读取最低日志级别（无效值时使用默认级别）"""
+		if env_value is None:
+			monkeypatch.delenv(Logger.ENV_LOG_LEVEL, raising=False)
+		else:
+			monkeypatch.setenv(Logger.ENV_LOG_LEVEL, env_value)
+
+		assert Logger(sinks=[]).level is expected_level
+
+	def test_parse_invalid_level(self):
+		"""测试解析无效的日志级别名称"""
+		with pytest.raises(ValueError, match='无效的日志级别'):
+			LogLevel.parse('TRACE')
+
+	def test_json_lines_sink_alongside_console(self, capsys: pytest.CaptureFixture[str], tmp_path):
+		"""测试控制台与 JSON Lines 输出目标同时工作，JSON 中包含级别、标签、账号与时间信息"""
+		json_path = tmp_path / 'logs' / 'run.jsonl'
+		log = Logger(level=LogLevel.INFO, sinks=[ConsoleSink(buffer_lines=1), JsonLinesSink(json_path)])
+
+		log.info('签到成功', tag='成功', account_name='A1b2c')
+		log.print_banner('横幅')
+		try:
+			raise RuntimeError('boom')
+		except RuntimeError:
+			log.error('出错了', exc_info=True)
+
+		console = capsys.readouterr().out
+		assert console.startswith('[成功] A1b2c: 签到成功\n')
+		assert '  RuntimeError: boom' in console
+
+		entries = [json.loads(line) for line in json_path.read_text(encoding='utf-8').splitlines()]
+		assert [(e['level'], e['tag'], e['account'], e['message']) for e in entries] == [
+			('INFO', '成功', 'A1b2c', '签到成功'),
+			('ERROR', None, None, '出错了'),
+		]
+		assert entries[0]['monotonic'] <= entries[1]['monotonic']
+		assert 0 <= entries[0]['elapsed'] <= entries[1]['elapsed']
+		assert 'RuntimeError: boom' in entries[1]['exception']
+		assert 'exception' not in entries[0]
+
+	def test_default_sinks_from_env(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试设置 CHECKIN_LOG_JSON 时默认同时使用控制台与 JSON Lines 输出目标"""
+		monkeypatch.delenv(Logger.ENV_LOG_JSON, raising=False)
+		assert [type(sink) for sink in Logger().sinks] == [ConsoleSink]
+
+		monkeypatch.setenv(Logger.ENV_LOG_JSON, str(tmp_path / 'run.jsonl'))
+		assert [type(sink) for sink in Logger().sinks] == [ConsoleSink, JsonLinesSink]
+
+	@pytest.mark.asyncio
+	async def test_groups_do_not_interleave(self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
+		"""测试并发的分组各自收集日志，结束时连续写出并使用 ::group:: 标记包裹"""
+		monkeypatch.setenv('GITHUB_ACTIONS', 'true')
+		monkeypatch.setenv(Logger.ENV_LOG_IMMEDIATE_ERRORS, 'false')
+		log = Logger(level=LogLevel.INFO, sinks=[ConsoleSink(buffer_lines=1)])
+
+		async def process(name: str, delay: float):
+			with log.group(name):
+				log.info('开始', account_name=name)
+				await asyncio.sleep(delay)
+				with log.group('嵌套'):
+					log.info('结束', account_name=name)
+
+		await asyncio.gather(process('A', 0.02), process('B', 0.01))
+
+		assert capsys.readouterr().out.splitlines() == [
+			'::group::B',
+			'[信息] B: 开始',
+			'[信息] B: 结束',
+			'::endgroup::',
+			'::group::A',
+			'[信息] A: 开始',
+			'[信息] A: 结束',
+			'::endgroup::',
+		]
+
+	def test_group_immediate_errors(self, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
+		"""测试默认立即输出错误，分组中的错误日志不等待分组结束"""
+		monkeypatch.delenv('GITHUB_ACTIONS', raising=False)
+		monkeypatch.delenv(Logger.ENV_LOG_IMMEDIATE_ERRORS, raising=False)
+		log = Logger(level=LogLevel.INFO, sinks=[ConsoleSink(buffer_lines=1)])
+
+		with log.group('A'):
+			log.info('开始', account_name='A')
+			log.error('出错了', account_name='A')
+			assert capsys.readouterr().out == '[错误] A: 出错了\n'
+
+		assert capsys.readouterr().out == '[信息] A: 开始\n'
+
+	def test_group_written_in_one_call(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试 GitHub Actions 中控制台按批写出，一个分组连同 ::group:: 标记只写出一次"""
+		monkeypatch.setenv('GITHUB_ACTIONS', 'true')
+		monkeypatch.setattr(ConsoleSink, '_is_terminal', staticmethod(lambda: False))
+		sink = ConsoleSink()
+		assert sink.buffer_lines == ConsoleSink.DEFAULT_BUFFER_LINES
+
+		stream = io.StringIO()
+		writes: list[str] = []
+		monkeypatch.setattr(stream, 'write', writes.append)
+		monkeypatch.setattr(sys, 'stdout', stream)
+		log = Logger(level=LogLevel.INFO, sinks=[sink])
+
+		log.info('开始运行')
+		with log.group('A'):
+			log.info('开始', account_name='A')
+			log.info('结束', account_name='A')
+
+		assert writes == ['[信息] 开始运行\n::group::A\n[信息] A: 开始\n[信息] A: 结束\n::endgroup::\n']
@@ -1,9 +1,13 @@
+import asyncio
+from contextlib import ExitStack
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from notif import NotificationKit
 from notif.models import NotificationTemplate
+from tests.fixtures.mock_dependencies import MockHttpClient
 from tests.tools.data_builders import build_account_result, build_notification_data
 
 
@@ -17,39 +21,39 @@ class TestNotificationKit:
 			(
 				'EMAIL_NOTIF_CONFIG',
 				'{"user": "test@example.com", "pass": "password", "to": "recipient@example.com"}',
-				'email_config',
+				'email_configs',
 				('user', 'test@example.com'),
 			),
 			# Bark 平台（字典格式）
 			(
 				'BARK_NOTIF_CONFIG',
 				'{"server_url": "https://api.day.app", "device_key": "test_key"}',
-				'bark_config',
+				'bark_configs',
 				('device_key', 'test_key'),
 			),
 			# PushPlus 平台（字符串格式）
-			('PUSHPLUS_NOTIF_CONFIG', 'test_token_123', 'pushplus_config', ('token', 'test_token_123')),
+			('PUSHPLUS_NOTIF_CONFIG', 'test_token_123', 'pushplus_configs', ('token', 'test_token_123')),
 			# ServerPush 平台（字符串格式）
-			('SERVERPUSH_NOTIF_CONFIG', 'test_send_key_456', 'serverpush_config', ('send_key', 'test_send_key_456')),
+			('SERVERPUSH_NOTIF_CONFIG', 'test_send_key_456', 'serverpush_configs', ('send_key', 'test_send_key_456')),
 			# DingTalk 平台（字符串格式）
 			(
 				'DINGTALK_NOTIF_CONFIG',
 				'https://oapi.dingtalk.com/robot/send?access_token=test',
-				'dingtalk_config',
+				'dingtalk_configs',
 				('webhook', 'https://oapi.dingtalk.com/robot/send?access_token=test'),
 			),
 			# Feishu 平台（字典格式，包含模板）
 			(
 				'FEISHU_NOTIF_CONFIG',
 				'{"webhook": "https://open.feishu.cn/hook", "template": {"title": "自定义标题", "content": "自定义内容"}}',
-				'feishu_config',
+				'feishu_configs',
 				('template.title', '自定义标题'),
 			),
 			# WeCom 平台（字典格式）
 			(
 				'WECOM_NOTIF_CONFIG',
 				'{"webhook": "https://qyapi.weixin.qq.com/hook"}',
-				'wecom_config',
+				'wecom_configs',
 				('webhook', 'https://qyapi.weixin.qq.com/hook'),
 			),
 		],
@@ -68,8 +72,9 @@ class TestNotificationKit:
 		monkeypatch.setenv(env_key, env_value)
 		kit = NotificationKit()
 
-		config = getattr(kit, expected_config_attr)
-		assert config is not None, f'{expected_config_attr} 应该不为 None'
+		configs = getattr(kit, expected_config_attr)
+		assert len(configs) == 1, f'{expected_config_attr} 应该只包含一个目标'
+		config = configs[0]
 
 		# 验证配置值
 		attr_path, expected_value = expected_value_or_key
@@ -85,6 +90,65 @@ class TestNotificationKit:
 			actual_value = getattr(config, attr_path)
 			assert actual_value == expected_value, f'{attr_path} 的值不匹配'
 
+	def test_multiple_destinations_per_platform(
+		self,
+		monkeypatch: pytest.MonkeyPatch,
+		clean_notification_env: None,
+	) -> None:
+		"""测试单个平台配置多个目标（JSON 数组），无效的目标被忽略"""
+		monkeypatch.setenv(
+			'DINGTALK_NOTIF_CONFIG',
+			'["https://oapi.dingtalk.com/a", {"webhook": "https://oapi.dingtalk.com/b", "template": "简化内容"}, {}]',
+		)
+		monkeypatch.setenv('TELEGRAM_NOTIF_CONFIG', '{"bot_token": "token", "chat_id": "1"}')
+		kit = NotificationKit()
+
+		assert [config.webhook for config in kit.dingtalk_configs] == [
+			'https://oapi.dingtalk.com/a',
+			'https://oapi.dingtalk.com/b',
+		]
+		assert kit.dingtalk_configs[1].template is not None
+		assert kit.dingtalk_configs[1].template.content == '简化内容'
+
+		# 多个目标时用序号区分，单个目标保持原名称
+		assert [handler.name for handler in kit._handlers] == ['钉钉 #1', '钉钉 #2', 'Telegram']
+
+	@pytest.mark.asyncio
+	async def test_push_message_sends_destinations_concurrently(
+		self,
+		monkeypatch: pytest.MonkeyPatch,
+		clean_notification_env: None,
+	) -> None:
+		"""测试多个目标并发发送，并共享渲染结果"""
+		monkeypatch.setenv(
+			'WECOM_NOTIF_CONFIG',
+			'["https://mock.wecom.com/1", "https://mock.wecom.com/2", "https://mock.wecom.com/3"]',
+		)
+		monkeypatch.setenv('PUSHPLUS_NOTIF_CONFIG', 'mock_token')
+		kit = NotificationKit()
+
+		in_flight = {'current': 0, 'max': 0}
+		posted_urls = []
+
+		async def post_handler(url, *args, **kwargs):
+			in_flight['current'] += 1
+			in_flight['max'] = max(in_flight['max'], in_flight['current'])
+			await asyncio.sleep(0.01)
+			in_flight['current'] -= 1
+			posted_urls.append(url)
+			return MockHttpClient.build_response(status=200, json_data={'errcode': 0, 'code': 200})
+
+		with ExitStack() as stack:
+			MockHttpClient.setup(stack, MockHttpClient.get_success_handler, post_handler)
+			render = stack.enter_context(patch.object(kit, '_render_template', wraps=kit._render_template))
+
+			await kit.push_message(build_notification_data([build_account_result(name='账号 1')]))
+
+		assert len(posted_urls) == 4
+		assert in_flight['max'] == 4, '所有目标应该并发发送'
+		# 企业微信的 3 个目标共享默认模板，只渲染一次；PushPlus 使用另一份模板
+		assert render.call_count == 2
+
 	def test_template_merging_and_rendering(
 		self,
 		monkeypatch: pytest.MonkeyPatch,
@@ -98,10 +162,10 @@ class TestNotificationKit:
 			'{"token": "test", "template": {"title": "自定义标题", "content": "自定义内容"}}',
 		)
 		kit = NotificationKit()
-		assert kit.pushplus_config is not None
-		assert kit.pushplus_config.template is not None
-		assert kit.pushplus_config.template.title == '自定义标题'
-		assert kit.pushplus_config.template.content == '自定义内容'
+		assert len(kit.pushplus_configs) == 1
+		assert kit.pushplus_configs[0].template is not None
+		assert kit.pushplus_configs[0].template.title == '自定义标题'
+		assert kit.pushplus_configs[0].template.content == '自定义内容'
 
 		# 测试只自定义 content（title 使用默认值）
 		monkeypatch.setenv(
@@ -109,9 +173,9 @@ class TestNotificationKit:
 			'{"token": "test", "template": {"content": "只有内容"}}',
 		)
 		kit = NotificationKit()
-		assert kit.pushplus_config is not None
-		assert kit.pushplus_config.template is not None
-		assert kit.pushplus_config.template.content == '只有内容'
+		assert len(kit.pushplus_configs) == 1
+		assert kit.pushplus_configs[0].template is not None
+		assert kit.pushplus_configs[0].template.content == '只有内容'
 
 		# 测试 NotificationTemplate.from_value() 的各种格式
 		# 1. 字典格式
@@ -105,3 +105,15 @@ class TestPrivacyHandler:
 			# 应该隐藏数字
 			assert '余额正常' in display or ':money:' in display
 			assert str(quota) not in display
+
+	def test_masked_values_are_memoized(self) -> None:
+		"""测试脱敏结果按原始值缓存，账号名称与环境变量后缀使用同一套规则"""
+		handler = PrivacyHandler(show_sensitive_info=False)
+
+		masked = handler.mask_account_name('Alice')
+
+		assert masked == handler.get_safe_account_name({'name': 'Alice'}, 0)
+		assert masked == handler.get_safe_sensitive_value('Alice')
+		assert handler.get_safe_account_env_name('ANYROUTER_ACCOUNT_Alice') == f'ANYROUTER_ACCOUNT_{masked}'
+		assert handler._masked_values == {'Alice': masked}
+		assert handler.mask_account_name('账号 1') == '账号 1'
@@ -0,0 +1,64 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tools.rate_limiter import HostRateLimiter, RateLimit, TokenBucket
+
+
+class TestRateLimiter:
+	"""测试 TokenBucket 与 HostRateLimiter 类"""
+
+	def test_token_bucket_refill(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试突发容量用尽后按速率等待，空闲时令牌补充但不超过容量"""
+		now = {'value': 0.0}
+		monkeypatch.setattr('tools.rate_limiter.token_bucket.time.monotonic', lambda: now['value'])
+		bucket = TokenBucket(RateLimit(rate=2.0, burst=2))
+
+		# 突发容量内立即放行
+		assert bucket.reserve() == 0
+		assert bucket.reserve() == 0
+
+		# 之后的请求依次排队，每个令牌间隔 1 / rate 秒
+		assert bucket.reserve() == pytest.approx(0.5)
+		assert bucket.reserve() == pytest.approx(1.0)
+
+		# 长时间空闲后最多恢复到突发容量
+		now['value'] = 100
+		assert bucket.reserve() == 0
+		assert bucket.reserve() == 0
+		assert bucket.reserve() == pytest.approx(0.5)
+
+	@pytest.mark.asyncio
+	async def test_per_host_limits(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试不同主机使用独立的令牌桶，未配置的主机不限流"""
+		monkeypatch.setattr('tools.rate_limiter.token_bucket.time.monotonic', lambda: 0.0)
+		sleep = AsyncMock()
+		monkeypatch.setattr('tools.rate_limiter.token_bucket.TokenBucket._sleep', sleep)
+		limiter = HostRateLimiter({'anyrouter.top': RateLimit(rate=1.0, burst=1)})
+
+		await limiter.acquire('https://anyrouter.top/api/user/sign_in')
+		await limiter.acquire('https://example.com/webhook')
+		await limiter.acquire('https://example.com/webhook')
+		sleep.assert_not_awaited()
+
+		await limiter.acquire('https://anyrouter.top/api/user/self')
+		sleep.assert_awaited_once_with(pytest.approx(1.0))
+
+	def test_parse_limits(self):
+		"""测试解析限流配置，忽略无效条目"""
+		limits = HostRateLimiter.parse_limits(
+			'{"AnyRouter.top": {"rate": 0.5, "burst": 2}, "a.com": {"rate": 0}, "b.com": {"burst": 1}, "c.com": 1}'
+		)
+		assert limits == {'anyrouter.top': RateLimit(rate=0.5, burst=2)}
+
+		assert HostRateLimiter.parse_limits('not json') == {}
+		assert HostRateLimiter.parse_limits('[]') == {}
+
+	def test_split(self):
+		"""测试按份数平分限流配置：速率相除，突发容量至少为 1"""
+		limiter = HostRateLimiter({'a.com': RateLimit(rate=1.0, burst=6), 'b.com': RateLimit(rate=1.0, burst=1)})
+		assert limiter.split(1) is limiter
+
+		shared = limiter.split(3)
+		assert shared.limits['a.com'] == RateLimit(rate=pytest.approx(1 / 3), burst=2)
+		assert shared.limits['b.com'].burst == 1
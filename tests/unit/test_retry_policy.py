@@ -0,0 +1,157 @@
+import httpx
+import pytest
+
+from core.checkin_service import CheckinService
+from tests.fixtures.mock_dependencies import MockHttpClient
+from tools.retry import RetryableError, RetryBudget, RetryPolicy, RetryReason, retry_scope
+
+
+class TestRetryPolicy:
+	"""测试 RetryPolicy 类"""
+
+	@pytest.mark.asyncio
+	async def test_retry_until_success(self):
+		"""测试可重试的失败（超时、5xx、WAF 拦截）会重试，并计入当前统计范围"""
+		outcomes = [
+			httpx.ConnectTimeout('timeout'),
+			MockHttpClient.build_response(status=502),
+			RetryableError(RetryReason.WAF_BLOCKED, '缺少 WAF cookies'),
+			MockHttpClient.build_response(status=200),
+		]
+
+		async def func():
+			outcome = outcomes.pop(0)
+			if isinstance(outcome, Exception):
+				raise outcome
+			return outcome
+
+		policy = RetryPolicy(max_attempts=4)
+		with retry_scope() as scope:
+			response = await policy.call(func, operation='测试请求')
+
+		assert response.status_code == 200
+		assert scope.count == 3
+
+	@pytest.mark.asyncio
+	async def test_non_retryable_and_exhausted(self):
+		"""测试不可重试的失败直接返回，重试次数用尽后返回最后一次结果"""
+		calls = {'count': 0}
+
+		async def unauthorized():
+			calls['count'] += 1
+			return MockHttpClient.build_response(status=401)
+
+		async def refused():
+			calls['count'] += 1
+			raise httpx.ConnectError('refused')
+
+		async def buggy():
+			calls['count'] += 1
+			raise ValueError('bug')
+
+		policy = RetryPolicy(max_attempts=3)
+
+		response = await policy.call(unauthorized, operation='测试请求')
+		assert response.status_code == 401
+		assert calls['count'] == 1, '4xx 不应该重试'
+
+		calls['count'] = 0
+		with pytest.raises(httpx.ConnectError):
+			await policy.call(refused, operation='测试请求')
+		assert calls['count'] == 3
+
+		calls['count'] = 0
+		with pytest.raises(ValueError):
+			await policy.call(buggy, operation='测试请求')
+		assert calls['count'] == 1, '程序错误不应该重试'
+
+	@pytest.mark.asyncio
+	@pytest.mark.parametrize(
+		'outcome,retried',
+		[
+			(httpx.ConnectError('refused'), True),
+			(httpx.ConnectTimeout('timeout'), True),
+			(httpx.PoolTimeout('pool'), True),
+			(MockHttpClient.build_response(status=429), True),
+			(httpx.ReadTimeout('timeout'), False),
+			(httpx.RemoteProtocolError('disconnected'), False),
+			(MockHttpClient.build_response(status=502), False),
+		],
+	)
+	async def test_non_idempotent_retries_only_unsent(self, outcome, retried: bool):
+		"""测试非幂等请求只在确定没有被服务端处理时重试"""
+		calls = {'count': 0}
+
+		async def func():
+			calls['count'] += 1
+			if isinstance(outcome, Exception):
+				raise outcome
+			return outcome
+
+		try:
+			await RetryPolicy(max_attempts=2).call(func, operation='测试请求', idempotent=False)
+		except httpx.HTTPError:
+			pass
+
+		assert calls['count'] == (2 if retried else 1)
+
+	@pytest.mark.asyncio
+	async def test_run_wide_budget(self):
+		"""测试重试预算在多个请求之间共享，用尽后不再重试"""
+		calls = {'count': 0}
+
+		async def server_error():
+			calls['count'] += 1
+			return MockHttpClient.build_response(status=503)
+
+		budget = RetryBudget(max_retries=3)
+		policy = RetryPolicy(max_attempts=3, budget=budget)
+
+		await policy.call(server_error, operation='请求 1')
+		await policy.call(server_error, operation='请求 2')
+		await policy.call(server_error, operation='请求 3')
+
+		# 3 次首次请求 + 共 3 次重试
+		assert calls['count'] == 6
+		assert budget.remaining == 0
+
+	def test_notification_budget_is_separate(self):
+		"""测试通知推送使用独立的重试预算，不占用签到请求的重试次数"""
+		service = CheckinService()
+		checkin_budget = service.retry_policy.budget
+		notification_budget = service.notification_retry_policy.budget
+		assert checkin_budget is not None and notification_budget is not None
+
+		while notification_budget.try_acquire():
+			pass
+
+		assert checkin_budget.remaining == checkin_budget.max_retries
+
+	@pytest.mark.parametrize(
+		'retry_after,expected',
+		[
+			('5', (RetryReason.RATE_LIMITED, 5.0)),
+			('Wed, 21 Oct 2015 07:28:00 GMT', (RetryReason.RATE_LIMITED, 0.0)),
+			('soon', (RetryReason.RATE_LIMITED, None)),
+			(None, (RetryReason.RATE_LIMITED, None)),
+		],
+	)
+	def test_rate_limited_retry_after(self, retry_after: str | None, expected: tuple):
+		"""测试 429 响应解析 Retry-After（秒数或 HTTP 日期）"""
+		response = MockHttpClient.build_response(status=429)
+		response.headers = {'Retry-After': retry_after} if retry_after is not None else {}
+
+		assert RetryPolicy.classify_result(response) == expected
+
+	def test_backoff_delay(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试指数退避上限与 Retry-After 下限"""
+		monkeypatch.setattr('tools.retry.retry_policy.random.uniform', lambda low, high: high)
+		policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+		assert policy._compute_delay(attempt=1, retry_after=None) == 1.0
+		assert policy._compute_delay(attempt=3, retry_after=None) == 4.0
+		assert policy._compute_delay(attempt=10, retry_after=None) == 5.0
+		assert policy._compute_delay(attempt=1, retry_after=3.0) == 3.0
+
+		# Retry-After 超过单次最长等待时间时放弃重试
+		assert policy._can_retry(attempt=1, retry_after=60.0) is False
@@ -0,0 +1,21 @@
+from core.models import AccountOutcome
+from core.run_journal import RunJournal
+
+
+class TestRunJournal:
+	"""测试 RunJournal 类"""
+
+	def test_load_filters_window_and_ignores_truncated_lines(self, tmp_path):
+		"""测试只加载同一自然日的记录，写入一半的行被忽略"""
+		journal = RunJournal(tmp_path / 'run_journal.jsonl')
+		journal.append('2026-10-18', 'key_a', AccountOutcome(index=0, status='success'))
+		journal.append('2026-10-19', 'key_b', AccountOutcome(index=1, status='success', retry_count=2))
+		with open(journal.journal_file, 'a', encoding='utf-8') as f:
+			f.write('{"version":1,"window":"2026-10-19","account_key":"key_c","outc')
+
+		outcomes = journal.load('2026-10-19')
+		assert list(outcomes) == ['key_b']
+		assert outcomes['key_b'] == AccountOutcome(index=1, status='success', retry_count=2)
+
+		journal.clear()
+		assert journal.load('2026-10-19') == {}
@@ -0,0 +1,50 @@
+import asyncio
+import sys
+
+import pytest
+
+from tools.profiling import ProfileMode, RunProfiler
+
+
+class TestRunProfiler:
+	"""测试 RunProfiler 类"""
+
+	@pytest.mark.parametrize('value', ['', 'false', 'unknown'])
+	def test_disabled(self, monkeypatch: pytest.MonkeyPatch, value: str):
+		"""测试未开启时不创建性能分析"""
+		monkeypatch.setenv(RunProfiler.ENV_PROFILE, value)
+		assert RunProfiler.from_env() is None
+
+	def test_parse_modes(self, monkeypatch: pytest.MonkeyPatch, tmp_path):
+		"""测试解析分析方式与输出目录"""
+		monkeypatch.setenv(RunProfiler.ENV_PROFILE, 'cprofile, tracemalloc')
+		monkeypatch.setenv(RunProfiler.ENV_PROFILE_DIR, str(tmp_path))
+		profiler = RunProfiler.from_env()
+
+		assert profiler is not None
+		assert profiler.modes == {ProfileMode.CPROFILE, ProfileMode.TRACEMALLOC}
+		assert profiler.output_dir == tmp_path
+
+		monkeypatch.setenv(RunProfiler.ENV_PROFILE, 'all')
+		assert RunProfiler.from_env().modes == set(ProfileMode)
+
+	def test_writes_reports_on_exit(self, tmp_path):
+		"""测试以 sys.exit 结束时同样写入所有分析结果"""
+
+		async def work():
+			await asyncio.sleep(0)
+			sys.exit(1)
+
+		profiler = RunProfiler(modes=set(ProfileMode), output_dir=tmp_path)
+		with pytest.raises(SystemExit):
+			with profiler:
+				profiler.run(work())
+
+		for name in (
+			'profile.pstats',
+			'profile.txt',
+			'tracemalloc_top.txt',
+			'tracemalloc_diff.txt',
+			'asyncio_debug.log',
+		):
+			assert (tmp_path / name).exists(), name
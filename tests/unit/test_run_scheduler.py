@@ -0,0 +1,59 @@
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from core.checkin_ledger import CheckinLedger
+from core.run_scheduler import RunScheduler
+
+
+class TestRunScheduler:
+	"""测试 RunScheduler 类"""
+
+	@pytest.fixture
+	def ledger(self, tmp_path: Path) -> CheckinLedger:
+		"""空的签到台账"""
+		return CheckinLedger(
+			ledger_file=tmp_path / 'checkin_ledger.json',
+			reset_timezone=ZoneInfo('Asia/Shanghai'),
+		)
+
+	def test_order_by_history(self, ledger: CheckinLedger, monkeypatch: pytest.MonkeyPatch):
+		"""测试账号排序：从未成功 > 最久未成功 > 最近成功 > 长期连续失败"""
+		monkeypatch.setattr('core.checkin_ledger.time.time', lambda: 100.0)
+		ledger.record_success('recent')
+		monkeypatch.setattr('core.checkin_ledger.time.time', lambda: 50.0)
+		ledger.record_success('old')
+		for _ in range(RunScheduler.CHRONIC_FAILURE_THRESHOLD):
+			ledger.record_failure('chronic')
+
+		scheduler = RunScheduler(deadline=None, ledger=ledger)
+		account_keys = ['chronic', 'recent', 'new', 'old']
+		order = scheduler.order(account_keys)
+
+		assert [account_keys[i] for i in order] == ['new', 'old', 'recent', 'chronic']
+
+	def test_order_without_ledger(self):
+		"""测试没有签到台账时保持原有顺序"""
+		assert RunScheduler(deadline=300).order(['c', 'a', 'b']) == [0, 1, 2]
+
+	def test_budget_split(self, ledger: CheckinLedger, monkeypatch: pytest.MonkeyPatch):
+		"""测试时间预算分配（平均分配、最小预算、预算耗尽）"""
+		now = {'value': 0.0}
+		monkeypatch.setattr('core.run_scheduler.time.monotonic', lambda: now['value'])
+
+		# 未配置时间预算时不限制
+		assert RunScheduler(deadline=None, ledger=ledger).next_budget(pending_count=3) is None
+
+		scheduler = RunScheduler(deadline=300, ledger=ledger)
+		scheduler.start()
+
+		# 剩余时间平均分配
+		assert scheduler.next_budget(pending_count=3) == pytest.approx(100)
+
+		# 平均值低于最小预算时，至少分配最小预算
+		assert scheduler.next_budget(pending_count=100) == pytest.approx(RunScheduler.MIN_ACCOUNT_BUDGET)
+
+		# 剩余时间不足最小预算时，不再开始新的账号
+		now['value'] = 300 - RunScheduler.MIN_ACCOUNT_BUDGET + 1
+		assert scheduler.next_budget(pending_count=1) == 0
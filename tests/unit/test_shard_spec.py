@@ -0,0 +1,25 @@
+import pytest
+
+from core.models import ShardSpec
+
+
+class TestShardSpec:
+	"""测试 ShardSpec 类"""
+
+	@pytest.mark.parametrize('value', ['2', '0/4', '5/4', 'a/b', '1/0'])
+	def test_parse_invalid(self, value: str):
+		"""测试无效的分片配置"""
+		with pytest.raises(ValueError):
+			ShardSpec.parse(value)
+
+	def test_partition(self):
+		"""测试每个账号恰好属于一个分片，且划分结果稳定"""
+		assert ShardSpec.parse(' 2/8 ') == ShardSpec(index=2, count=8)
+
+		shards = [ShardSpec(index=index, count=4) for index in range(1, 5)]
+		api_users = [f'user_{i}' for i in range(200)]
+		owners = [[shard.index for shard in shards if shard.owns(api_user)] for api_user in api_users]
+
+		assert all(len(owner) == 1 for owner in owners)
+		assert len({owner[0] for owner in owners}) == 4, '账号应分散到所有分片'
+		assert owners == [[shard.index for shard in shards if shard.owns(api_user)] for api_user in api_users]
@@ -1,6 +1,7 @@
 import pytest
 
-from notif import NotifyTrigger, NotifyTriggerManager
+from notif import NotifyRule, NotifyTrigger, NotifyTriggerManager
+from tests.tools.data_builders import build_account_result
 
 
 class TestNotifyTriggerManager:
@@ -106,3 +107,51 @@ class TestNotifyTriggerManager:
 
 		assert '账号成功' in reasons
 		assert '账号失败' in reasons
+
+	@pytest.mark.parametrize(
+		'rule,result,consecutive_failures,expected',
+		[
+			('failed and consecutive_failures >= 3', build_account_result(status='failed'), 3, True),
+			('failed and consecutive_failures >= 3', build_account_result(status='failed'), 2, False),
+			('quota < 10', build_account_result(quota=5.0), 0, True),
+			('quota < 10', build_account_result(quota=25.0), 0, False),
+			# 没有余额时数值比较不匹配
+			('quota < 10', build_account_result(status='failed'), 0, False),
+			('name ~ "prod-*" and balance_changed', build_account_result(name='prod-1', balance_changed=True), 0, True),
+			('name ~ "prod-*" and balance_changed', build_account_result(name='dev-1', balance_changed=True), 0, False),
+			('status != success AND not skipped', build_account_result(status='failed'), 0, True),
+			('retry_count > 0', build_account_result(), 0, False),
+		],
+	)
+	def test_rule_matching(self, rule: str, result, consecutive_failures: int, expected: bool) -> None:
+		"""测试通知规则的编译与匹配"""
+		assert NotifyRule.compile(1, rule).matches(result, consecutive_failures) is expected
+
+	@pytest.mark.parametrize('rule', ['quota', 'quota < many', 'balance ~ 1', 'name > a', 'failed and', 'quota <'])
+	def test_invalid_rule(self, rule: str) -> None:
+		"""测试无效的通知规则"""
+		with pytest.raises(ValueError, match='规则 #1'):
+			NotifyRule.compile(1, rule)
+
+	def test_rules_notify_in_single_pass(self, monkeypatch: pytest.MonkeyPatch) -> None:
+		"""测试只配置通知规则时只按规则发送通知，规则在逐个账号处理时评估"""
+		monkeypatch.delenv('NOTIFY_TRIGGERS', raising=False)
+		monkeypatch.setenv('NOTIFY_RULES', 'failed and consecutive_failures >= 3; invalid rule; quota < 10')
+		manager = NotifyTriggerManager()
+
+		assert [rule.number for rule in manager.rules] == [1, 3]
+		assert manager.triggers == set()
+		assert manager.needs_failure_history
+
+		matcher = manager.create_rule_matcher()
+		matcher.observe(build_account_result(status='failed'), consecutive_failures=1)
+		flags = {'has_success': True, 'has_failed': True, 'has_balance_changed': True, 'is_first_run': True}
+		assert manager.should_notify(**flags, rule_matcher=matcher) is False
+
+		matcher.observe(build_account_result(quota=5.0))
+		matcher.observe(build_account_result(status='failed'), consecutive_failures=4)
+		assert manager.should_notify(**flags, rule_matcher=matcher) is True
+		assert manager.get_notify_reasons(**flags, rule_matcher=matcher) == [
+			'通知规则 #1（1 个账号）',
+			'通知规则 #3（1 个账号）',
+		]
@@ -0,0 +1,121 @@
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.account_executor import AccountExecutor, create_account_executor
+from core.models import AccountConfig, AccountJob, AccountOutcome
+from core.worker_pool import WorkerPool
+from tools.logger import logger
+
+
+class FakeExecutor(AccountExecutor):
+	"""不访问站点的账号执行器，api_user 为 crash 时模拟工作进程崩溃"""
+
+	def __init__(self, worker_count: int):
+		self.worker_count = worker_count
+
+	async def execute(self, job: AccountJob, budget: float | None) -> AccountOutcome:
+		if job.account.api_user == 'crash':
+			os._exit(1)
+		return AccountOutcome(
+			index=job.index,
+			status='success',
+			user_info={'success': True, 'quota': job.index, 'used_quota': os.getpid(), 'workers': self.worker_count},
+		)
+
+
+def create_fake_executor(worker_count: int) -> AccountExecutor:
+	"""工作进程中创建 FakeExecutor（需要是模块级函数才能传给子进程）"""
+	return FakeExecutor(worker_count)
+
+
+def build_jobs(count: int, crash_index: int | None = None) -> list[AccountJob]:
+	"""构建账号任务"""
+	return [
+		AccountJob(
+			index=i,
+			account=AccountConfig(
+				api_user='crash' if i == crash_index else f'user_{i}',
+				cookies='',
+				full_name=f'账号 {i + 1}',
+				safe_name=f'账号 {i + 1}',
+			),
+		)
+		for i in range(count)
+	]
+
+
+class TestWorkerPool:
+	"""测试 WorkerPool 类"""
+
+	def test_split_round_robin(self):
+		"""测试按处理顺序轮流分配，且不产生空任务列表"""
+		pool = WorkerPool(3)
+		batches = pool.split(build_jobs(7))
+		assert [[job.index for job in batch] for batch in batches] == [[0, 3, 6], [1, 4], [2, 5]]
+		assert len(pool.split(build_jobs(2))) == 2
+
+	@pytest.mark.asyncio
+	async def test_run_collects_all_outcomes(self):
+		"""测试所有账号的结果都从工作进程传回，且确实在多个进程中执行"""
+		pool = WorkerPool(2, executor_factory=create_fake_executor)
+		outcomes = [outcome async for outcome in pool.run(build_jobs(5), deadline=None)]
+
+		assert sorted(outcome.index for outcome in outcomes) == [0, 1, 2, 3, 4]
+		assert all(outcome.status == 'success' for outcome in outcomes)
+		pids = {outcome.user_info['used_quota'] for outcome in outcomes}
+		assert len(pids) == 2 and os.getpid() not in pids
+		assert all(outcome.user_info['workers'] == 2 for outcome in outcomes), '工作进程应该知道进程数量'
+
+	@pytest.mark.asyncio
+	async def test_crashed_worker_marks_remaining_failed(self):
+		"""测试工作进程崩溃时，未返回结果的账号按失败处理"""
+		pool = WorkerPool(2, executor_factory=create_fake_executor)
+		outcomes = {outcome.index: outcome async for outcome in pool.run(build_jobs(6, crash_index=2), deadline=None)}
+
+		assert sorted(outcomes) == [0, 1, 2, 3, 4, 5]
+		assert outcomes[0].status == 'success', '崩溃前已返回的结果应保留'
+		assert outcomes[2].status == 'failed' and outcomes[4].status == 'failed'
+		assert outcomes[2].record_ledger is False
+		assert all(outcomes[i].status == 'success' for i in (1, 3, 5)), '其他工作进程不受影响'
+
+
+class TestAccountExecutor:
+	"""测试 AccountExecutor 类"""
+
+	@pytest.mark.asyncio
+	async def test_timeout_without_budget(self):
+		"""测试未设置时间预算时，签到过程中的超时转换为失败结果而不是抛出异常"""
+		checkin_service = MagicMock()
+		checkin_service.check_in_account = AsyncMock(side_effect=TimeoutError())
+		executor = AccountExecutor(checkin_service)
+
+		outcome = await executor.execute(build_jobs(1)[0], None)
+
+		assert outcome.status == 'failed'
+		assert outcome.error == '处理超时'
+
+	def test_worker_share_of_limits(self, monkeypatch: pytest.MonkeyPatch):
+		"""测试多进程时每个工作进程的限流速率与重试预算按进程数量平分"""
+		monkeypatch.delenv('CHECKIN_RATE_LIMITS', raising=False)
+		monkeypatch.setenv('CHECKIN_RETRY_BUDGET', '10')
+
+		service = create_account_executor(4).checkin_service
+
+		assert service.retry_policy.budget is not None
+		assert service.retry_policy.budget.max_retries == 3, '重试预算向上取整'
+		limit = service.rate_limiter.limits['anyrouter.top']
+		assert limit.rate == pytest.approx(0.25)
+		assert limit.burst == 1
+
+	def test_worker_budget_rounds_up(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+		"""测试工作进程多于重试预算时每个进程仍至少可以重试 1 次，并输出平分后的预算"""
+		monkeypatch.setenv('CHECKIN_RETRY_BUDGET', '3')
+
+		service = create_account_executor(8).checkin_service
+		logger.flush()
+
+		assert service.retry_policy.budget is not None
+		assert service.retry_policy.budget.max_retries == 1
+		assert '每个进程最多重试 1 次' in capsys.readouterr().out